@@ -4,7 +4,13 @@ import threading
 import dearpygui.dearpygui as dpg
 
 from modules.core.app_context import AppContext
+from modules.core.scheduler import FixedRateScheduler
+from modules.core.ui_mailbox import UIMailbox
+from modules.helpers.pit_strategist import PitStrategist
+from modules.irace_sdk.irsdk_formatter import Formatter
+from modules.irace_sdk.irsdk_replay import ReplayIRSDK
 from modules.irace_sdk.irsdk_service import IRSDKService
+from modules.ui.debug.debug_panel import DebugPanel
 from modules.ui.ui_main import UIMain
 from modules.ui.ui_theme import create_theme
 
@@ -22,11 +28,19 @@ class App:
     sdk_polling_running = False
     sdk_polling_thread = None
     sdk_polling_interval = None
+    sdk_scheduler = None
+    sdk_sync_to_sim = False
+
+    # How often the polling loop logs its achieved rate (seconds)
+    SDK_STATS_INTERVAL = 30
+
+    # Last Debug tab refresh (render thread)
+    debug_refreshed = 0.0
 
     # -------------------------------------------------------
     # APP INIT - called once by static main method
     # -------------------------------------------------------
-    def __init__(self, root_path, width: int = 1200, height: int = 840):
+    def __init__(self, root_path, width: int = 1200, height: int = 840, replay=None, replay_speed: float = 1.0):
 
         # Create or load global application context
         # This also loads ui_styles and creates a font_manager
@@ -54,13 +68,24 @@ class App:
         # Apply theme (fonts, colours, styles)
         create_theme()
 
-        # Create the IRSDK Service helper
-        self.ir = IRSDKService(self.ctx)
+        # Create the IRSDK Service helper; a replay capture stands in for the sim when given
+        replay_ir = ReplayIRSDK(replay, speed=replay_speed) if replay else None
+        self.ir = IRSDKService(self.ctx, ir=replay_ir)
+        if replay:
+            self.ctx.logger.info(f"Replaying capture {replay} at speed {replay_speed or 'max'}.")
         self.sdk_polling_interval = 1/int(self.ctx.get("polling_rate", 60))    # seconds
+        self.sdk_scheduler = FixedRateScheduler(int(self.ctx.get("polling_rate", 60)))
+        self.sdk_sync_to_sim = bool(self.ctx.get("sync_to_sim", False))
 
         # Placeholder for main UI instance
         self.ui = None
 
+        # Poller → render loop handoff; only the render thread touches dpg widgets
+        self.ui_mailbox = UIMailbox()
+
+        # Hot-path spans shown on the Debug tab
+        self.profiler = self.ctx.profiler
+
         self.ctx.logger.info(f"Application initialization completed. Polling Interval set at: {self.sdk_polling_interval:.3f} secs")
 
     # -------------------------------------------------------
@@ -69,7 +94,20 @@ class App:
     def build_ui(self):
         """Build all UI components and panels."""
         self.ui = UIMain(self.ctx)
+
+        # Playing back a capture: let the dashboard open any lap / pit event of it
+        if isinstance(self.ir.ir, ReplayIRSDK):
+            self.ui.dashboard.set_replay(self.ir.ir)
+
         self.ui.build()
+
+        # Background strategy work (simulations) reports back through the mailbox
+        self.ui.crewchief_panel.set_publisher(lambda payload: self.ui_mailbox.publish("crewchief", payload, merge=True))
+        # Recalculated Crew Chief strategies configure the live rest-of-race re-planner
+        self.ui.crewchief_panel.set_replanner(self.ir.replanner)
+
+        # Panels declare which telemetry they need; hidden panels cost no decode time
+        self.ui.register_telemetry(self.ir.subscriptions)
         self.ctx.logger.info("UI build completed.")
 
     # -------------------------------------------------------
@@ -99,25 +137,78 @@ class App:
         viewport_height = dpg.get_viewport_client_height()
         self.ctx.logger.debug(f"Viewport width: {viewport_width}, height: {viewport_height}")
 
-        # Enter the DPG event loop
-        dpg.start_dearpygui()
+        # Enter the DPG event loop, applying the latest SDK payloads before each frame
         self.ctx.logger.debug(f"Application has started.")
+        profiler = self.profiler
+        while dpg.is_dearpygui_running():
+            self.apply_ui_updates()
+            self.update_debug_panel()
+
+            span = profiler.start()
+            dpg.render_dearpygui_frame()
+            profiler.stop("ui.frame", span)
 
         # After loop exits (window closed)
         self.shutdown()
 
     # -------------------------------------------------------
-    # SDK POLLING LOOP - UI updates from the SDK are triggered here
+    # RENDER THREAD - apply the newest payload per panel once per frame
+    # -------------------------------------------------------
+    def apply_ui_updates(self):
+        """Drain the UI mailbox and apply the latest payload of each panel (render thread only)."""
+        profiler = self.profiler
+        for panel, payload in self.ui_mailbox.drain().items():
+            span = profiler.start()
+            try:
+                match panel:
+                    case "timing":
+                        timing_panel = self.ui.panels.get("timing")
+                        if timing_panel and timing_panel.requires_update:
+                            timing_panel.update(payload)
+                    case "dashboard":
+                        self.ui.dashboard.update(payload)
+                    case "info":
+                        self.ui.info_panel.update(payload)
+                    case "crewchief":
+                        self.ui.crewchief_panel.update(payload)
+            except Exception as error:
+                self.ctx.logger.error(f"Error applying {panel} UI update: {error}")
+            profiler.stop(f"ui.{panel}", span)
+
+    def update_debug_panel(self):
+        """Refresh the Debug tab with the profiler, scheduler and cache stats (render thread, while visible)."""
+        debug_panel = self.ui.panels.get("debug")
+        if not (debug_panel and debug_panel.requires_update):
+            return
+
+        now = time.perf_counter()
+        if now - self.debug_refreshed < DebugPanel.REFRESH_INTERVAL:
+            return
+        self.debug_refreshed = now
+
+        debug_panel.update({
+            "stages": self.profiler.summary(),
+            "scheduler": self.sdk_scheduler.stats(),
+            "caches": {**Formatter.cache_stats(), "plans": PitStrategist.plan_cache.stats()},
+        })
+
+    # -------------------------------------------------------
+    # SDK POLLING LOOP - UI updates from the SDK are published here
     # -------------------------------------------------------
     def sdk_polling_loop(self):
         """Background thread for polling the iRacing SDK."""
 
         self.ctx.logger.info(f"iRSDK Polling thread started at {self.sdk_polling_interval:.3f} secs")
+        last_stats_log = time.perf_counter()
+        profiler = self.profiler
 
         while self.sdk_polling_running:
+            poll_span = profiler.start()
             try:
                 # Get available incremental updates
+                span = profiler.start()
                 available_updates = self.ir.get_update()
+                profiler.stop("poll.get_update", span)
 
                 # 1. Timing update goes separately since it's visible-only
                 if available_updates.get("timing"):
@@ -135,20 +226,47 @@ class App:
                 if available_updates.get("pitstop"):
                     dashboard_payload["pit_data"] = getattr(self.ir, "pit_data", None)
 
-                # 3. Only push if something changed
+                if available_updates.get("strategy"):
+                    dashboard_payload["strategy_data"] = getattr(self.ir, "strategy_data", None)
+
+                # 3. Only push if something changed; merged so no pending delta is lost
                 if dashboard_payload:
-                    self.ui.dashboard.update(dashboard_payload)
+                    self.ui_mailbox.publish("dashboard", dashboard_payload, merge=True)
+
+                # 4. Live fuel estimate for the Crew Chief (only when it drifted)
+                if available_updates.get("fuel"):
+                    self.ui_mailbox.publish("crewchief", {"fuel_data": getattr(self.ir, "fuel_data", None)}, merge=True)
 
-                # 4. Track Updates
+                # 5. Track Updates
                 if available_updates['weekend']:
                     weekend_data = getattr(self.ir, "weekend_data", None)
-                    self.ui.info_panel.update(weekend_data)
+                    self.ui_mailbox.publish("info", weekend_data)
 
             except Exception as error:
                 self.ctx.logger.error(f"Error in iRSDK Polling Loop: {error}")
-
-            # 3. Wait for the next poll interval
-            time.sleep(self.sdk_polling_interval)
+            profiler.stop("poll", poll_span)
+
+            # 6. Wait for the next frame.
+            # When synced to the sim, freeze_var_buffer_latest() already blocks on iRacing's data-valid
+            # event, so every poll sees exactly one new frame; otherwise sleep to the next absolute deadline.
+            if self.sdk_sync_to_sim and self.ir.can_sync_to_sim():
+                self.sdk_scheduler.mark()
+            else:
+                self.sdk_scheduler.wait()
+
+            if time.perf_counter() - last_stats_log >= self.SDK_STATS_INTERVAL:
+                last_stats_log = time.perf_counter()
+                stats = self.sdk_scheduler.stats()
+                self.ctx.logger.debug(
+                    f"iRSDK Polling: {stats['achieved_hz']:.1f}/{stats['target_hz']:.0f} Hz; "
+                    f"late: {stats['late']}; dropped: {stats['dropped']}; "
+                    f"max overrun: {stats['max_overrun_ms']:.1f} ms"
+                )
+                for name, cache in Formatter.cache_stats().items():
+                    self.ctx.logger.debug(
+                        f"Format cache {name}: {cache['size']}/{cache['maxsize']}; "
+                        f"hit rate: {cache['hit_rate']:.1%} ({cache['hits']} hits, {cache['misses']} misses)"
+                    )
 
         self.ctx.logger.info(f"iRSDK Polling thread ended...")
 
@@ -166,7 +284,7 @@ class App:
                 "PlayerCarIdx": self.ir.get_player_car_idx(),
 
             }
-            timing_panel.update(combined_data)
+            self.ui_mailbox.publish("timing", combined_data)
 
 
     # -------------------------------------------------------
@@ -175,6 +293,15 @@ class App:
     def shutdown(self):
         """Clean shutdown of DearPyGUI and logging."""
         self.ctx.logger.info("Shutting down application...")
+        self.sdk_polling_running = False
+        if self.sdk_polling_thread:
+            self.sdk_polling_thread.join(timeout=1.0)
+
+        # Let the recorder write out the end of the capture
+        self.ir.recorder.stop(wait=True)
+        self.ui.crewchief_panel.shutdown()
+        self.ir.replanner.shutdown()
+
         dpg.destroy_context()
         self.ctx.logger.debug("DPG context destroyed.")
         self.ctx.logger.info("Application terminated cleanly.")
@@ -183,9 +310,9 @@ class App:
     # Convenience entry point.
     # -------------------------------------------------------
     @staticmethod
-    def main(root_path):
+    def main(root_path, replay=None, replay_speed: float = 1.0):
         """Convenience entry point."""
-        app = App(root_path)
+        app = App(root_path, replay=replay, replay_speed=replay_speed)
         app.build_ui()
         app.run()
 
@@ -194,9 +321,19 @@ class App:
 # Standard entry point
 # -------------------------------------------
 if __name__ == "__main__":
+    import argparse
+    import multiprocessing
     import os
     import sys
 
+    # Strategy simulations use a process pool, which re-launches the frozen executable
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(description="iRaceInsight")
+    parser.add_argument("--replay", help="play back a recorded .ircap capture instead of the live sim")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed: 1 = real time, N = Nx, 0 = max")
+    args = parser.parse_args()
+
     # Set some paths depending on whether we are running as a python package or script
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         icon_path = os.path.join(sys._MEIPASS, "iRaceInsight.ico")
@@ -205,4 +342,4 @@ if __name__ == "__main__":
         icon_path = os.path.join("iRaceInsight.ico")
         system_path = "."
 
-    App.main(system_path)
+    App.main(system_path, replay=args.replay, replay_speed=args.speed)
@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 import sys
 
+from modules.core.profiler import Profiler
 from modules.core.ui_style import UIStyle
 from modules.core.ui_fonts import FontManager
 
@@ -116,6 +117,10 @@ class AppContext:
         self.font_manager = FontManager(self.root_path, self.logger)
         self.logger.info("Font Manager created.")
 
+        # Hot-path spans for the Debug tab ("profiling" setting)
+        self.profiler = Profiler()
+        self.profiler.enable(bool(self.get("profiling", False)))
+
         AppContext._instance = self
 
     # ============================================================
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+import threading
+
+
+class LRUCache:
+    """
+    Small thread-safe bounded LRU cache with hit/miss counters.
+
+    Used for memoising hot formatting paths (e.g. lap time strings) that are hit
+    from both the SDK polling thread and the render thread. The counters are
+    exposed through stats() so the size can be tuned from the "cache_size" setting.
+    """
+
+    def __init__(self, maxsize: int = 5000):
+        self.maxsize = max(1, int(maxsize))
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing and storing compute(key) on a miss."""
+        value = self.get(key, self)
+        if value is self:
+            value = compute(key)
+            self.put(key, value)
+        return value
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = max(1, int(maxsize))
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,122 @@
+from array import array
+from datetime import datetime
+import json
+from pathlib import Path
+import time
+
+
+class StageRing:
+    """Fixed-size ring buffer of the latest span durations (ns) of one stage, and when each ended."""
+
+    def __init__(self, size: int):
+        self.samples = array("q", bytes(8 * size))
+        self.ended = array("q", bytes(8 * size))
+        self.size = size
+        self.index = 0
+        self.total = 0      # spans ever recorded
+
+    def add(self, duration_ns: int, ended_ns: int):
+        self.samples[self.index] = duration_ns
+        self.ended[self.index] = ended_ns
+        self.index = (self.index + 1) % self.size
+        self.total += 1
+
+    def values(self) -> list:
+        """The buffered durations, oldest first."""
+        if self.total < self.size:
+            return self.samples[:self.index].tolist()
+        return self.samples[self.index:].tolist() + self.samples[:self.index].tolist()
+
+    def rate(self) -> float:
+        """Spans per second over the buffered spans (first to last end)."""
+        count = min(self.total, self.size)
+        if count < 2:
+            return 0.0
+        oldest = self.ended[self.index if self.total >= self.size else 0]
+        newest = self.ended[self.index - 1]
+        return (count - 1) * 1e9 / (newest - oldest) if newest > oldest else 0.0
+
+
+class Profiler:
+    """
+    Lightweight hot-path spans for the polling and render loops.
+
+        start = profiler.start()
+        ...
+        profiler.stop("decode", start)
+
+    start() returns 0 while profiling is disabled and stop() then returns straight
+    away, so the disabled cost is two trivial calls per span. When enabled each span
+    costs two perf_counter_ns() reads and one ring buffer write; nothing is allocated
+    per sample. summary() gives rolling percentiles and rates over the last `size` spans per stage.
+    """
+
+    SIZE = 600          # spans kept per stage (10s at 60Hz)
+
+    enabled = False
+
+    def __init__(self, size: int = SIZE):
+        self.size = size
+        self.rings = {}
+
+    def enable(self, enabled: bool = True):
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+
+    def reset(self):
+        self.rings = {}
+
+    # -------------------------------------------------------
+    # Recording (any thread; one writer per stage)
+    # -------------------------------------------------------
+    def start(self) -> int:
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def stop(self, stage: str, start: int):
+        if not start:
+            return
+        now = time.perf_counter_ns()
+        self.record(stage, now - start, now)
+
+    def record(self, stage: str, duration_ns: int, ended_ns: int | None = None):
+        ring = self.rings.get(stage)
+        if ring is None:
+            ring = self.rings[stage] = StageRing(self.size)
+        ring.add(duration_ns, ended_ns if ended_ns is not None else time.perf_counter_ns())
+
+    # -------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------
+    def summary(self) -> dict:
+        """{stage: {"samples", "mean_ms", "p50_ms", "p99_ms", "max_ms", "rate_hz"}} over the buffered spans."""
+        summary = {}
+        for stage, ring in list(self.rings.items()):
+            values = sorted(ring.values())
+            if not values:
+                continue
+            count = len(values)
+            summary[stage] = {
+                "samples": ring.total,
+                "mean_ms": sum(values) / count / 1e6,
+                "p50_ms": values[count // 2] / 1e6,
+                "p99_ms": values[min(count - 1, int(count * 0.99))] / 1e6,
+                "max_ms": values[-1] / 1e6,
+                "rate_hz": ring.rate(),
+            }
+        return summary
+
+    def dump(self, folder, extra: dict | None = None) -> Path:
+        """Write the summary and the raw buffered spans (ns) to a timestamped JSON file for bug reports."""
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"profile_{datetime.now():%Y%m%d_%H%M%S}.json"
+
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "summary": self.summary(),
+            "samples_ns": {stage: ring.values() for stage, ring in list(self.rings.items())},
+            **(extra or {}),
+        }
+        path.write_text(json.dumps(report, indent=2))
+        return path
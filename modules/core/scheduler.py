@@ -0,0 +1,109 @@
+import time
+
+
+class FixedRateScheduler:
+    """
+    Drift-free fixed-rate loop pacing.
+
+    Sleeping for the interval *after* the work makes the real rate
+    1 / (interval + work time) and lets it jitter with load. Instead each frame
+    targets an absolute deadline (start + n * interval):
+        - work shorter than the interval sleeps only for what is left,
+        - a frame that finishes after its deadline is counted as late,
+        - a frame that overruns whole intervals drops those frames and snaps to
+          the next future deadline instead of bursting to catch up.
+
+    Usage:
+        scheduler = FixedRateScheduler(60)
+        while running:
+            do_work()
+            scheduler.wait()
+    """
+
+    # Window used to compute the achieved rate (seconds)
+    STATS_WINDOW = 1.0
+
+    def __init__(self, rate_hz: float, clock=time.perf_counter, sleep=time.sleep):
+        self.rate_hz = float(rate_hz)
+        self.interval = 1.0 / self.rate_hz
+        self.clock = clock
+        self.sleep = sleep
+
+        self.next_deadline = None
+
+        # Counters
+        self.frames = 0
+        self.late = 0
+        self.dropped = 0
+        self.last_overrun = 0.0
+        self.max_overrun = 0.0
+        self.achieved_hz = 0.0
+
+        self._window_start = None
+        self._window_frames = 0
+
+    def reset(self):
+        """Restart the deadline sequence and clear the counters."""
+        self.__init__(self.rate_hz, self.clock, self.sleep)
+
+    def wait(self):
+        """Sleep until the next absolute deadline, recording lateness and dropped frames."""
+        now = self.clock()
+
+        if self.next_deadline is None:
+            self.next_deadline = now + self.interval
+
+        overrun = now - self.next_deadline
+        if overrun > 0:
+            # Work finished after the deadline: the next frame is already due
+            self.late += 1
+            self.last_overrun = overrun
+            self.max_overrun = max(self.max_overrun, overrun)
+
+            # Skip the whole frames we overran rather than bursting to catch up
+            missed = int(overrun // self.interval)
+            if missed:
+                self.dropped += missed
+                self.next_deadline += missed * self.interval
+        else:
+            self.last_overrun = 0.0
+            self.sleep(-overrun)
+
+        self.next_deadline += self.interval
+        self._count_frame(self.clock())
+
+    def mark(self):
+        """
+        Record a frame that was paced externally (e.g. by the SDK's data-valid event)
+        and re-anchor the deadline sequence on it.
+        """
+        now = self.clock()
+        self.next_deadline = now + self.interval
+        self.last_overrun = 0.0
+        self._count_frame(now)
+
+    def _count_frame(self, now):
+        self.frames += 1
+        self._window_frames += 1
+
+        if self._window_start is None:
+            self._window_start = now
+            self._window_frames = 0
+            return
+
+        elapsed = now - self._window_start
+        if elapsed >= self.STATS_WINDOW:
+            self.achieved_hz = self._window_frames / elapsed
+            self._window_start = now
+            self._window_frames = 0
+
+    def stats(self) -> dict:
+        return {
+            "target_hz": self.rate_hz,
+            "achieved_hz": self.achieved_hz,
+            "frames": self.frames,
+            "late": self.late,
+            "dropped": self.dropped,
+            "last_overrun_ms": self.last_overrun * 1000,
+            "max_overrun_ms": self.max_overrun * 1000,
+        }
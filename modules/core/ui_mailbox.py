@@ -0,0 +1,42 @@
+import threading
+
+
+class UIMailbox:
+    """
+    Latest-value handoff between the SDK polling thread and the DearPyGui render loop.
+
+    The poller publishes a payload per panel; the render loop drains the mailbox once
+    per frame and applies only the newest payload of each panel. However fast the poller
+    runs, each panel is updated at most once per rendered frame and every dpg call
+    happens on the render thread.
+
+    Payloads must be treated as immutable once published: the poller builds fresh
+    dicts for each update instead of mutating ones it has already handed over.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+
+        # Payloads replaced before the render loop picked them up
+        self.superseded = 0
+
+    def publish(self, panel: str, payload, merge: bool = False):
+        """
+        Post the latest payload for a panel.
+        merge=True combines dict payloads key by key (for panels fed by partial deltas,
+        e.g. the dashboard), so a pending session update is not lost to a pit update.
+        """
+        with self._lock:
+            pending = self._pending.get(panel)
+            if pending is not None:
+                self.superseded += 1
+                if merge:
+                    payload = {**pending, **payload}
+            self._pending[panel] = payload
+
+    def drain(self) -> dict:
+        """Take every pending payload ({panel: payload}) in one swap."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
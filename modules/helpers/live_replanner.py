@@ -0,0 +1,167 @@
+from math import ceil
+import threading
+
+from modules.helpers.pit_strategist import PitStrategist
+from modules.helpers.strategy_worker import StrategyWorker
+from modules.irace_sdk.irsdk_constants import IrConstants
+
+
+class LiveReplanner:
+    """
+    Re-plans the rest of the race every time the player car completes a lap.
+
+    The polling thread only does O(1) work per tick: lap_crossed() compares the
+    player's CarIdxLap with the last tick, and on a crossing replan() snapshots the
+    laps remaining (SessionLapsRemainEx, or SessionTimeRemain / lap pace in a timed
+    race), FuelLevel and the live fuel per lap, and queues the solve. The solve
+    (PitStrategist._optimise_stint_plans from the current fuel level, so only the
+    remaining stints are searched) runs on a one-thread StrategyWorker; a solve
+    still running when the next lap completes is superseded. take_plan() hands the
+    finished plan back to the polling thread.
+
+    Pit lane loss, refuelling rate, tank capacity etc. come from the Crew Chief
+    (configure()), so nothing is planned before its strategy was calculated once.
+    """
+
+    TELEMETRY_VARS = ("PlayerCarIdx", "CarIdxLap", "FuelLevel", "SessionLapsRemainEx", "SessionTimeRemain")
+
+    EXTRA_STOPS = 2     # stop counts searched beyond the fewest possible (bounds the solve)
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.ps = PitStrategist(ctx)
+        self.worker = StrategyWorker(ctx, workers=1)
+        self.lock = threading.Lock()
+        self.setup = None
+        self.reset()
+
+    def configure(self, setup: dict):
+        """
+        Race setup from the Crew Chief: tank_capacity, fuel_per_lap, lap_time, pit_lane_loss,
+        refuelling_rate, tyre_change_litres, degradation and change_tyres.
+        fuel_per_lap and lap_time are only used until live values are known.
+        """
+        self.setup = dict(setup)
+
+    def reset(self):
+        """Forget the lap count and any plan (new session, replay seek)."""
+        self.lap = None
+        self.worker.cancel("replan")
+        with self.lock:
+            self.ready = None
+
+    # -------------------------------------------------------
+    # Polling thread
+    # -------------------------------------------------------
+    def lap_crossed(self, telemetry: dict) -> bool:
+        """True on the tick the player car starts a new lap."""
+        player = telemetry.get("PlayerCarIdx")
+        laps = telemetry.get("CarIdxLap")
+        if player is None or laps is None or not 0 <= player < len(laps):
+            return False
+
+        lap = laps[player]
+        crossed = self.lap is not None and lap == self.lap + 1
+        self.lap = lap
+        return crossed
+
+    def replan(self, telemetry: dict, fuel_per_lap: float | None = None, lap_time: float | None = None) -> bool:
+        """
+        Queue a re-plan from this tick's state; live fuel_per_lap / lap_time override the setup.
+        Returns False when there is nothing to plan (no setup yet, session over, no fuel reading).
+        """
+        setup = self.setup
+        if setup is None:
+            return False
+
+        fuel_per_lap = fuel_per_lap or setup["fuel_per_lap"]
+        lap_time = lap_time or setup["lap_time"]
+        fuel_level = telemetry.get("FuelLevel")
+        laps_remaining = self.laps_remaining(telemetry, lap_time)
+        if fuel_level is None or not laps_remaining or fuel_per_lap <= 0:
+            return False
+
+        inputs = dict(setup, fuel_per_lap=fuel_per_lap, lap_time=lap_time, fuel_level=fuel_level,
+                      laps_remaining=laps_remaining, lap=self.lap)
+
+        def job(cancelled):
+            return self.solve(inputs)
+
+        def on_result(plan, generation):
+            with self.lock:
+                self.ready = plan
+
+        self.worker.submit("replan", job, on_result)
+        return True
+
+    def take_plan(self) -> dict | None:
+        """The newest finished plan not handed out yet, or None."""
+        with self.lock:
+            plan, self.ready = self.ready, None
+        return plan
+
+    @staticmethod
+    def laps_remaining(telemetry: dict, lap_time: float) -> int | None:
+        laps = telemetry.get("SessionLapsRemainEx")
+        if laps is not None and 0 <= laps < IrConstants.LAPS_UNLIMITED:
+            return int(laps)
+
+        # Timed race: the laps that fit in the time left, plus the one the clock runs out on
+        time_remain = telemetry.get("SessionTimeRemain")
+        if time_remain is None or time_remain <= 0 or not lap_time:
+            return None
+        return ceil(time_remain / lap_time)
+
+    # -------------------------------------------------------
+    # Worker thread
+    # -------------------------------------------------------
+    def solve(self, inputs: dict) -> dict | None:
+        """
+        Fastest plan for the remaining laps, starting on the fuel in the car.
+        Bypasses PitStrategist.plan_cache: laps and fuel change every lap, so each solve
+        would be a miss that only evicts the Crew Chief's plans.
+        """
+        plans = self.ps._optimise_stint_plans(
+            total_laps=inputs["laps_remaining"],
+            tank_capacity=inputs["tank_capacity"],
+            fuel_per_lap=inputs["fuel_per_lap"],
+            lap_time=inputs["lap_time"],
+            pit_lane_loss=inputs["pit_lane_loss"],
+            refuelling_rate=inputs["refuelling_rate"],
+            tyre_change_litres=inputs["tyre_change_litres"],
+            degradation=inputs["degradation"],
+            stop_counts=1,
+            max_extra_stops=self.EXTRA_STOPS,
+            change_tyres=inputs["change_tyres"],
+            first_stint_fuel=inputs["fuel_level"],
+        )
+        if not plans:
+            return None
+
+        plan = plans[0]
+        stint_laps = plan["stint_laps"]
+        fuel_per_lap = inputs["fuel_per_lap"]
+
+        # Box at the end of the first stint's last lap (the lap just started counts as its first),
+        # adding the next stint less what is left in the tank
+        next_stop_lap = None
+        fuel_to_add = 0.0
+        if plan["stops"]:
+            next_stop_lap = inputs["lap"] + max(stint_laps[0] - 1, 0)
+            left = max(inputs["fuel_level"] - stint_laps[0] * fuel_per_lap, 0.0)
+            fuel_to_add = min(max(stint_laps[1] * fuel_per_lap - left, 0.0), inputs["tank_capacity"] - left)
+
+        return {
+            "lap": inputs["lap"],
+            "laps_remaining": inputs["laps_remaining"],
+            "fuel_level": round(inputs["fuel_level"], 3),
+            "fuel_per_lap": round(fuel_per_lap, 3),
+            "stops": plan["stops"],
+            "next_stop_lap": next_stop_lap,
+            "fuel_to_add": round(fuel_to_add, 3),
+            "stint_laps": stint_laps,
+            "total_time": plan["total_time"],
+        }
+
+    def shutdown(self):
+        self.worker.shutdown()
@@ -1,13 +1,47 @@
+from copy import deepcopy
 from math import ceil, floor
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: only the stint plan optimiser needs it
+    np = None
+
 from modules.core.app_context import AppContext
+from modules.core.lru_cache import LRUCache
 
 
 class PitStrategist:
 
+    # Plans memoised on their normalised inputs, shared by every PitStrategist: pressing
+    # Recalculate with (nearly) unchanged inputs is a lookup. Floats are rounded to the
+    # precision of the Crew Chief cells, so values that display the same share an entry.
+    PLAN_CACHE_SIZE = 256
+    PLAN_PRECISION = 3
+    plan_cache = LRUCache(PLAN_CACHE_SIZE)
+
     def __init__(self, ctx: AppContext):
         self.ctx = ctx
 
+    @classmethod
+    def normalise_plan_inputs(cls, **inputs) -> dict:
+        """Laps as whole laps, floats rounded to PLAN_PRECISION; anything else unchanged."""
+        return {
+            name: int(value) if name == "total_laps"
+            else round(float(value), cls.PLAN_PRECISION) if isinstance(value, float)
+            else value
+            for name, value in inputs.items()
+        }
+
+    def cached_plan(self, name: str, compute, **inputs):
+        """
+        compute(**normalised inputs) through plan_cache. Plans are calculated from the
+        normalised inputs, so a hit returns exactly what a miss would, and every caller
+        gets its own copy to keep the cached plan intact.
+        """
+        inputs = self.normalise_plan_inputs(**inputs)
+        key = (name,) + tuple(sorted(inputs.items()))
+        return deepcopy(self.plan_cache.get_or_compute(key, lambda _: compute(**inputs)))
+
     @staticmethod
     def calculate_total_laps_on_distance(dist, lap_len):
         total = ceil(dist / lap_len) if lap_len > 0 else 0
@@ -79,6 +113,13 @@ class PitStrategist:
         }
 
     def calculate_equal_stint_plan(self, total_laps: int, tank_capacity: float, fuel_per_lap: float, tyre_change_litres: float):
+        """Memoised _calculate_equal_stint_plan()."""
+        return self.cached_plan("equal", self._calculate_equal_stint_plan, total_laps=total_laps,
+                                tank_capacity=tank_capacity, fuel_per_lap=fuel_per_lap,
+                                tyre_change_litres=tyre_change_litres)
+
+    def _calculate_equal_stint_plan(self, total_laps: int, tank_capacity: float, fuel_per_lap: float,
+                                    tyre_change_litres: float):
         """
         Compute the stint structure so that the last and penultimate stints
         are long enough to afford a free tyre change (i.e. >= required fuel).
@@ -111,21 +152,25 @@ class PitStrategist:
 
         # Ensure last and penultimate stints meet tyre-change minimum
         # If not, rebalance by moving laps from earlier stints.
-        for i in [-1, -2]:  # last and second-last
-            while stint_laps[i] < laps_for_free_tyres:
-                # take 1 lap from the earliest stint that can spare one
-                for j in range(stints - 2):  # avoid touching last two
-                    if stint_laps[j] > base:  # only reduce if safe
-                        stint_laps[j] -= 1
-                        stint_laps[i] += 1
-                        break
-                else:
-                    # fallback: take from any stint except last two
-                    for j in range(stints - 2):
-                        if stint_laps[j] > 1:
+        # (Needs earlier stints to take laps from; stops once none can spare one.)
+        if stints > 2:
+            for i in (-1, -2):  # last and second-last
+                while stint_laps[i] < laps_for_free_tyres:
+                    # take 1 lap from the earliest stint that can spare one
+                    for j in range(stints - 2):  # avoid touching last two
+                        if stint_laps[j] > base:  # only reduce if safe
                             stint_laps[j] -= 1
                             stint_laps[i] += 1
                             break
+                    else:
+                        # fallback: take from any stint except last two
+                        for j in range(stints - 2):
+                            if stint_laps[j] > 1:
+                                stint_laps[j] -= 1
+                                stint_laps[i] += 1
+                                break
+                        else:
+                            break
 
         # Final legality check (every stint must fit in tank) ---
         max_stint_laps = self.max_stint_laps(tank_capacity, fuel_per_lap)
@@ -164,6 +209,13 @@ class PitStrategist:
 
     def calculate_final_stint_plan(self, total_laps: int, tank_capacity: float,
                                    fuel_per_lap: float, tyre_change_litres: float):
+        """Memoised _calculate_final_stint_plan()."""
+        return self.cached_plan("final", self._calculate_final_stint_plan, total_laps=total_laps,
+                                tank_capacity=tank_capacity, fuel_per_lap=fuel_per_lap,
+                                tyre_change_litres=tyre_change_litres)
+
+    def _calculate_final_stint_plan(self, total_laps: int, tank_capacity: float,
+                                    fuel_per_lap: float, tyre_change_litres: float):
 
         # Calculate min stint length needed to hide tyre change and max stint length
         laps_for_free_tyres = ceil(self.get_free_tyre_laps(tyre_change_litres, fuel_per_lap))
@@ -273,6 +325,127 @@ class PitStrategist:
 
         return True, penultimate, final
 
+    # --------------------------------------------
+    # STINT PLAN OPTIMISER
+    # --------------------------------------------
+    def optimise_stint_plans(self, total_laps: int, tank_capacity: float, fuel_per_lap: float, lap_time: float,
+                             pit_lane_loss: float, refuelling_rate: float, tyre_change_litres: float,
+                             degradation: float = 0.0, stop_counts: int = 5, max_extra_stops: int = 4,
+                             change_tyres: bool = True, first_stint_fuel: float | None = None) -> list:
+        """Memoised _optimise_stint_plans()."""
+        return self.cached_plan("optimised", self._optimise_stint_plans, total_laps=total_laps,
+                                tank_capacity=tank_capacity, fuel_per_lap=fuel_per_lap, lap_time=lap_time,
+                                pit_lane_loss=pit_lane_loss, refuelling_rate=refuelling_rate,
+                                tyre_change_litres=tyre_change_litres, degradation=degradation,
+                                stop_counts=stop_counts, max_extra_stops=max_extra_stops, change_tyres=change_tyres,
+                                first_stint_fuel=first_stint_fuel)
+
+    def _optimise_stint_plans(self, total_laps: int, tank_capacity: float, fuel_per_lap: float, lap_time: float,
+                              pit_lane_loss: float, refuelling_rate: float, tyre_change_litres: float,
+                              degradation: float = 0.0, stop_counts: int = 5, max_extra_stops: int = 4,
+                              change_tyres: bool = True, first_stint_fuel: float | None = None) -> list:
+        """
+        Search every legal split of the race into stints and return the fastest plan
+        for each stop count, ranked by total race time (the best stop_counts of them).
+        Only the fastest split of each stop count is kept: other splits with the same
+        stops are mostly the same stints reordered, so this ranks stop counts, not plans.
+
+        Dynamic programming over (laps covered, stints used): best[k][l] is the
+        fastest way to cover l laps in k stints, built from best[k - 1][l - n] plus
+        one stop and one stint of n laps, for every legal stint length n (a full
+        tank at most). Each stint index is one vectorised pass over all lap counts,
+        so a 24h race with 30+ stops takes a few milliseconds.
+
+        Time model:
+            stint of n laps : n * lap_time + degradation * n * (n - 1) / 2 (tyres are fresh each stint)
+            stop before it  : pit_lane_loss + fuelling time for n laps, where a tyre
+                              change hides tyre_change_litres of fuelling
+        The first stint starts on a full tank, or on first_stint_fuel litres when
+        re-planning the rest of a race from the car's current fuel level (the first
+        stint may then be 0 laps: box now). Stop counts range from the fewest
+        possible up to max_extra_stops more.
+
+        Returns plan dicts in the calculate_equal_stint_plan() layout plus
+        "total_time", "pit_time" and "delta" (to the fastest plan).
+        """
+        if np is None:
+            self.ctx.logger.warning("[PitStrategist] Stint plan optimiser requires NumPy.")
+            return []
+
+        total_laps = int(total_laps)
+        max_laps = min(self.max_stint_laps(tank_capacity, fuel_per_lap), total_laps)
+        if total_laps <= 0 or max_laps <= 0:
+            return []
+
+        # Laps the first stint can run, and the fewest stints that reach the flag
+        if first_stint_fuel is None:
+            first_laps = max_laps
+            min_stints = ceil(total_laps / max_laps)
+        else:
+            first_laps = min(max(floor(first_stint_fuel / fuel_per_lap), 0), max_laps)
+            min_stints = 1 + ceil((total_laps - first_laps) / max_laps)
+        max_stints = min(min_stints + max_extra_stops, total_laps + 1)
+
+        # Cost of a stint of n laps, and of the stop (plus stint) before every stint but the first
+        laps = np.arange(max_laps + 1, dtype=float)
+        stint_time = laps * lap_time + degradation * laps * (laps - 1) / 2
+        fuelled = np.maximum(laps * fuel_per_lap, tyre_change_litres if change_tyres else 0.0)
+        stop_time = pit_lane_loss + (fuelled / refuelling_rate if refuelling_rate > 0 else 0.0)
+        leg_time = stop_time + stint_time
+
+        # One stint: any legal length (from 0 laps when already on the way)
+        best = np.full(total_laps + 1, np.inf)
+        shortest = 1 if first_stint_fuel is None else 0
+        best[shortest:first_laps + 1] = stint_time[shortest:first_laps + 1]
+        choices = []
+        plans = []
+
+        for stints in range(1, max_stints + 1):
+            if stints > 1:
+                extended = np.full(total_laps + 1, np.inf)
+                choice = np.zeros(total_laps + 1, dtype=np.int16)
+                for n in range(1, max_laps + 1):
+                    candidate = best[:total_laps + 1 - n] + leg_time[n]
+                    better = candidate < extended[n:]
+                    extended[n:][better] = candidate[better]
+                    choice[n:][better] = n
+                best = extended
+                choices.append(choice)
+
+            if stints >= min_stints and np.isfinite(best[total_laps]):
+                plans.append(self._stint_plan(total_laps, choices, float(best[total_laps]), fuel_per_lap,
+                                              tyre_change_litres, lap_time, degradation))
+
+        plans.sort(key=lambda plan: plan["total_time"])
+        plans = plans[:stop_counts]
+        for plan in plans:
+            plan["delta"] = round(plan["total_time"] - plans[0]["total_time"], 3)
+        self._debug_log(f"Optimiser: {total_laps} laps; {[(p['stops'], p['total_time']) for p in plans]}")
+        return plans
+
+    def _stint_plan(self, total_laps, choices, total_time, fuel_per_lap, tyre_change_litres, lap_time, degradation):
+        """Walk the optimiser's choices back from the finish into a stint plan."""
+        stint_laps = []
+        remaining = total_laps
+        for choice in reversed(choices):
+            n = int(choice[remaining])
+            stint_laps.append(n)
+            remaining -= n
+        stint_laps.append(remaining)
+        stint_laps.reverse()
+
+        driving = sum(n * lap_time + degradation * n * (n - 1) / 2 for n in stint_laps)
+        return {
+            "status": "passed",
+            "stints": len(stint_laps),
+            "stops": len(stint_laps) - 1,
+            "laps_for_free_tyres": ceil(self.get_free_tyre_laps(tyre_change_litres, fuel_per_lap)),
+            "stint_laps": stint_laps,
+            "fuel_requirements": [round(n * fuel_per_lap, 3) for n in stint_laps],
+            "total_time": round(total_time, 3),
+            "pit_time": round(total_time - driving, 3),
+        }
+
     def _debug_log(self, message):
         if self.ctx.get("debug"):
             self.ctx.logger.debug(f"[PitStrategist] {message}")
@@ -0,0 +1,183 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: without it no simulations are run
+    np = None
+
+
+@dataclass(frozen=True)
+class RaceModel:
+    """
+    Inputs of one Monte Carlo sweep: the deterministic PitStrategist numbers plus
+    the spread of everything that varies from race to race.
+    """
+    total_laps: int
+    tank_capacity: float
+    fuel_per_lap: float
+    lap_time: float
+    pit_lane_loss: float
+    refuelling_rate: float
+    tyre_change_litres: float
+    degradation: float = 0.0
+    change_tyres: bool = True
+
+    # Randomness (standard deviations per lap / per stop)
+    fuel_sd: float = 0.05
+    lap_time_sd: float = 0.8
+    service_sd: float = 1.5
+
+    # Cautions: chance one starts on any lap, how long it lasts and its effect
+    caution_probability: float = 0.01
+    caution_laps: int = 3
+    caution_lap_factor: float = 1.4
+    caution_fuel_factor: float = 0.5
+
+    # Fuel added on top of a stint's planned fuel at each stop (litres)
+    fuel_margin: float = 0.0
+
+
+def simulate_plan(model: RaceModel, stint_laps, runs: int, seed) -> tuple:
+    """
+    Race one stint plan `runs` times at once. Every run is a row of a (runs, laps)
+    matrix: lap times and fuel use are sampled per lap, cautions per run, and the
+    stops per stint. Returns (finish_times, fuel_out) arrays of length runs.
+
+    A stint that uses more fuel than it was fuelled with is a fuel-out: the run is
+    flagged and pays an extra splash stop for the shortfall.
+    """
+    rng = np.random.default_rng(seed)
+    stint_laps = np.asarray(stint_laps, dtype=np.int64)
+    laps = int(stint_laps.sum())
+    starts = np.concatenate(([0], np.cumsum(stint_laps)[:-1]))
+
+    # Cautions: a start on any lap neutralises it and the following caution_laps - 1 laps
+    caution_start = rng.random((runs, laps)) < model.caution_probability
+    caution = caution_start.copy()
+    for offset in range(1, model.caution_laps):
+        caution[:, offset:] |= caution_start[:, :-offset]
+
+    # Fuel per lap
+    fuel = rng.normal(model.fuel_per_lap, model.fuel_sd, (runs, laps))
+    fuel[caution] *= model.caution_fuel_factor
+    np.maximum(fuel, 0.0, out=fuel)
+
+    # Lap times: pace + tyre age (fresh every stint) + noise, or the caution pace
+    tyre_age = np.arange(laps) - np.repeat(starts, stint_laps)
+    lap_times = rng.normal(model.lap_time, model.lap_time_sd, (runs, laps)) + model.degradation * tyre_age
+    lap_times[caution] = model.lap_time * model.caution_lap_factor
+
+    # Fuel loaded per stint: a full tank to start, the plan (plus margin) at each stop
+    planned = stint_laps * model.fuel_per_lap
+    loaded = np.minimum(planned + model.fuel_margin, model.tank_capacity)
+    loaded[0] = model.tank_capacity
+
+    # Fuel used per stint from the running total at the stint boundaries (0 for a 0 lap stint)
+    burned = np.concatenate((np.zeros((runs, 1)), np.cumsum(fuel, axis=1)), axis=1)
+    used = burned[:, starts + stint_laps] - burned[:, starts]
+    shortfall = np.maximum(used - loaded, 0.0)
+    fuel_out = (shortfall > 0).any(axis=1)
+
+    rate = model.refuelling_rate if model.refuelling_rate > 0 else np.inf
+    tyre_litres = model.tyre_change_litres if model.change_tyres else 0.0
+    service = np.maximum(loaded[1:], tyre_litres) / rate
+    stops = model.pit_lane_loss + service + rng.normal(0.0, model.service_sd, (runs, len(service)))
+    splashes = np.where(shortfall > 0, model.pit_lane_loss + shortfall / rate, 0.0)
+
+    finish = lap_times.sum(axis=1) + np.maximum(stops, model.pit_lane_loss).sum(axis=1) + splashes.sum(axis=1)
+    return finish, fuel_out
+
+
+def _simulate_batch(model_fields: dict, stint_laps: list, runs: int, seed) -> tuple:
+    """Process pool entry point (module level so it pickles)."""
+    return simulate_plan(RaceModel(**model_fields), stint_laps, runs, seed)
+
+
+class RaceSimulator:
+    """
+    Monte Carlo sweep of candidate stint plans (requires NumPy).
+
+    Each plan is raced `runs` times in batches of BATCH_RUNS, vectorised across the
+    runs of a batch with NumPy and spread over a process pool (created on first use
+    and kept for later sweeps). Small sweeps run in-process.
+
+    run() blocks: the Crew Chief calls it from its StrategyWorker and passes the
+    job's cancelled() check, which drops the batches not yet started.
+    """
+
+    BATCH_RUNS = 1000
+    HISTOGRAM_BINS = 20
+
+    def __init__(self, ctx, workers: int | None = None):
+        self.ctx = ctx
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.executor = None
+
+    def run(self, model: RaceModel, plans: list, runs: int, seed=None, cancelled=None) -> list | None:
+        """
+        Race every plan (dicts with "stint_laps") `runs` times; returns one summary per plan,
+        or None if cancelled() turned True before every batch was raced.
+        """
+        if np is None:
+            self.ctx.logger.warning("[RaceSimulator] Monte Carlo simulation requires NumPy.")
+            return None
+        cancelled = cancelled or (lambda: False)
+
+        batches = [self.BATCH_RUNS] * (runs // self.BATCH_RUNS)
+        if runs % self.BATCH_RUNS:
+            batches.append(runs % self.BATCH_RUNS)
+
+        seeds = np.random.SeedSequence(seed).spawn(len(plans) * len(batches))
+        tasks = [(plan["stint_laps"], batch) for plan in plans for batch in batches]
+        model_fields = asdict(model)
+
+        if self.workers > 1 and len(tasks) > 1:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [self.executor.submit(_simulate_batch, model_fields, list(stint_laps), batch, task_seed)
+                       for (stint_laps, batch), task_seed in zip(tasks, seeds)]
+            results = []
+            for future in futures:
+                if cancelled():
+                    for pending in futures:
+                        pending.cancel()
+                    return None
+                results.append(future.result())
+        else:
+            results = []
+            for (stint_laps, batch), task_seed in zip(tasks, seeds):
+                if cancelled():
+                    return None
+                results.append(simulate_plan(model, stint_laps, batch, task_seed))
+
+        summaries = []
+        for index, plan in enumerate(plans):
+            plan_results = results[index * len(batches):(index + 1) * len(batches)]
+            finish = np.concatenate([finish for finish, _ in plan_results])
+            fuel_out = np.concatenate([fuel_out for _, fuel_out in plan_results])
+            summaries.append(self.summarise(plan, finish, fuel_out))
+        return summaries
+
+    def summarise(self, plan: dict, finish, fuel_out) -> dict:
+        """Finishing time distribution and fuel-out risk of one plan."""
+        p10, p50, p90 = np.percentile(finish, (10, 50, 90))
+        counts, edges = np.histogram(finish, bins=self.HISTOGRAM_BINS)
+        return {
+            "stint_laps": list(plan["stint_laps"]),
+            "stops": len(plan["stint_laps"]) - 1,
+            "runs": int(finish.size),
+            "mean": float(finish.mean()),
+            "std": float(finish.std()),
+            "p10": float(p10),
+            "p50": float(p50),
+            "p90": float(p90),
+            "fuel_out_risk": float(fuel_out.mean()),
+            "histogram": (counts.tolist(), edges.tolist()),
+        }
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+
+class StrategyWorker:
+    """
+    Runs strategy jobs (stint plans, simulations) off the DearPyGui thread.
+
+    Jobs are submitted by name. Submitting a job again, or cancel(name), supersedes
+    the previous one: a job receives a cancelled() callable to check between steps,
+    and a superseded job's result is never delivered. Results are handed to
+    on_result(result, generation) from the worker thread; the caller passes them on
+    to the render thread (UIMailbox) and can re-check is_current() when applying,
+    so a late result can never overwrite a newer one.
+    """
+
+    WORKERS = 2     # a long simulation doesn't hold up plan recalculation
+
+    def __init__(self, ctx, workers: int = WORKERS):
+        self.ctx = ctx
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="strategy")
+        self.lock = threading.Lock()
+        self.generations = {}   # job name → latest generation
+        self.running = {}       # job name → generation being computed
+
+    def submit(self, name: str, job, on_result) -> int:
+        """Queue job(cancelled) → result, superseding any earlier job of the same name."""
+        with self.lock:
+            generation = self.generations.get(name, 0) + 1
+            self.generations[name] = generation
+
+        def cancelled():
+            return self.generations.get(name) != generation
+
+        def run():
+            if cancelled():
+                return
+            self.running[name] = generation
+            try:
+                result = job(cancelled)
+            except Exception as error:
+                self.ctx.logger.error(f"[StrategyWorker] {name} job failed: {error}")
+                return
+            finally:
+                if self.running.get(name) == generation:
+                    del self.running[name]
+            if result is not None and not cancelled():
+                on_result(result, generation)
+
+        self.executor.submit(run)
+        return generation
+
+    def cancel(self, name: str) -> bool:
+        """Supersede the job of this name. Returns True if one was queued or running."""
+        with self.lock:
+            busy = self.busy(name)
+            self.generations[name] = self.generations.get(name, 0) + 1
+        return busy
+
+    def busy(self, name: str) -> bool:
+        return name in self.running
+
+    def is_current(self, name: str, generation: int) -> bool:
+        return self.generations.get(name) == generation
+
+    def shutdown(self):
+        with self.lock:
+            for name in self.generations:
+                self.generations[name] += 1
+        self.executor.shutdown(wait=False, cancel_futures=True)
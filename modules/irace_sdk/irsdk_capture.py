@@ -0,0 +1,332 @@
+"""
+Compact binary session capture format (.ircap).
+
+Layout
+------
+    file header   MAGIC, version (u16), header length (u32), JSON header
+                  {"vars": [[name, var_type, count], ...], "chunk_rows": N, "created": ...,
+                   "session_num": ..., ...} — one capture per session: SessionTime / SessionTick
+                  restart with every SessionNum, and seeking bisects them
+    blocks        kind (u8), payload length (u32), payload
+    trailer       index block offset (u64), MAGIC — only present once the capture was closed cleanly
+
+Block kinds
+-----------
+    BLOCK_CHUNK          up to chunk_rows polled ticks, stored column by column:
+                         CHUNK_HEADER (rows, first/last SessionTick, first/last SessionTime), then per
+                         variable (header order): compressed length (u32) + encoded column.
+                         A column is the fixed-width raw var buffer bytes of one variable for every row.
+    BLOCK_SESSION_INFO   SESSION_INFO_HEADER (revision, SessionTime) + zlib(JSON of the parsed
+                         session info sections) — written once per SessionInfoUpdate revision.
+    BLOCK_MARKER         MARKER_HEADER (kind, lap, SessionTick, SessionTime) + UTF-8 label: a lap
+                         crossing or PitCrew state transition to jump to during analysis.
+    BLOCK_INDEX          Written on close: INDEX_HEADER counts, then one fixed-size entry per chunk,
+                         session info and marker block (byte offset + SessionTick/SessionTime).
+                         Readers load it through the trailer instead of walking the whole file;
+                         captures without one (version 1, or not closed) are scanned instead.
+
+Columns are encoded value-major (all rows of CarIdx 0, then CarIdx 1, ...) and
+byte-shuffled (byte 0 of every value, then byte 1, ...) before zlib, so slowly
+changing floats and ints compress to a fraction of their raw size.
+"""
+import bisect
+from collections import namedtuple
+import json
+import mmap
+import struct
+import zlib
+
+from modules.irace_sdk.irsdk_snapshot import VAR_TYPE_CODES, VAR_TYPE_SIZES
+
+MAGIC = b"IRCAP\x00"
+VERSION = 2
+
+FILE_HEADER = struct.Struct("<6sHI")         # magic, version, json header length
+BLOCK_HEADER = struct.Struct("<BI")          # kind, payload length
+CHUNK_HEADER = struct.Struct("<Iiidd")       # rows, first tick, last tick, first time, last time
+COLUMN_HEADER = struct.Struct("<I")          # compressed column length
+SESSION_INFO_HEADER = struct.Struct("<id")   # revision, session time
+MARKER_HEADER = struct.Struct("<Biid")       # marker kind, lap, tick, session time
+INDEX_HEADER = struct.Struct("<III")         # chunk, session info and marker entry counts
+CHUNK_ENTRY = struct.Struct("<QIiidd")       # offset, rows, first tick, last tick, first time, last time
+SESSION_INFO_ENTRY = struct.Struct("<QIidI") # offset, length, revision, session time, chunk index
+MARKER_ENTRY = struct.Struct("<QI")          # offset, length
+TRAILER = struct.Struct("<Q6s")              # index block offset, magic
+
+BLOCK_CHUNK = 1
+BLOCK_SESSION_INFO = 2
+BLOCK_MARKER = 3
+BLOCK_INDEX = 4
+
+MARKER_LAP = 1
+MARKER_PIT = 2
+
+COMPRESSION_LEVEL = 6
+
+
+# memoryview item codes used to transpose columns by element
+ITEM_CODES = {1: "B", 4: "I", 8: "Q"}
+
+
+def shuffle(data: bytes, item_size: int) -> bytes:
+    """Group the n-th byte of every item together (improves zlib ratio on numeric columns)."""
+    if item_size == 1:
+        return data
+    return b"".join(data[i::item_size] for i in range(item_size))
+
+
+def unshuffle(data: bytes, item_size: int) -> bytes:
+    """Inverse of shuffle()."""
+    if item_size == 1:
+        return data
+    count = len(data) // item_size
+    out = bytearray(len(data))
+    for i in range(item_size):
+        out[i::item_size] = data[i * count:(i + 1) * count]
+    return bytes(out)
+
+
+def transpose(data: bytes, item_size: int, count: int) -> bytes:
+    """Row-major [row][element] → element-major [element][row]."""
+    if count == 1:
+        return data
+    items = memoryview(data).cast(ITEM_CODES[item_size])
+    return b"".join(items[element::count].tobytes() for element in range(count))
+
+
+def untranspose(data: bytes, item_size: int, count: int) -> bytes:
+    """Inverse of transpose()."""
+    if count == 1:
+        return data
+    rows = len(data) // (item_size * count)
+    out = bytearray(len(data))
+    out_items = memoryview(out).cast(ITEM_CODES[item_size])
+    items = memoryview(data).cast(ITEM_CODES[item_size])
+    for element in range(count):
+        out_items[element::count] = items[element * rows:(element + 1) * rows]
+    return bytes(out)
+
+
+def encode_column(column: bytes, item_size: int, count: int) -> bytes:
+    return zlib.compress(shuffle(transpose(column, item_size, count), item_size), COMPRESSION_LEVEL)
+
+
+def decode_column(data: bytes, item_size: int, count: int) -> bytes:
+    """Compressed column → raw row-major bytes (rows × count values)."""
+    return untranspose(unshuffle(zlib.decompress(data), item_size), item_size, count)
+
+
+def var_format(var_type: int, count: int) -> str:
+    return f"<{count}{VAR_TYPE_CODES[var_type]}"
+
+
+# Block locations in a capture
+ChunkInfo = namedtuple("ChunkInfo", "offset rows first_tick last_tick first_time last_time")
+SessionInfoBlock = namedtuple("SessionInfoBlock", "offset length revision session_time chunk_index")
+Marker = namedtuple("Marker", "offset length kind lap tick session_time label")
+
+
+class CaptureWriter:
+    """
+    Low level .ircap writer. Not thread-safe: owned by the recorder's writer thread.
+
+    vars : [(name, var_type, count, offset)] — offset of each variable inside the raw
+           rows handed to write_chunk().
+    """
+
+    def __init__(self, path, vars: list, chunk_rows: int, meta: dict | None = None):
+        self.path = path
+        self.vars = vars
+        self.file = open(path, "wb")
+
+        header = {
+            "vars": [[name, var_type, count] for name, var_type, count, _ in vars],
+            "chunk_rows": chunk_rows,
+            **(meta or {}),
+        }
+        header_json = json.dumps(header).encode("utf-8")
+        self.file.write(FILE_HEADER.pack(MAGIC, VERSION, len(header_json)))
+        self.file.write(header_json)
+
+        self.bytes_in = 0
+
+        # Block locations collected for the index written by close()
+        self.chunks = []
+        self.session_infos = []
+        self.markers = []
+
+    def write_chunk(self, rows: list, ticks: tuple, times: tuple):
+        """Write one columnar chunk from raw rows (each a bytes copy of the recorded var span)."""
+        parts = [CHUNK_HEADER.pack(len(rows), ticks[0], ticks[1], times[0], times[1])]
+
+        for name, var_type, count, offset in self.vars:
+            item_size = VAR_TYPE_SIZES[var_type]
+            end = offset + item_size * count
+            column = b"".join(row[offset:end] for row in rows)
+            self.bytes_in += len(column)
+
+            compressed = encode_column(column, item_size, count)
+            parts.append(COLUMN_HEADER.pack(len(compressed)))
+            parts.append(compressed)
+
+        offset = self._write_block(BLOCK_CHUNK, b"".join(parts))
+        self.chunks.append(ChunkInfo(offset, len(rows), ticks[0], ticks[1], times[0], times[1]))
+
+    def write_session_info(self, revision: int, session_time: float, sections: dict):
+        payload = zlib.compress(json.dumps(sections, default=str).encode("utf-8"), COMPRESSION_LEVEL)
+        payload = SESSION_INFO_HEADER.pack(revision, session_time) + payload
+        offset = self._write_block(BLOCK_SESSION_INFO, payload)
+        self.session_infos.append(SessionInfoBlock(offset, len(payload), revision, session_time, len(self.chunks)))
+
+    def write_marker(self, kind: int, lap: int, tick: int, session_time: float, label: str):
+        payload = MARKER_HEADER.pack(kind, lap, tick, session_time) + label.encode("utf-8")
+        offset = self._write_block(BLOCK_MARKER, payload)
+        self.markers.append(Marker(offset, len(payload), kind, lap, tick, session_time, label))
+
+    def write_index(self):
+        """Append the block index and the trailer pointing at it."""
+        parts = [INDEX_HEADER.pack(len(self.chunks), len(self.session_infos), len(self.markers))]
+        parts += [CHUNK_ENTRY.pack(*chunk) for chunk in self.chunks]
+        parts += [SESSION_INFO_ENTRY.pack(*block) for block in self.session_infos]
+        parts += [MARKER_ENTRY.pack(marker.offset, marker.length) for marker in self.markers]
+
+        offset = self._write_block(BLOCK_INDEX, b"".join(parts))
+        self.file.write(TRAILER.pack(offset - BLOCK_HEADER.size, MAGIC))
+
+    def _write_block(self, kind: int, payload: bytes) -> int:
+        """Write a block and return the file offset of its payload."""
+        self.file.write(BLOCK_HEADER.pack(kind, len(payload)))
+        offset = self.file.tell()
+        self.file.write(payload)
+        return offset
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def close(self):
+        if not self.file.closed:
+            self.write_index()
+            self.file.flush()
+            self.file.close()
+
+
+class CaptureReader:
+    """
+    Memory-mapped .ircap reader.
+
+    Opening a closed capture only reads its block index (found through the trailer);
+    other captures have their block headers walked instead (payloads are skipped),
+    ignoring a truncated tail (e.g. a capture still being written, or a crash).
+    Chunks can then be decoded individually and in any order, and
+    chunk_for_time() / chunk_for_tick() locate a point of the session by bisection.
+    A capture holds a single session (SessionNum, see SessionRecorder), so both keys
+    only increase through the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, header_length = FILE_HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an iRaceInsight capture.")
+        if version > VERSION:
+            raise ValueError(f"{path} uses capture version {version}; this build reads up to {VERSION}.")
+
+        start = FILE_HEADER.size
+        self.header = json.loads(self.mm[start:start + header_length])
+        self.vars = [tuple(var) for var in self.header["vars"]]     # [(name, var_type, count)]
+
+        self.chunks = []
+        self.session_infos = []
+        self.markers = []
+        if not self._load_index():
+            self._scan(start + header_length)
+
+        # Sorted keys for bisection
+        self.chunk_ticks = [chunk.first_tick for chunk in self.chunks]
+        self.chunk_times = [chunk.first_time for chunk in self.chunks]
+
+    def _load_index(self) -> bool:
+        size = len(self.mm)
+        if size < TRAILER.size:
+            return False
+        offset, magic = TRAILER.unpack_from(self.mm, size - TRAILER.size)
+        if magic != MAGIC or offset + BLOCK_HEADER.size > size:
+            return False
+        kind, length = BLOCK_HEADER.unpack_from(self.mm, offset)
+        if kind != BLOCK_INDEX:
+            return False
+
+        position = offset + BLOCK_HEADER.size
+        n_chunks, n_session_infos, n_markers = INDEX_HEADER.unpack_from(self.mm, position)
+        position += INDEX_HEADER.size
+
+        self.chunks = [ChunkInfo(*entry) for entry in CHUNK_ENTRY.iter_unpack(
+            self.mm[position:position + n_chunks * CHUNK_ENTRY.size])]
+        position += n_chunks * CHUNK_ENTRY.size
+
+        self.session_infos = [SessionInfoBlock(*entry) for entry in SESSION_INFO_ENTRY.iter_unpack(
+            self.mm[position:position + n_session_infos * SESSION_INFO_ENTRY.size])]
+        position += n_session_infos * SESSION_INFO_ENTRY.size
+
+        self.markers = [self._read_marker(*entry) for entry in MARKER_ENTRY.iter_unpack(
+            self.mm[position:position + n_markers * MARKER_ENTRY.size])]
+        return True
+
+    def _scan(self, position):
+        size = len(self.mm)
+        while position + BLOCK_HEADER.size <= size:
+            kind, length = BLOCK_HEADER.unpack_from(self.mm, position)
+            payload = position + BLOCK_HEADER.size
+            if payload + length > size:
+                break   # truncated block
+
+            if kind == BLOCK_CHUNK:
+                self.chunks.append(ChunkInfo(payload, *CHUNK_HEADER.unpack_from(self.mm, payload)))
+            elif kind == BLOCK_SESSION_INFO:
+                revision, session_time = SESSION_INFO_HEADER.unpack_from(self.mm, payload)
+                self.session_infos.append(SessionInfoBlock(payload, length, revision, session_time, len(self.chunks)))
+            elif kind == BLOCK_MARKER:
+                self.markers.append(self._read_marker(payload, length))
+            elif kind == BLOCK_INDEX:
+                break
+
+            position = payload + length
+
+    def _read_marker(self, offset, length) -> Marker:
+        kind, lap, tick, session_time = MARKER_HEADER.unpack_from(self.mm, offset)
+        label = self.mm[offset + MARKER_HEADER.size:offset + length].decode("utf-8")
+        return Marker(offset, length, kind, lap, tick, session_time, label)
+
+    def chunk_for_time(self, session_time: float) -> int:
+        """Index of the chunk holding session_time (clamped to the first / last chunk)."""
+        return max(0, bisect.bisect_right(self.chunk_times, session_time) - 1)
+
+    def chunk_for_tick(self, tick: int) -> int:
+        """Index of the chunk holding the SessionTick (clamped to the first / last chunk)."""
+        return max(0, bisect.bisect_right(self.chunk_ticks, tick) - 1)
+
+    def read_chunk(self, index: int) -> list:
+        """Decode a chunk into one raw row-major column (bytes) per variable, in header order."""
+        chunk = self.chunks[index]
+        position = chunk.offset + CHUNK_HEADER.size
+
+        columns = []
+        for name, var_type, count in self.vars:
+            (length,) = COLUMN_HEADER.unpack_from(self.mm, position)
+            position += COLUMN_HEADER.size
+            columns.append(decode_column(self.mm[position:position + length], VAR_TYPE_SIZES[var_type], count))
+            position += length
+
+        return columns
+
+    def read_session_info(self, index: int) -> dict:
+        block = self.session_infos[index]
+        start = block.offset + SESSION_INFO_HEADER.size
+        return json.loads(zlib.decompress(self.mm[start:block.offset + block.length]))
+
+    def close(self):
+        self.mm.close()
+        self.file.close()
@@ -43,6 +43,16 @@ class IrConstants:
                      17: "G3", 18: "G4", 19: "D1", 20: "D2", 21: "D3", 22: "D4", 23: "S", 24: "GL1",
                      25: "GL2", 26: "GC", 27: "AT"}
 
+    # -------------------------------------------------------
+    # SESSION Flags (irsdk_Flags bits in SessionFlags)
+    # -------------------------------------------------------
+    FLAG_CAUTION = 0x4000
+    FLAG_CAUTION_WAVING = 0x8000
+    CAUTION_FLAGS = FLAG_CAUTION | FLAG_CAUTION_WAVING
+
+    # SessionLapsRemainEx / SessionLapsTotal of a timed (not lap limited) session
+    LAPS_UNLIMITED = 32767
+
     # -------------------------------------------------------
     # WEATHER
     # -------------------------------------------------------
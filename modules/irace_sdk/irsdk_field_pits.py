@@ -0,0 +1,153 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: IRSDKService runs without the field pit tracker
+    np = None
+
+from modules.irace_sdk.irsdk_constants import IrConstants
+
+
+def car_column(telemetry: dict, key: str, missing, max_cars: int):
+    """A CarIdx telemetry array as a max_cars long NumPy array (padded / defaulted with missing)."""
+    values = telemetry.get(key)
+    column = np.full(max_cars, missing, dtype=np.asarray(missing).dtype)
+    if values is not None:
+        count = min(len(values), max_cars)
+        column[:count] = values[:count]
+    return column
+
+
+class FieldPitTracker:
+    """
+    Pit stop tracking for every CarIdx at once (requires NumPy).
+
+    PitCrew follows the player car through a full state machine; for the rest of the
+    field the CarIdx arrays are enough. Each tick the pit road flags are compared with
+    the previous tick in one vectorised pass:
+
+        entry : CarIdxOnPitRoad rises     → entry time, lap, LapDistPct and the last lap time are latched
+        box   : CarIdxTrackSurface == IN_PIT_BOX while on pit road → the visit is a stop (not a drive-through)
+        exit  : CarIdxOnPitRoad falls     → pit lane time, stop count, last stop lap and stop loss
+
+    The stop loss estimate is the pit lane time minus the time the car would have
+    taken to cover the same stretch of track at the pace of its lap before the stop
+    (at least 0: a slow lap before the stop can make the difference negative).
+    Cars leaving the world (CarIdxTrackSurface == -1, e.g. back to the garage) drop
+    any open visit, and an entry only counts when the car was in the world and off
+    pit road on the tick before, so a reset (or spawning in the pit box, as in
+    practice and qualifying) never counts as a stop.
+
+    All per-car results are NumPy arrays indexed by CarIdx; -1 means "no value yet".
+    """
+
+    TELEMETRY_VARS = (
+        "SessionTime", "CarIdxOnPitRoad", "CarIdxTrackSurface", "CarIdxLap",
+        "CarIdxLapDistPct", "CarIdxLastLapTime",
+    )
+
+    NOT_IN_WORLD = -1
+
+    def __init__(self, max_cars: int = 64):
+        self.max_cars = max_cars
+        self.reset()
+
+    def reset(self):
+        """Forget every visit (new session, replay seek)."""
+        count = self.max_cars
+
+        # Tick to tick state
+        self.on_pit_road = np.zeros(count, dtype=bool)
+        self.was_in_world = np.zeros(count, dtype=bool)
+        self.in_box = np.zeros(count, dtype=bool)
+        self.entry_time = np.full(count, -1.0)
+        self.entry_lap = np.full(count, -1, dtype=np.int32)
+        self.entry_pct = np.full(count, -1.0)
+        self.entry_pace = np.full(count, -1.0)
+
+        # Results
+        self.stops = np.zeros(count, dtype=np.int32)
+        self.drive_throughs = np.zeros(count, dtype=np.int32)
+        self.last_stop_lap = np.full(count, -1, dtype=np.int32)
+        self.pit_lane_time = np.full(count, -1.0)
+        self.stop_loss = np.full(count, -1.0)
+
+        self.last_session_time = None
+
+    def update(self, telemetry: dict) -> bool:
+        """
+        Advance every car by one tick. Returns True if any car entered or left pit road.
+        Ticks with no SessionTime, or with time running backwards (replay jumps), reset the tracker.
+        """
+        session_time = telemetry.get("SessionTime")
+        if session_time is None:
+            return False
+        if self.last_session_time is not None and session_time < self.last_session_time:
+            self.reset()
+        self.last_session_time = session_time
+
+        on_pit_road = self._column(telemetry, "CarIdxOnPitRoad", 0).astype(bool)
+        surface = self._column(telemetry, "CarIdxTrackSurface", self.NOT_IN_WORLD)
+
+        # Cars that left the world lose any open visit
+        in_world = surface != self.NOT_IN_WORLD
+        on_pit_road &= in_world
+        self.in_box &= in_world
+        self.entry_time[~in_world] = -1.0
+
+        entered = on_pit_road & ~self.on_pit_road & self.was_in_world
+        exited = self.on_pit_road & ~on_pit_road & in_world
+        changed = bool(entered.any() or exited.any())
+
+        if entered.any():
+            self.entry_time[entered] = session_time
+            self.entry_lap[entered] = self._column(telemetry, "CarIdxLap", -1)[entered]
+            self.entry_pct[entered] = self._column(telemetry, "CarIdxLapDistPct", -1.0)[entered]
+            self.entry_pace[entered] = self._column(telemetry, "CarIdxLastLapTime", -1.0)[entered]
+            self.in_box[entered] = False
+
+        self.in_box |= on_pit_road & (surface == IrConstants.IN_PIT_BOX)
+
+        if exited.any():
+            self._finish_visits(exited & (self.entry_time >= 0), session_time, telemetry)
+
+        # A car that spawned on pit road has no visit open; forget its box once it leaves
+        self.in_box &= on_pit_road
+        self.on_pit_road = on_pit_road
+        self.was_in_world = in_world
+        return changed
+
+    def _finish_visits(self, exited, session_time: float, telemetry: dict):
+        lane_time = session_time - self.entry_time
+        stopped = exited & self.in_box
+
+        self.pit_lane_time[exited] = lane_time[exited]
+        self.drive_throughs += exited & ~self.in_box
+        self.stops += stopped
+        self.last_stop_lap[stopped] = self.entry_lap[stopped]
+
+        # Track time over the same stretch at the pre-stop pace (wrapping past the line)
+        exit_pct = self._column(telemetry, "CarIdxLapDistPct", -1.0)
+        covered = np.mod(exit_pct - self.entry_pct, 1.0)
+        known = stopped & (self.entry_pace > 0) & (self.entry_pct >= 0) & (exit_pct >= 0)
+        self.stop_loss[known] = np.maximum(lane_time[known] - covered[known] * self.entry_pace[known], 0.0)
+        self.stop_loss[stopped & ~known] = -1.0
+
+        self.entry_time[exited] = -1.0
+        self.in_box[exited] = False
+
+    def _column(self, telemetry: dict, key: str, missing):
+        return car_column(telemetry, key, missing, self.max_cars)
+
+    # -------------------------------------------------------
+    # Results
+    # -------------------------------------------------------
+    def columns(self) -> dict:
+        """
+        Copies of the per-car results (safe to hand to the UI thread), keyed like the
+        CarIdx telemetry arrays so they merge straight into IRSDKService.timing_data.
+        """
+        return {
+            "CarIdxPitStops": self.stops.copy(),
+            "CarIdxLastStopLap": self.last_stop_lap.copy(),
+            "CarIdxPitLaneTime": self.pit_lane_time.copy(),
+            "CarIdxPitLoss": self.stop_loss.copy(),
+        }
@@ -3,13 +3,35 @@
 from datetime import timedelta, datetime
 import math
 
+from modules.core.lru_cache import LRUCache
 from .irsdk_constants import IrConstants
 
 class Formatter:
 
+    # Memoised strings shared by every Formatter (timing table, dashboard widgets, pit crew logs).
+    # Time caches are keyed on whole milliseconds, floats on 2 dp; sized by the "cache_size" setting.
+    time_cache = LRUCache(5000)
+    lap_time_cache = LRUCache(5000)
+    float_cache = LRUCache(5000)
+
     def __init__(self, app_context):
         self.logger = app_context.logger
         self.constants = IrConstants()
+        self.configure_cache(app_context.get("cache_size", 5000))
+
+    @classmethod
+    def configure_cache(cls, size):
+        for cache in (cls.time_cache, cls.lap_time_cache, cls.float_cache):
+            if cache.maxsize != int(size):
+                cache.resize(size)
+
+    @classmethod
+    def cache_stats(cls):
+        return {
+            "time": cls.time_cache.stats(),
+            "lap_time": cls.lap_time_cache.stats(),
+            "float": cls.float_cache.stats(),
+        }
 
     @staticmethod
     def decode_flags(flag_code, flag_object):
@@ -77,15 +99,21 @@ class Formatter:
     def make_float_string(self, raw_number, unit=None):
         try:
             if raw_number:
-                if unit:
-                    return "{0:.2f} {1}".format(float(raw_number), unit)
-                return "{0:.2f}".format(float(raw_number))
+                # Shown to 2 dp, so key on that: raw telemetry floats would almost never repeat
+                return self.float_cache.get_or_compute((round(float(raw_number), 2), unit), self._float_string)
         except TypeError as e:
             self.logger.debug("make_float_string: TypeError - {0} and {1}".format(raw_number, unit))
         except ValueError as error:
             self.logger.debug("make_float_string: ValueError - {0} and {1}".format(raw_number, unit))
         return "--"
 
+    @staticmethod
+    def _float_string(key):
+        value, unit = key
+        if unit:
+            return "{0:.2f} {1}".format(value, unit)
+        return "{0:.2f}".format(value)
+
     def make_average_float_string(self, raw_numbers, unit=None):
         return self.make_float_string(sum(raw_numbers) / len(raw_numbers), unit)
 
@@ -102,7 +130,9 @@ class Formatter:
             if time_in_seconds <= 0.0 or time_in_seconds > 60000:
                 return_value = "00:00:00"
             else:
-                return_value = str(timedelta(seconds=time_in_seconds))[2:-3]
+                # timedelta resolution is 1µs and the string is cut to ms, so key on whole ms
+                millis = round(time_in_seconds * 1_000_000) // 1000
+                return_value = self.time_cache.get_or_compute(millis, self._time_string_from_ms)
         except TypeError as error:
             self.logger.error(f"Make Time String TypeError with {time_in_seconds}. {error}")
             return time_in_seconds
@@ -111,6 +141,29 @@ class Formatter:
             return time_in_seconds
         return return_value
 
+    @staticmethod
+    def _time_string_from_ms(millis):
+        """MM:SS.mmm (hours dropped), matching str(timedelta)[2:-3]."""
+        minutes, millis = divmod(millis, 60000)
+        return f"{minutes % 60:02}:{millis // 1000:02}.{millis % 1000:03}"
+
+    @classmethod
+    def make_lap_time_string(cls, time_in_seconds):
+        """
+        Lap / interval string M:SS.mmm used by the timing table (e.g. 73.123 → "1:13.123").
+        Memoised on whole milliseconds: most lap times repeat for a whole lap.
+        """
+        return cls.lap_time_string_from_ms(round(time_in_seconds * 1000))
+
+    @classmethod
+    def lap_time_string_from_ms(cls, millis: int):
+        return cls.lap_time_cache.get_or_compute(millis, cls._lap_time_string)
+
+    @staticmethod
+    def _lap_time_string(millis):
+        minutes, millis = divmod(millis, 60000)
+        return f"{minutes}:{millis // 1000:02}.{millis % 1000:03}"
+
     @staticmethod
     def get_time_difference(start_time, end_time):
         """
@@ -0,0 +1,119 @@
+from modules.irace_sdk.irsdk_constants import IrConstants
+
+
+class FuelEstimator:
+    """
+    Live fuel per lap of the player car, sampled from FuelLevel at each lap crossing.
+
+    A lap is only counted when it was a clean green flag lap: it must not have
+    touched pit road, seen a caution (SessionFlags), included a tow, or ended with
+    more fuel than it started with (a refuel). Every counted lap updates running
+    min / avg / max and an EWMA in O(1); nothing per lap is stored.
+
+    update() returns True when the estimate has drifted from the one last taken
+    with snapshot() by more than DRIFT (relative), so consumers only recalculate
+    their strategy when the numbers really moved.
+    """
+
+    TELEMETRY_VARS = ("FuelLevel", "SessionFlags", "OnPitRoad", "PlayerCarTowTime", "PlayerCarIdx", "CarIdxLap")
+
+    EWMA_ALPHA = 0.3        # weight of the newest lap
+    DRIFT = 0.01            # relative change that makes a new estimate worth publishing
+    MIN_LAPS = 2            # clean laps before the first estimate is published
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget every sample (new session, replay seek)."""
+        self.lap = None
+        self.lap_start_fuel = None
+        self.lap_excluded = True    # the lap in progress when tracking starts is partial
+
+        self.laps = 0
+        self.excluded_laps = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.ewma = None
+
+        self.published = None
+
+    def update(self, telemetry: dict) -> bool:
+        """Feed one tick. Returns True when a lap completed and the estimate drifted."""
+        fuel = telemetry.get("FuelLevel")
+        player = telemetry.get("PlayerCarIdx")
+        laps = telemetry.get("CarIdxLap")
+        if fuel is None or player is None or laps is None or not 0 <= player < len(laps):
+            return False
+
+        # Anything that makes this lap unrepresentative
+        if (telemetry.get("OnPitRoad")
+                or telemetry.get("SessionFlags", 0) & IrConstants.CAUTION_FLAGS
+                or telemetry.get("PlayerCarTowTime", 0) > 0):
+            self.lap_excluded = True
+
+        lap = laps[player]
+        if lap == self.lap:
+            return False
+
+        crossed = self.lap is not None and lap == self.lap + 1
+        start_fuel = self.lap_start_fuel
+        excluded = self.lap_excluded
+
+        # Start the next lap
+        self.lap = lap
+        self.lap_start_fuel = fuel
+        self.lap_excluded = False
+
+        if not crossed or start_fuel is None:
+            return False
+        used = start_fuel - fuel
+        if excluded or used <= 0:
+            self.excluded_laps += 1
+            return False
+
+        self.add_lap(used)
+        return self.has_drifted()
+
+    def add_lap(self, used: float):
+        """Fold one clean lap's fuel use into the running statistics."""
+        self.laps += 1
+        self.total += used
+        self.minimum = used if self.minimum is None else min(self.minimum, used)
+        self.maximum = used if self.maximum is None else max(self.maximum, used)
+        self.ewma = used if self.ewma is None else self.ewma + self.EWMA_ALPHA * (used - self.ewma)
+
+    @property
+    def average(self) -> float | None:
+        return self.total / self.laps if self.laps else None
+
+    def estimate(self) -> dict | None:
+        """{"fuel_min", "fuel_avg", "fuel_max", "fuel_ewma", "laps", "excluded_laps"} once MIN_LAPS were counted."""
+        if self.laps < self.MIN_LAPS:
+            return None
+        return {
+            "fuel_min": self.minimum,
+            "fuel_avg": self.average,
+            "fuel_max": self.maximum,
+            "fuel_ewma": self.ewma,
+            "laps": self.laps,
+            "excluded_laps": self.excluded_laps,
+        }
+
+    def has_drifted(self) -> bool:
+        """True if the estimate moved by more than DRIFT since the last snapshot()."""
+        estimate = self.estimate()
+        if estimate is None:
+            return False
+        if self.published is None:
+            return True
+        return any(
+            abs(estimate[key] - self.published[key]) > self.DRIFT * self.published[key]
+            for key in ("fuel_min", "fuel_avg", "fuel_max", "fuel_ewma")
+        )
+
+    def snapshot(self) -> dict | None:
+        """The current estimate, remembered as the reference for the next drift check."""
+        self.published = self.estimate()
+        return self.published
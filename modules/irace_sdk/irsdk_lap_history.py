@@ -0,0 +1,182 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: IRSDKService runs without the lap history
+    np = None
+
+from modules.irace_sdk.irsdk_field_pits import car_column
+
+
+class LapHistory:
+    """
+    Completed laps of every CarIdx in fixed-size ring buffers (requires NumPy).
+
+    One row per car, `size` laps per row, preallocated once: memory is the same
+    after one lap or a 24h race, and the oldest laps are overwritten. Each tick the
+    CarIdxLap arrays are compared with the previous tick and every car whose lap
+    count went up gets one slot written (O(1) per car, one vectorised pass for the
+    field) with:
+
+        lap       : the lap just completed
+        lap_time  : CarIdxLastLapTime (-1 until iRacing publishes it, see below)
+        pit       : the car was on pit road at any point of the lap
+        position  : CarIdxPosition at the line
+        surface   : CarIdxTrackSurface at the line
+
+    iRacing publishes CarIdxLastLapTime a few ticks after the line is crossed, so
+    a slot whose time has not changed yet stays pending and is patched as soon as
+    the new value arrives (or with the unchanged value after PENDING_TICKS, for a
+    lap exactly as fast as the previous one).
+    """
+
+    TELEMETRY_VARS = (
+        "CarIdxLap", "CarIdxLastLapTime", "CarIdxOnPitRoad", "CarIdxPosition", "CarIdxTrackSurface",
+    )
+
+    SIZE = 256              # laps kept per car
+    PENDING_TICKS = 180     # give up waiting for a new CarIdxLastLapTime after 3s at 60Hz
+
+    def __init__(self, max_cars: int = 64, size: int = SIZE):
+        self.max_cars = max_cars
+        self.size = size
+        self.reset()
+
+    def reset(self):
+        """Forget every lap (new session, replay seek)."""
+        shape = (self.max_cars, self.size)
+        self.lap = np.full(shape, -1, dtype=np.int32)
+        self.lap_time = np.full(shape, -1.0)
+        self.pit = np.zeros(shape, dtype=bool)
+        self.position = np.zeros(shape, dtype=np.int16)
+        self.surface = np.zeros(shape, dtype=np.int8)
+
+        # Per car ring cursor and number of laps written
+        self.index = np.zeros(self.max_cars, dtype=np.int64)
+        self.count = np.zeros(self.max_cars, dtype=np.int64)
+
+        # Tick to tick state
+        self.current_lap = np.full(self.max_cars, -1, dtype=np.int32)
+        self.lap_pit = np.zeros(self.max_cars, dtype=bool)
+        self.published_time = np.full(self.max_cars, -1.0)
+        self.pending = np.zeros(self.max_cars, dtype=bool)
+        self.pending_ticks = np.zeros(self.max_cars, dtype=np.int32)
+
+    # -------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------
+    def update(self, telemetry: dict) -> bool:
+        """Record the laps completed this tick. Returns True if any car crossed the line."""
+        if telemetry.get("CarIdxLap") is None:
+            return False
+
+        max_cars = self.max_cars
+        laps = car_column(telemetry, "CarIdxLap", -1, max_cars)
+        last_times = car_column(telemetry, "CarIdxLastLapTime", -1.0, max_cars)
+        on_pit_road = car_column(telemetry, "CarIdxOnPitRoad", 0, max_cars).astype(bool)
+
+        self.lap_pit |= on_pit_road
+
+        # Late CarIdxLastLapTime of laps already recorded
+        self.pending_ticks += self.pending
+        arrived = self.pending & ((last_times != self.published_time) | (self.pending_ticks >= self.PENDING_TICKS))
+        if arrived.any():
+            cars = np.flatnonzero(arrived)
+            slots = (self.index[cars] - 1) % self.size
+            self.lap_time[cars, slots] = last_times[cars]
+            self.published_time[cars] = last_times[cars]
+            self.pending[cars] = False
+
+        # A lap count going down (reset, tow to the garage, ...) restarts that car's lap counter
+        crossed = (laps > self.current_lap) & (self.current_lap >= 0)
+        self.current_lap[laps < self.current_lap] = -1
+
+        if crossed.any():
+            cars = np.flatnonzero(crossed)
+            slots = self.index[cars]
+            fresh = last_times[cars] != self.published_time[cars]
+
+            self.lap[cars, slots] = self.current_lap[cars]
+            self.lap_time[cars, slots] = np.where(fresh, last_times[cars], -1.0)
+            self.pit[cars, slots] = self.lap_pit[cars]
+            self.position[cars, slots] = car_column(telemetry, "CarIdxPosition", 0, max_cars)[cars]
+            self.surface[cars, slots] = car_column(telemetry, "CarIdxTrackSurface", -1, max_cars)[cars]
+
+            self.published_time[cars] = last_times[cars]
+            self.pending[cars] = ~fresh
+            self.pending_ticks[cars] = 0
+            self.index[cars] = (slots + 1) % self.size
+            self.count[cars] += 1
+            # A lap starting in the pit lane is a pit lap too
+            self.lap_pit[cars] = on_pit_road[cars]
+
+        self.current_lap = np.maximum(self.current_lap, laps)
+        return bool(crossed.any())
+
+    # -------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------
+    def _order(self, car_idx: int):
+        """Ring slots of a car's buffered laps, oldest first."""
+        count = min(int(self.count[car_idx]), self.size)
+        start = int(self.index[car_idx]) - count
+        return np.arange(start, start + count) % self.size
+
+    def laps(self, car_idx: int) -> dict:
+        """A car's buffered laps, oldest first, as {"lap", "lap_time", "pit", "position", "surface"} arrays."""
+        order = self._order(car_idx)
+        return {
+            "lap": self.lap[car_idx, order],
+            "lap_time": self.lap_time[car_idx, order],
+            "pit": self.pit[car_idx, order],
+            "position": self.position[car_idx, order],
+            "surface": self.surface[car_idx, order],
+        }
+
+    def clean_lap_times(self, car_idx: int, last: int | None = None):
+        """Timed, non pit lap times of a car, oldest first (only the most recent `last` laps if given)."""
+        order = self._order(car_idx)
+        if last is not None:
+            order = order[-last:]
+        times = self.lap_time[car_idx, order]
+        return times[(times > 0) & ~self.pit[car_idx, order]]
+
+    def rolling_average(self, car_idx: int, window: int = 5) -> float | None:
+        """Mean of the clean laps among the car's last `window` laps."""
+        times = self.clean_lap_times(car_idx, window)
+        return float(times.mean()) if times.size else None
+
+    def best_lap(self, car_idx: int) -> float | None:
+        """Best timed lap of the car still in the buffer."""
+        times = self.lap_time[car_idx, self._order(car_idx)]
+        times = times[times > 0]
+        return float(times.min()) if times.size else None
+
+    def stint_laps(self, car_idx: int):
+        """Clean lap times since the car's last pit lap, oldest first."""
+        order = self._order(car_idx)
+        pits = np.flatnonzero(self.pit[car_idx, order])
+        if pits.size:
+            order = order[pits[-1] + 1:]
+        times = self.lap_time[car_idx, order]
+        return times[times > 0]
+
+    def stint_degradation(self, car_idx: int, min_laps: int = 3) -> float | None:
+        """Least squares slope of the current stint's lap times (seconds lost per lap)."""
+        times = self.stint_laps(car_idx)
+        if times.size < min_laps:
+            return None
+        x = np.arange(times.size, dtype=float)
+        x -= x.mean()
+        return float((x * (times - times.mean())).sum() / (x * x).sum())
+
+    def field_rolling_average(self, window: int = 5):
+        """rolling_average() of every car at once (NaN where a car has no clean lap), indexed by CarIdx."""
+        window = min(window, self.size)
+        offsets = np.arange(1, window + 1)
+        slots = (self.index[:, None] - offsets[None, :]) % self.size
+        rows = np.arange(self.max_cars)[:, None]
+
+        times = self.lap_time[rows, slots]
+        valid = (offsets[None, :] <= self.count[:, None]) & (times > 0) & ~self.pit[rows, slots]
+        counts = valid.sum(axis=1)
+        totals = np.where(valid, times, 0.0).sum(axis=1)
+        return np.divide(totals, counts, out=np.full(self.max_cars, np.nan), where=counts > 0)
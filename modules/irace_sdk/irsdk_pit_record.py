@@ -0,0 +1,107 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+
+
+class RecordMapping(Mapping):
+    """
+    Read-only dict view over a frozen slots dataclass, so records can be handed to
+    consumers written against the old pit-cycle dicts (pit_data.get("box_in_time"), ...)
+    without copying them.
+    """
+    __slots__ = ()
+
+    KEYS = ()
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __hash__(self):
+        return hash(tuple(self.values()))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TyreTimes(RecordMapping):
+    """Session time each tyre change completed (None if the tyre was not changed)."""
+    LF: float | None = None
+    RF: float | None = None
+    LR: float | None = None
+    RR: float | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PitCycleRecord(RecordMapping):
+    """
+    One completed pit cycle, as stored in PitCrew.pit_history.
+
+    Immutable, so the same record can be shared by the history, IRSDKService.pit_data
+    and the UI without any copies: about a third of the memory of the dict it replaces
+    (plus its nested tyre dict), which matters for 24h races with 40+ stops.
+    Field names match the keys of PitCrew.new_pit_cycle().
+    """
+
+    # Basic Times & Totals
+    box_in_time: float = 0.0
+    pit_in_time: float = 0.0
+    service_start_time: float = 0.0
+    service_end_time: float = 0.0
+    pit_out_time: float = 0.0
+    back_on_track: float = 0.0
+    service_time: float = 0.0
+    stop_length: float = 0.0
+    total_pit_stop: float = 0.0
+    box_in_lap: int = 0
+
+    # Tows and Repairs
+    tow_time: float = 0.0
+    repairs: float = 0.0
+    opt_repairs_max: float = 0.0
+    opt_repairs_remaining: float = 0.0
+
+    # Fuel Values
+    fuel_filling: bool = False
+    fuel_start_time: float = 0.0
+    fuel_start_level: float = 0.0
+    fuel_end_time: float = 0.0
+    fuel_end_level: float = 0.0
+    fuel_fill_time: float = 0.0
+    fuel_fill_amount: float = 0.0
+    fuel_per_sec: float = 0.0
+
+    # Tyre Values
+    tyre_data: TyreTimes = TyreTimes()
+    tyres_changing: bool = False
+    tyres_start_time: float = 0.0
+    tyres_finish_time: float = 0.0
+    tyre_change_time: float = 0.0
+    litres_over_tyres: float = 0.0
+
+    # Jack Monitoring
+    on_jacks: bool = False
+    on_jacks_time: float = 0.0
+    off_jacks_time: float = 0.0
+    total_jack_time: float = 0.0
+
+    @classmethod
+    def from_cycle(cls, cycle: dict) -> "PitCycleRecord":
+        """Freeze a PitCrew.current_cycle dict into a record."""
+        values = {key: cycle[key] for key in cls.KEYS if key in cycle}
+        values["tyre_data"] = TyreTimes(**cycle.get("tyre_data", {}))
+        return cls(**values)
+
+    def to_dict(self) -> dict:
+        """Mutable copy in the PitCrew.new_pit_cycle() layout."""
+        cycle = dict(self.items())
+        cycle["tyre_data"] = dict(self.tyre_data)
+        return cycle
+
+
+TyreTimes.KEYS = tuple(field.name for field in fields(TyreTimes))
+PitCycleRecord.KEYS = tuple(field.name for field in fields(PitCycleRecord))
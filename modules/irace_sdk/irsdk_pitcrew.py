@@ -1,17 +1,173 @@
-import copy
+from collections import Counter
+from enum import IntEnum
 
 from modules.irace_sdk.irsdk_formatter import Formatter
+from modules.irace_sdk.irsdk_pit_record import PitCycleRecord
 from .irsdk_constants import IrConstants
 
+
+class PitState(IntEnum):
+    UN_SET = 0
+    ON_TRACK = 1
+    APPROACHING_PIT_ENTRY = 2
+    ENTERING_PIT_LANE = 3
+    DRIVING_DOWN_PIT_LANE = 4
+    ENTERING_PIT_BOX = 5
+    IN_PIT_BOX_IDLE = 6
+    IN_PIT_BOX_ALIGNMENT_ERROR = 7
+    SERVICE_IN_PROGRESS = 8
+    SERVICE_COMPLETE = 9
+    EXITING_PIT_BOX = 10
+    DRIVING_TO_PIT_EXIT = 11
+    EXITING_PIT_LANE = 12
+    BACK_ON_TRACK = 13
+
+
+# Module level aliases for the per-tick fast path (enum attribute lookups are slow)
+ON_TRACK = PitState.ON_TRACK
+ON_PIT_LANE = IrConstants.ON_PIT_LANE
+
+
+# -------------------------------------------------------
+# Transition guards: (surface, on_pit_road, sv_status) → bool
+# -------------------------------------------------------
+def _at_pit_entry(surface, on_pit_road, sv_status):
+    return surface == IrConstants.ON_PIT_LANE and not on_pit_road
+
+def _on_pit_road(surface, on_pit_road, sv_status):
+    return bool(on_pit_road)
+
+def _off_pit_road(surface, on_pit_road, sv_status):
+    return not on_pit_road
+
+def _in_pit_box(surface, on_pit_road, sv_status):
+    return surface == IrConstants.IN_PIT_BOX
+
+def _on_pit_lane(surface, on_pit_road, sv_status):
+    return surface == IrConstants.ON_PIT_LANE
+
+def _driving_pit_lane(surface, on_pit_road, sv_status):
+    return surface == IrConstants.ON_PIT_LANE and on_pit_road
+
+def _misaligned(surface, on_pit_road, sv_status):
+    return sv_status not in IrConstants.PIT_SV
+
+def _service_in_progress(surface, on_pit_road, sv_status):
+    return sv_status == IrConstants.PIT_SV_IN_PROGRESS
+
+def _service_complete(surface, on_pit_road, sv_status):
+    return sv_status == IrConstants.PIT_SV_COMPLETE
+
+def _off_pit_area(surface, on_pit_road, sv_status):
+    return surface not in IrConstants.PIT_AREA_SURFACES and not on_pit_road
+
+def _always(surface, on_pit_road, sv_status):
+    return True
+
+
+# State → ((guard, next state), ...), tried in order; indexed by PitState value
+TRANSITIONS = [()] * len(PitState)
+for _state, _rules in {
+
+    # 1. ON TRACK → pit entry line seen
+    PitState.ON_TRACK: ((_at_pit_entry, PitState.APPROACHING_PIT_ENTRY),),
+
+    # 2. Passing entry → fully on pit road
+    PitState.APPROACHING_PIT_ENTRY: ((_on_pit_road, PitState.ENTERING_PIT_LANE),),
+
+    # 3. Enter pit lane → drive lane OR straight into stall
+    PitState.ENTERING_PIT_LANE: ((_in_pit_box, PitState.ENTERING_PIT_BOX),
+                                 (_driving_pit_lane, PitState.DRIVING_DOWN_PIT_LANE)),
+
+    # 4. Driving down lane → stall entry
+    PitState.DRIVING_DOWN_PIT_LANE: ((_in_pit_box, PitState.ENTERING_PIT_BOX),),
+
+    # 5. Entering pit box → detect alignment/service/idle (idle is the replay-safe fallback)
+    PitState.ENTERING_PIT_BOX: ((_misaligned, PitState.IN_PIT_BOX_ALIGNMENT_ERROR),
+                                (_service_in_progress, PitState.SERVICE_IN_PROGRESS),
+                                (_service_complete, PitState.SERVICE_COMPLETE),
+                                (_always, PitState.IN_PIT_BOX_IDLE)),
+
+    # 6. Idle in box (waiting); leaving without service
+    PitState.IN_PIT_BOX_IDLE: ((_service_in_progress, PitState.SERVICE_IN_PROGRESS),
+                               (_service_complete, PitState.SERVICE_COMPLETE),
+                               (_on_pit_lane, PitState.EXITING_PIT_BOX)),
+
+    # 7. Alignment error in stall
+    PitState.IN_PIT_BOX_ALIGNMENT_ERROR: ((_service_in_progress, PitState.SERVICE_IN_PROGRESS),
+                                          (_service_complete, PitState.SERVICE_COMPLETE),
+                                          (_on_pit_lane, PitState.EXITING_PIT_BOX)),
+
+    # 8. Service happening; replay fallback or aborted service
+    PitState.SERVICE_IN_PROGRESS: ((_service_complete, PitState.SERVICE_COMPLETE),
+                                   (_on_pit_lane, PitState.EXITING_PIT_BOX)),
+
+    # 9. Service complete → leaving stall
+    PitState.SERVICE_COMPLETE: ((_on_pit_lane, PitState.EXITING_PIT_BOX),),
+
+    # 10. Leaving stall → moving to pit exit
+    PitState.EXITING_PIT_BOX: ((_on_pit_road, PitState.DRIVING_TO_PIT_EXIT),
+                               (_always, PitState.EXITING_PIT_LANE)),
+
+    # 11. Driving to pit exit → exit lane
+    PitState.DRIVING_TO_PIT_EXIT: ((_off_pit_road, PitState.EXITING_PIT_LANE),),
+
+    # 12. Leaving pit lane → back on track (not in box; not on lane; not on pit road)
+    PitState.EXITING_PIT_LANE: ((_off_pit_area, PitState.BACK_ON_TRACK),),
+
+    # 13. Back on track → racing again on the next tick (closes the cycle)
+    PitState.BACK_ON_TRACK: ((_always, PitState.ON_TRACK),),
+
+}.items():
+    TRANSITIONS[_state] = _rules
+
+# States in which the per-tick stall service tracking runs
+IN_PIT_BOX_STATES = [state in (PitState.ENTERING_PIT_BOX, PitState.IN_PIT_BOX_IDLE, PitState.SERVICE_IN_PROGRESS)
+                     for state in PitState]
+
+
+# -------------------------------------------------------
+# Pit-cycle event hooks: HOOKS[from][to](crew, session_time, car_idx_lap) or None
+# -------------------------------------------------------
+def _back_on_track(crew, session_time, car_idx_lap):
+    if crew.cycle_completed:
+        crew.reset_pit_cycle()
+
+HOOKS = [[None] * len(PitState) for _ in PitState]
+
+# 1. Approaching pits
+HOOKS[PitState.ON_TRACK][PitState.APPROACHING_PIT_ENTRY] = lambda crew, t, lap: crew.box_box_box(t, lap)
+# 2. Entering stall
+HOOKS[PitState.DRIVING_DOWN_PIT_LANE][PitState.ENTERING_PIT_BOX] = lambda crew, t, lap: crew.pit_box_arrival(t)
+# 5. Service completes (from any stall state)
+for _state in PitState:
+    HOOKS[_state][PitState.SERVICE_COMPLETE] = lambda crew, t, lap: crew.service_completed(t)
+# 6. Leaving stall
+for _state in (PitState.IN_PIT_BOX_IDLE, PitState.SERVICE_COMPLETE, PitState.SERVICE_IN_PROGRESS):
+    HOOKS[_state][PitState.EXITING_PIT_BOX] = lambda crew, t, lap: crew.leaving_pit_box(t)
+# 7. Leaving pit lane
+HOOKS[PitState.DRIVING_TO_PIT_EXIT][PitState.EXITING_PIT_LANE] = lambda crew, t, lap: crew.leaving_pit_lane(t)
+# Cycle finished
+HOOKS[PitState.EXITING_PIT_LANE][PitState.BACK_ON_TRACK] = lambda crew, t, lap: crew.finish_pit_cycle(t)
+HOOKS[PitState.BACK_ON_TRACK][PitState.ON_TRACK] = _back_on_track
+
+
 class PitCrew:
 
     # Velocity_Z: Normalised thresholds (helps prevent noise-triggered flips)
     LIFT_THRESHOLD = 0.01
     DROP_THRESHOLD = -0.04
 
-    # Tracking the current state
-    state = "ON_TRACK"
-    last_state = "UN_SET"
+    # Telemetry the pit crew needs every tick (subscribed by IRSDKService)
+    TELEMETRY_VARS = (
+        "IsReplayPlaying", "OnPitRoad", "PitstopActive", "PlayerCarPitSvStatus", "PitSvFlags",
+        "FuelLevel", "PlayerCarTowTime", "PitRepairLeft", "PitOptRepairLeft", "VelocityZ",
+        "SessionTime", "CarIdxTrackSurface", "CarIdxOnPitRoad", "CarIdxLap",
+    )
+
+    # Tracking the current state (table driven, see TRANSITIONS and HOOKS)
+    state = PitState.ON_TRACK
+    last_state = PitState.UN_SET
 
     # For Testing
     test_mode = False
@@ -27,6 +183,14 @@ class PitCrew:
         self.format = Formatter(ctx)
         self.current_cycle = self.new_pit_cycle()
 
+        # Completed cycles as immutable PitCycleRecords (per instance, not shared via the class)
+        self.pit_history = []
+
+        # Instrumentation: transitions seen and seconds spent per state
+        self.transition_counts = Counter()
+        self.state_dwell = [0.0] * len(PitState)
+        self.state_entered_at = None
+
     @staticmethod
     def new_pit_cycle():
         return {
@@ -79,8 +243,8 @@ class PitCrew:
         Reset the pit cycle after a completed stop and prepare a fresh
         tracking structure for the next pit event.
         """
-        self.state = "ON_TRACK"
-        self.last_state = "UN_SET"
+        self.state = PitState.ON_TRACK
+        self.last_state = PitState.UN_SET
         self.srv_sim_state = None
         self.current_cycle = self.new_pit_cycle()  # create fresh dict
         self.cycle_completed = False  # reset marker
@@ -90,96 +254,22 @@ class PitCrew:
     def update(self, surface, on_pit_road, car_idx_on_pit_road, pitstop_active, sv_status, session_time, car_idx_lap,
                sv_flags, fuel_level, tow_time, repairs, opt_repairs, velocity_z):
 
+        state = self.state
+
+        # Fast path: on track and nowhere near the pit entry line, nothing can change
+        if state is ON_TRACK and surface != ON_PIT_LANE and self.last_state is state:
+            return False
+
         sv_flags, sv_status = self.simulate_random_srv_flags(sv_flags, sv_status)
 
-        if self.state in {"ENTERING_PIT_BOX", "IN_PIT_BOX_IDLE", "SERVICE_IN_PROGRESS"}:
+        if IN_PIT_BOX_STATES[state]:
             self.in_pit_box(session_time, sv_flags, fuel_level, velocity_z, tow_time, repairs, opt_repairs)
 
-        match self.state:
-
-            # 1. ON TRACK → pit entry line seen
-            case "ON_TRACK":
-                if surface == IrConstants.ON_PIT_LANE and not on_pit_road:
-                    self.state = "APPROACHING_PIT_ENTRY"
-
-            # 2. Passing entry → fully on pit road
-            case "APPROACHING_PIT_ENTRY":
-                if on_pit_road:
-                    self.state = "ENTERING_PIT_LANE"
-
-            # 3. Enter pit lane → drive lane OR straight into stall
-            case "ENTERING_PIT_LANE":
-                if surface == IrConstants.IN_PIT_BOX:
-                    self.state = "ENTERING_PIT_BOX"
-                elif surface == IrConstants.ON_PIT_LANE and on_pit_road:
-                    self.state = "DRIVING_DOWN_PIT_LANE"
-
-            # 4. NEW: driving down lane → stall entry
-            case "DRIVING_DOWN_PIT_LANE":
-                if surface == IrConstants.IN_PIT_BOX:
-                    self.state = "ENTERING_PIT_BOX"
-
-            # 5. Entering pit box → detect alignment/service/idle
-            case "ENTERING_PIT_BOX":
-                if sv_status not in IrConstants.PIT_SV:
-                    self.state = "IN_PIT_BOX_ALIGNMENT_ERROR"
-                elif sv_status == IrConstants.PIT_SV_IN_PROGRESS:
-                    self.state = "SERVICE_IN_PROGRESS"
-                elif sv_status == IrConstants.PIT_SV_COMPLETE:
-                    self.state = "SERVICE_COMPLETE"
-                else:
-                    # Replay-safe fallback
-                    self.state = "IN_PIT_BOX_IDLE"
-
-            # 6. Idle in box (waiting)
-            case "IN_PIT_BOX_IDLE":
-                if sv_status == IrConstants.PIT_SV_IN_PROGRESS:
-                    self.state = "SERVICE_IN_PROGRESS"
-                elif sv_status == IrConstants.PIT_SV_COMPLETE:
-                    self.state = "SERVICE_COMPLETE"
-                elif surface == IrConstants.ON_PIT_LANE:
-                    # driver leaves without service
-                    self.state = "EXITING_PIT_BOX"
-
-            # 7. Alignment error in stall
-            case "IN_PIT_BOX_ALIGNMENT_ERROR":
-                if sv_status == IrConstants.PIT_SV_IN_PROGRESS:
-                    self.state = "SERVICE_IN_PROGRESS"
-                elif sv_status == IrConstants.PIT_SV_COMPLETE:
-                    self.state = "SERVICE_COMPLETE"
-                elif surface == IrConstants.ON_PIT_LANE:
-                    self.state = "EXITING_PIT_BOX"
-
-            # 8. Service happening
-            case "SERVICE_IN_PROGRESS":
-                if sv_status == IrConstants.PIT_SV_COMPLETE:
-                    self.state = "SERVICE_COMPLETE"
-                elif surface == IrConstants.ON_PIT_LANE:
-                    # Replay fallback or aborted service
-                    self.state = "EXITING_PIT_BOX"
-
-            # 9. Service complete → leaving stall
-            case "SERVICE_COMPLETE":
-                if surface == IrConstants.ON_PIT_LANE:
-                    self.state = "EXITING_PIT_BOX"
-
-            # 10. Leaving stall → moving to pit exit
-            case "EXITING_PIT_BOX":
-                if on_pit_road:
-                    self.state = "DRIVING_TO_PIT_EXIT"
-                else:
-                    self.state = "EXITING_PIT_LANE"
-
-            # 11. Driving to pit exit → exit lane
-            case "DRIVING_TO_PIT_EXIT":
-                if not on_pit_road:
-                    self.state = "EXITING_PIT_LANE"
-
-            # 12. Leaving pit lane → back on track
-            case "EXITING_PIT_LANE":
-                # Back on track when: not in box; not on lane; not on pit road.
-                if surface not in IrConstants.PIT_AREA_SURFACES and not on_pit_road:
-                    self.state = "BACK_ON_TRACK"
+        # First matching guard of the current state wins (one transition per tick)
+        for guard, target in TRANSITIONS[state]:
+            if guard(surface, on_pit_road, sv_status):
+                self.state = target
+                break
 
         # Log state transition
         if self.state != self.last_state:
@@ -188,7 +278,7 @@ class PitCrew:
             self.on_state_change(session_time, car_idx_lap)
 
             # Log out what has happened.
-            self.ctx.logger.info(f"Pit Crew Status changed: {self.last_state} → {self.state}")
+            self.ctx.logger.info(f"Pit Crew Status changed: {self.last_state.name} → {self.state.name}")
             self.ctx.logger.info(f"Surface:{surface}; OnPitRoad:{on_pit_road}/IDX:{car_idx_on_pit_road}; "
                                  f"PitStopActive:{pitstop_active}; SvStatus:{sv_status}; SvFlags:{sv_flags}.\n")
 
@@ -202,39 +292,26 @@ class PitCrew:
         return False
 
     def on_state_change(self, session_time, car_idx_lap):
-        self.ctx.logger.info(f"{self.last_state} → {self.state} at {session_time} on Lap {car_idx_lap}.")
-
-        match (self.last_state, self.state):
-
-            # 1. Approaching pits
-            case ("ON_TRACK", "APPROACHING_PIT_ENTRY"):
-                self.box_box_box(session_time, car_idx_lap)
+        last_state, state = self.last_state, self.state
+        self.ctx.logger.info(f"{last_state.name} → {state.name} at {session_time} on Lap {car_idx_lap}.")
 
-            # 2. Entering stall
-            case ("DRIVING_DOWN_PIT_LANE", "ENTERING_PIT_BOX"):
-                self.pit_box_arrival(session_time)
+        # Instrumentation: transition counts and time spent in the state being left
+        self.transition_counts[last_state, state] += 1
+        if self.state_entered_at is not None:
+            self.state_dwell[last_state] += session_time - self.state_entered_at
+        self.state_entered_at = session_time
 
-            # 5. Service completes
-            case (_, "SERVICE_COMPLETE"):  # from any stall state
-                self.service_completed(session_time)
+        hook = HOOKS[last_state][state]
+        if hook is not None:
+            hook(self, session_time, car_idx_lap)
 
-            # 6. Leaving stall
-            case ("IN_PIT_BOX_IDLE", "EXITING_PIT_BOX") | \
-                 ("SERVICE_COMPLETE", "EXITING_PIT_BOX") | \
-                 ("SERVICE_IN_PROGRESS", "EXITING_PIT_BOX"):
-                self.leaving_pit_box(session_time)
-
-            # 7. Leaving pit lane
-            case ("DRIVING_TO_PIT_EXIT", "EXITING_PIT_LANE"):
-                self.leaving_pit_lane(session_time)
-
-            # Optional: cycle finished
-            case ("EXITING_PIT_LANE", "BACK_ON_TRACK"):
-                self.finish_pit_cycle(session_time)
-
-            case ("BACK_ON_TRACK", "ON_TRACK"):
-                if self.cycle_completed:
-                    self.reset_pit_cycle()
+    def state_stats(self) -> dict:
+        """Per state dwell time (s) and transition counts, keyed by state names."""
+        return {
+            "state": self.state.name,
+            "dwell": {state.name: self.state_dwell[state] for state in PitState if self.state_dwell[state]},
+            "transitions": {f"{a.name} → {b.name}": count for (a, b), count in self.transition_counts.items()},
+        }
 
 
     # -------------------------------------------------------
@@ -436,8 +513,8 @@ class PitCrew:
         if box_in is not None:
             self.current_cycle["total_pit_stop"] = session_time - box_in
 
-        # Append a deep copy to history (so future changes don't mutate it)
-        self.pit_history.append(copy.deepcopy(self.current_cycle))
+        # Freeze into an immutable record (so future changes don't mutate it)
+        self.pit_history.append(PitCycleRecord.from_cycle(self.current_cycle))
 
         self.ctx.logger.info("Finish Pit Cycle")
         self.ctx.logger.info(f"Stored Pit Cycle #{len(self.pit_history)}")
@@ -822,16 +899,16 @@ class PitCrew:
 
         Returns
         -------
-        dict | None
-            A deep copy of the most recent completed pit cycle.
+        PitCycleRecord | None
+            The most recent completed pit cycle: a read-only mapping, shared rather than copied.
         """
         # If we have at least one entry in history, prefer that
         if self.pit_history:
-            return copy.deepcopy(self.pit_history[-1])
+            return self.pit_history[-1]
 
         # If no history yet but the current cycle is marked completed
         if getattr(self, "cycle_completed", False):
-            return copy.deepcopy(self.current_cycle)
+            return PitCycleRecord.from_cycle(self.current_cycle)
 
         # Nothing completed yet
         return None
@@ -870,11 +947,7 @@ class PitCrew:
             self.srv_sim_state = None
 
     def is_in_pit_box(self):
-        return self.state in {
-            "ENTERING_PIT_BOX",
-            "IN_PIT_BOX_IDLE",
-            "SERVICE_IN_PROGRESS",
-        }
+        return IN_PIT_BOX_STATES[self.state]
 
     def simulate_random_srv_flags(self, base_flags=0, sv_status=0):
         """
@@ -0,0 +1,213 @@
+from datetime import datetime
+from pathlib import Path
+import queue
+import threading
+
+from modules.irace_sdk.irsdk_capture import CaptureWriter
+from modules.irace_sdk.irsdk_snapshot import VAR_TYPE_SIZES
+
+
+class SessionRecorder:
+    """
+    Records polled telemetry into compact .ircap session captures (see irsdk_capture).
+
+    The polling thread only copies the raw bytes of the recorded var span for each
+    new SessionTick (one slice of the frozen var buffer) and hands full chunks to a
+    background writer thread, which splits them into columns, compresses and writes
+    them. The poller never waits on disk: if the writer falls behind, chunks are
+    dropped and counted instead. Session info, markers and the end of capture are
+    small and always queued (in order with the chunks), so they are never dropped.
+    A writer that fails (e.g. disk full) ends the capture on the next tick, and
+    `failed` stays set until the next capture is started.
+    """
+
+    CHUNK_ROWS = 600        # ~10s of ticks at 60Hz per chunk
+    QUEUE_SIZE = 32         # chunks buffered for the writer before dropping
+
+    active = False
+    path = None
+    session_num = None
+    last_tick = None
+    session_info_revision = None
+    last_lap = None
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.dropped_chunks = 0
+
+        self._queue = None
+        self._chunk_slots = None
+        self._writer_failed = None
+        self._threads = []      # writer threads still closing earlier captures, plus the current one
+        self._span_start = 0
+        self._span_length = 0
+        self._reset_chunk()
+
+    # -------------------------------------------------------
+    # Lifecycle (polling thread)
+    # -------------------------------------------------------
+    def start(self, ir, variables, folder, session_id=None, session_num=None):
+        """Open a new capture for the given variables of one session (SessionNum) of the connected sim."""
+        headers = ir._var_headers_dict
+
+        present = []
+        for name in sorted(variables):
+            var_header = headers.get(name)
+            if var_header is not None:
+                present.append((var_header.offset, name, var_header.type, var_header.count))
+
+        if not present:
+            self.ctx.logger.warning("Recorder: none of the requested variables are available.")
+            return False
+
+        # Record one contiguous span of the var buffer; the writer splits it into columns
+        present.sort()
+        self._span_start = present[0][0]
+        span_end = max(offset + VAR_TYPE_SIZES[var_type] * count for offset, _, var_type, count in present)
+        self._span_length = span_end - self._span_start
+
+        writer_vars = [(name, var_type, count, offset - self._span_start)
+                       for offset, name, var_type, count in present]
+
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        suffix = "" if session_num is None else f"_{session_num}"
+        self.path = folder / f"{datetime.now():%Y%m%d_%H%M%S}_{session_id or 'session'}{suffix}.ircap"
+
+        writer = CaptureWriter(self.path, writer_vars, self.CHUNK_ROWS, meta={
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "session_id": session_id,
+            "session_num": session_num,
+            "tick_rate": ir._header.tick_rate,
+        })
+
+        # Unbounded so metadata and the end marker always fit; only chunks are limited (by slots)
+        self._queue = queue.Queue()
+        self._chunk_slots = threading.Semaphore(self.QUEUE_SIZE)
+        self._writer_failed = threading.Event()
+        thread = threading.Thread(target=self._writer_loop, daemon=True,
+                                  args=(writer, self._queue, self._chunk_slots, self._writer_failed))
+        thread.start()
+        self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+
+        self.active = True
+        self.session_num = session_num
+        self.last_tick = None
+        self.session_info_revision = None
+        self.last_lap = None
+        self.dropped_chunks = 0
+        self._reset_chunk()
+
+        self.ctx.logger.info(f"Recorder: capturing {len(writer_vars)} variables to {self.path}")
+        return True
+
+    def stop(self, wait: bool = False):
+        """
+        Flush the pending chunk and let the writer close the file.
+        Only blocks when wait=True (application shutdown), until every writer has finished,
+        including ones still closing a capture stopped earlier.
+        """
+        if self.active:
+            self.active = False
+            self._flush_chunk()
+            self._queue.put(None)
+            self.ctx.logger.info(f"Recorder: capture stopped ({self.path}).")
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+
+    @property
+    def failed(self) -> bool:
+        """True once the writer of the latest capture has failed."""
+        return self._writer_failed is not None and self._writer_failed.is_set()
+
+    # -------------------------------------------------------
+    # Recording (polling thread)
+    # -------------------------------------------------------
+    def record_tick(self, ir, tick, session_time):
+        """Copy the recorded var span of the frozen buffer for a new SessionTick."""
+        if self.failed:
+            self.stop()
+            return
+
+        var_buf = ir._var_buffer_latest
+        start = var_buf.buf_offset + self._span_start
+        self._rows.append(var_buf.get_memory()[start:start + self._span_length])
+
+        if self._first is None:
+            self._first = (tick, session_time)
+        self._last = (tick, session_time)
+        self.last_tick = tick
+
+        if len(self._rows) >= self.CHUNK_ROWS:
+            self._flush_chunk()
+
+    def record_session_info(self, revision, session_time, sections: dict):
+        """Store the parsed session info sections once per SessionInfoUpdate revision."""
+        # Flush first so the revision lands after the ticks recorded before it
+        self._flush_chunk()
+        self._post(("session_info", revision, session_time, sections))
+        self.session_info_revision = revision
+
+    def record_marker(self, kind, lap, tick, session_time, label: str):
+        """Add a lap / pit event marker to the capture index (see irsdk_capture MARKER_*)."""
+        self._post(("marker", kind, lap, tick, session_time, label))
+
+    def _flush_chunk(self):
+        if not self._rows:
+            return
+        if self._chunk_slots.acquire(blocking=False):
+            ticks = (self._first[0], self._last[0])
+            times = (self._first[1], self._last[1])
+            self._post(("chunk", self._rows, ticks, times))
+        else:
+            self.dropped_chunks += 1
+            self.ctx.logger.warning(f"Recorder: writer behind, dropped chunk #{self.dropped_chunks}.")
+        self._reset_chunk()
+
+    def _reset_chunk(self):
+        self._rows = []
+        self._first = None
+        self._last = None
+
+    def _post(self, item):
+        # Nothing drains the queue once the writer has died
+        if self.failed:
+            self.stop()
+            return
+        self._queue.put_nowait(item)
+
+    # -------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------
+    def _writer_loop(self, writer: CaptureWriter, items: queue.Queue, chunk_slots: threading.Semaphore,
+                     failed: threading.Event):
+        try:
+            while True:
+                item = items.get()
+                if item is None:
+                    break
+
+                if item[0] == "chunk":
+                    _, rows, ticks, times = item
+                    try:
+                        writer.write_chunk(rows, ticks, times)
+                    finally:
+                        chunk_slots.release()
+                elif item[0] == "session_info":
+                    _, revision, session_time, sections = item
+                    writer.write_session_info(revision, session_time, sections)
+                elif item[0] == "marker":
+                    writer.write_marker(*item[1:])
+
+        except Exception as error:
+            failed.set()
+            self.ctx.logger.error(f"Recorder: writer failed: {error}")
+
+        finally:
+            size = writer.tell()
+            writer.close()
+            ratio = writer.bytes_in / size if size else 0.0
+            self.ctx.logger.info(f"Recorder: wrote {size / 1_048_576:.1f} MB to {writer.path} ({ratio:.1f}x compression).")
@@ -0,0 +1,317 @@
+import bisect
+import struct
+import time
+
+from modules.irace_sdk.irsdk_capture import CaptureReader, var_format
+from modules.irace_sdk.irsdk_snapshot import VAR_TYPE_SIZES
+
+
+class ReplayVarHeader:
+    __slots__ = ("name", "type", "offset", "count", "unpacker")
+
+    def __init__(self, name, var_type, offset, count):
+        self.name = name
+        self.type = var_type
+        self.offset = offset
+        self.count = count
+        self.unpacker = struct.Struct(var_format(var_type, count))
+
+
+class ReplayHeader:
+    """The parts of irsdk's shared memory header IRSDKService and TelemetrySnapshot read."""
+
+    def __init__(self, num_vars, buf_len, tick_rate):
+        self.num_vars = num_vars
+        self.var_header_offset = 0
+        self.buf_len = buf_len
+        self.tick_rate = tick_rate
+        self.session_info_update = 0
+
+
+class ReplayVarBuffer:
+    """A frozen var buffer row served from a decoded capture chunk."""
+    __slots__ = ("memory",)
+    buf_offset = 0
+
+    def __init__(self, memory):
+        self.memory = memory
+
+    def get_memory(self):
+        return self.memory
+
+
+class ReplayIRSDK:
+    """
+    Drop-in replacement for irsdk.IRSDK that plays back a recorded .ircap capture.
+
+    Serves startup / shutdown, is_initialized / is_connected, freeze_var_buffer_latest,
+    __getitem__ (telemetry variables and session info sections) and the private header,
+    var header and var buffer attributes TelemetrySnapshot reads, so IRSDKService and
+    everything downstream run unchanged on any OS with no sim.
+
+    speed : 1.0 plays in real time, N plays N times faster, 0 (or None) serves one
+            recorded tick per freeze as fast as the caller polls.
+    loop  : restart from the beginning at the end of the capture instead of disconnecting.
+
+    Any point of the capture can be opened with seek_time() / seek_tick() / seek_marker(),
+    located by bisection over the capture index, so only one chunk is decoded per jump.
+    Other threads (the UI) use request_seek(); it is applied on the next freeze.
+    """
+
+    AS_FAST_AS_POSSIBLE = 0
+
+    # No Windows data-valid event to pace on
+    _data_valid_event = None
+
+    def __init__(self, path, speed: float = 1.0, loop: bool = False):
+        self.path = path
+        self.speed = speed or self.AS_FAST_AS_POSSIBLE
+        self.loop = loop
+
+        self.reader = None
+        self.finished = False
+
+        self._header = None
+        self._var_headers_dict = {}
+        self._var_buffer_latest = None
+
+        self._row_length = 0
+        self._chunk_index = -1
+        self._chunk_rows = None
+        self._chunk_times = None
+        self._row = 0
+
+        self._session_info_index = -1
+        self._session_info = {}
+
+        self._start_wall = None
+        self._start_session_time = None
+
+        # Seek requested from another thread, and the number applied so far
+        self._pending_seek = None
+        self.seek_count = 0
+
+    # -------------------------------------------------------
+    # irsdk.IRSDK surface
+    # -------------------------------------------------------
+    def startup(self, test_file=None, dump_to=None):
+        if self.reader is not None:
+            return True
+        if self.finished and not self.loop and self._pending_seek is None:
+            return False
+
+        self.reader = CaptureReader(test_file or self.path)
+        if not self.reader.chunks:
+            self.reader.close()
+            self.reader = None
+            return False
+
+        # Lay the recorded variables out back to back in one row
+        offset = 0
+        self._var_headers_dict = {}
+        for name, var_type, count in self.reader.vars:
+            self._var_headers_dict[name] = ReplayVarHeader(name, var_type, offset, count)
+            offset += VAR_TYPE_SIZES[var_type] * count
+        self._row_length = offset
+
+        self._header = ReplayHeader(len(self.reader.vars), self._row_length, self.reader.header.get("tick_rate", 60))
+        self.finished = False
+        self.seek_chunk(0)
+        return True
+
+    def shutdown(self):
+        if self.reader is not None:
+            self.reader.close()
+        self.reader = None
+        self._header = None
+        self._var_buffer_latest = None
+        self._chunk_rows = None
+
+    @property
+    def is_initialized(self):
+        return self.reader is not None
+
+    @property
+    def is_connected(self):
+        return self.reader is not None and not self.finished
+
+    @property
+    def session_info_update(self):
+        return self._header.session_info_update
+
+    @property
+    def var_headers_names(self):
+        return list(self._var_headers_dict)
+
+    def freeze_var_buffer_latest(self):
+        pending, self._pending_seek = self._pending_seek, None
+        if pending is not None:
+            self._apply_seek(*pending)
+        self._advance()
+        start = self._row * self._row_length
+        self._var_buffer_latest = ReplayVarBuffer(self._chunk_rows[start:start + self._row_length])
+
+    def unfreeze_var_buffer_latest(self):
+        pass
+
+    def __getitem__(self, key):
+        var_header = self._var_headers_dict.get(key)
+        if var_header is not None:
+            if self._var_buffer_latest is None:
+                self.freeze_var_buffer_latest()
+            values = var_header.unpacker.unpack_from(self._var_buffer_latest.get_memory(), var_header.offset)
+            return values[0] if var_header.count == 1 else list(values)
+        return self._get_session_info(key)
+
+    # -------------------------------------------------------
+    # Playback
+    # -------------------------------------------------------
+    def seek_chunk(self, index: int, row: int = 0):
+        """Jump to a row of a chunk and restart the playback clock there."""
+        self._load_chunk(index)
+        self._row = min(row, self.reader.chunks[index].rows - 1)
+        self._start_wall = None
+        self.finished = False
+
+        self._session_info_index = -1
+        self._session_info = {}
+        self._header.session_info_update = 0
+        self._update_session_info()
+        start = self._row * self._row_length
+        self._var_buffer_latest = ReplayVarBuffer(self._chunk_rows[start:start + self._row_length])
+
+    @property
+    def markers(self) -> list:
+        """Lap and pit event markers of the capture (irsdk_capture.Marker)."""
+        return self.reader.markers if self.reader is not None else []
+
+    def request_seek(self, session_time: float = None, tick: int = None):
+        """Thread-safe: jump to a SessionTime or SessionTick on the next freeze."""
+        self._pending_seek = (session_time, tick)
+
+    def _apply_seek(self, session_time, tick):
+        if self.reader is None:
+            return
+        if tick is not None:
+            self.seek_tick(tick)
+        else:
+            self.seek_time(session_time)
+        self.seek_count += 1
+
+    def seek_time(self, session_time: float):
+        """Open the last recorded tick at or before session_time."""
+        index = self.reader.chunk_for_time(session_time)
+        self._load_chunk(index)
+        self.seek_chunk(index, max(0, bisect.bisect_right(self._chunk_times, session_time) - 1))
+
+    def seek_tick(self, tick: int):
+        """Open the last recorded tick at or before the given SessionTick."""
+        index = self.reader.chunk_for_tick(tick)
+        self._load_chunk(index)
+        ticks = self._column_values("SessionTick", self.reader.chunks[index].rows)
+        self.seek_chunk(index, max(0, bisect.bisect_right(ticks, tick) - 1))
+
+    def seek_marker(self, index: int):
+        self.seek_tick(self.reader.markers[index].tick)
+
+    def _advance(self):
+        """Move to the row due now: the next one, or the last row at/before the playback clock."""
+        if self.finished:
+            return
+
+        if self.speed == self.AS_FAST_AS_POSSIBLE:
+            if self._start_wall is None:
+                self._start_wall = time.perf_counter()
+                return
+            self._step()
+        else:
+            now = time.perf_counter()
+            if self._start_wall is None:
+                self._start_wall = now
+                self._start_session_time = self._chunk_times[self._row]
+                return
+            target = self._start_session_time + (now - self._start_wall) * self.speed
+            while not self.finished:
+                next_time = self._next_time()
+                if next_time is None:
+                    # Last row of the capture: once its tick is over, finish (or wrap and restart the clock)
+                    if target >= self._chunk_times[self._row] + 1.0 / (self._header.tick_rate or 60):
+                        self._step()
+                    break
+                if next_time > target:
+                    break
+                self._step()
+
+        self._update_session_info()
+
+    def _step(self):
+        self._row += 1
+        if self._row < len(self._chunk_times):
+            return
+
+        next_chunk = self._chunk_index + 1
+        if next_chunk < len(self.reader.chunks):
+            self._load_chunk(next_chunk)
+            self._row = 0
+        elif self.loop:
+            self.seek_chunk(0)
+        else:
+            self._row = len(self._chunk_times) - 1
+            self.finished = True
+
+    def _next_time(self):
+        if self._row + 1 < len(self._chunk_times):
+            return self._chunk_times[self._row + 1]
+        next_chunk = self._chunk_index + 1
+        if next_chunk < len(self.reader.chunks):
+            return self.reader.chunks[next_chunk].first_time
+        return None
+
+    def _load_chunk(self, index: int):
+        if index == self._chunk_index and self._chunk_rows is not None:
+            return
+
+        rows = self.reader.chunks[index].rows
+        row_length = self._row_length
+        buffer = bytearray(rows * row_length)
+
+        # Columns → rows
+        for var_header, column in zip(self._var_headers_dict.values(), self.reader.read_chunk(index)):
+            size = VAR_TYPE_SIZES[var_header.type] * var_header.count
+            for row in range(rows):
+                start = row * row_length + var_header.offset
+                buffer[start:start + size] = column[row * size:(row + 1) * size]
+
+        self._chunk_rows = memoryview(bytes(buffer))
+        self._chunk_index = index
+        self._chunk_times = self._column_values("SessionTime", rows)
+
+    def _column_values(self, name, rows):
+        """Scalar values of a variable for every row of the loaded chunk."""
+        var_header = self._var_headers_dict.get(name)
+        if var_header is None:
+            # Not recorded: assume one row per tick from the chunk header
+            chunk = self.reader.chunks[self._chunk_index]
+            if name == "SessionTick":
+                return [chunk.first_tick + row for row in range(rows)]
+            tick_rate = self._header.tick_rate or 60
+            return [(chunk.first_tick + row) / tick_rate for row in range(rows)]
+        unpack_from = var_header.unpacker.unpack_from
+        return [unpack_from(self._chunk_rows, row * self._row_length + var_header.offset)[0] for row in range(rows)]
+
+    # -------------------------------------------------------
+    # Session info
+    # -------------------------------------------------------
+    def _update_session_info(self):
+        """Publish the latest session info revision recorded before the current chunk."""
+        blocks = self.reader.session_infos
+        index = self._session_info_index
+        while index + 1 < len(blocks) and blocks[index + 1].chunk_index <= self._chunk_index:
+            index += 1
+        if index > self._session_info_index:
+            self._session_info_index = index
+            self._session_info = self.reader.read_session_info(index)
+            self._header.session_info_update = blocks[index].revision
+
+    def _get_session_info(self, key):
+        return self._session_info.get(key)
@@ -1,9 +1,28 @@
+from collections import ChainMap
+
 import irsdk
-from time import time
+import yaml
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: IRSDKService runs without the field pit tracker and lap history
+    np = None
 
 from modules.core.app_context import AppContext
+from modules.helpers.live_replanner import LiveReplanner
+from modules.irace_sdk.irsdk_capture import MARKER_LAP, MARKER_PIT
+from modules.irace_sdk.irsdk_field_pits import FieldPitTracker
+from modules.irace_sdk.irsdk_fuel import FuelEstimator
+from modules.irace_sdk.irsdk_lap_history import LapHistory
 from modules.irace_sdk.irsdk_pitcrew import PitCrew
+from modules.irace_sdk.irsdk_recorder import SessionRecorder
 from modules.irace_sdk.irsdk_constants import IrConstants
+from modules.irace_sdk.irsdk_snapshot import TelemetrySnapshot
+from modules.irace_sdk.irsdk_subscriptions import SubscriptionRegistry
+
+# pyirsdk parses session info with the libyaml C loader when PyYAML was built with it
+LIBYAML_AVAILABLE = getattr(yaml, "__with_libyaml__", False)
+
 
 class IRState:
     ir_connected = False
@@ -12,29 +31,80 @@ class IRState:
 
 class IRSDKService:
 
-    throttle = {
-        "session": {"last": 0, "cooldown": 30.0},
-        "drivers": {"last": 0, "cooldown": 30.0},
-        "weekend": {"last": 0, "cooldown": 60.0},
-        "weather": {"last": 0, "cooldown": 30.0},
-    }
+    # Variables every tick depends on, whatever is visible
+    CORE_VARS = ("SessionTick", "SessionNum", "SessionState", "PlayerCarIdx")
+
+    # Recorded on top of every subscribed variable, so a capture can drive any panel
+    RECORD_EXTRA_VARS = ("SessionFlags",)
+    RECORD_SESSION_INFO = ("WeekendInfo", "SessionInfo", "DriverInfo")
+
+    # Tyre temps & wear, read on demand when a pit cycle completes
+    TYRE_VARS = tuple(
+        f"{tyre}{reading}"
+        for tyre in ("LF", "RF", "LR", "RR")
+        for reading in ("tempCL", "tempCM", "tempCR", "wearL", "wearM", "wearR")
+    )
+
     last_session_tick = None
     session_tracker = None
 
+    # Session info (YAML) revision last consumed by each group, keyed by group name
+    session_info_seen = {}
+    session_id = None
+
+    # Seeks already handled when driven by a ReplayIRSDK
+    replay_seeks = 0
+
     timing_data = None
     session_data = None
     driver_data = None
     weather_data = None
     pit_data = None
+    fuel_data = None
+    strategy_data = None
     weekend_data = None
+    telemetry = {}
 
-    def __init__(self, ctx: AppContext):
+    def __init__(self, ctx: AppContext, ir=None):
         self.ctx = ctx
         self.constants = IrConstants()
         self.pitcrew = PitCrew(ctx)
+        # Live fuel per lap of the player car (clean green flag laps only)
+        self.fuel = FuelEstimator()
+        # Pit stops of every car in one vectorised pass (None when NumPy is not installed)
+        self.field_pits = FieldPitTracker() if np else None
+        # Every car's completed laps in fixed-size ring buffers (None when NumPy is not installed)
+        self.lap_history = LapHistory() if np else None
+        # Rest-of-race stint plan, re-solved off this thread at every lap of the player car
+        self.replanner = LiveReplanner(ctx)
         # Initialize both the ir connection and a state object used to track availability of data.
-        self.ir = irsdk.IRSDK()
+        # ir may be a ReplayIRSDK to drive everything from a recorded capture instead of the sim.
+        self.ir = ir or irsdk.IRSDK()
         self.state = IRState()
+        # Batched reader for the frozen var buffer; offsets are resolved once per connection
+        self.snapshot = TelemetrySnapshot(self.ir)
+        # Session info (YAML) sections come straight from ir: pyirsdk (and ReplayIRSDK) parse each
+        # section at most once per SessionInfoUpdate revision and hand every caller the same object
+        if not LIBYAML_AVAILABLE:
+            self.ctx.logger.warning("PyYAML has no libyaml support; session info parsing will be slow.")
+
+        # Consumers declare the telemetry they need; only the union of the due ones is decoded.
+        # Panels register themselves via UIMain.register_telemetry().
+        self.subscriptions = SubscriptionRegistry()
+        self.subscriptions.register("core", self.CORE_VARS)
+        self.subscriptions.register("pitstop", PitCrew.TELEMETRY_VARS)
+        self.subscriptions.register("fuel", FuelEstimator.TELEMETRY_VARS)
+        self.subscriptions.register("replanner", LiveReplanner.TELEMETRY_VARS)
+        if self.field_pits is not None:
+            self.subscriptions.register("field_pits", FieldPitTracker.TELEMETRY_VARS)
+            self.subscriptions.register("lap_history", LapHistory.TELEMETRY_VARS)
+        self.session_info_seen = {}
+
+        # Optional session capture to the replay folder ("record_sessions" setting)
+        self.recorder = SessionRecorder(ctx)
+
+        # Per stage spans (no-ops unless profiling is enabled)
+        self.profiler = ctx.profiler
 
     def check_sim_connection(self):
         # still connected?
@@ -43,6 +113,10 @@ class IRSDKService:
                 self.ctx.logger.debug("IRSDK Disconnected")
                 self.state.ir_connected = False
                 self.state.last_car_setup_tick = -1
+                self.snapshot.invalidate()
+                self.session_info_seen.clear()
+                self.recorder.stop()
+                self.session_id = None
                 self.ir.shutdown()
             return
 
@@ -51,6 +125,13 @@ class IRSDKService:
             self.ctx.logger.debug("IRSDK Connected.\n")
             self.state.ir_connected = True
 
+    def can_sync_to_sim(self):
+        """
+        True when polling can be paced by iRacing itself: the SDK's data-valid event
+        (Windows only) is available and freeze_var_buffer_latest() will block on it.
+        """
+        return self.state.ir_connected and bool(getattr(self.ir, "_data_valid_event", None))
+
     def detect_session_changes(self):
         """
         Detects changes to SessionID, SessionNum, and SessionState.
@@ -60,9 +141,9 @@ class IRSDKService:
         changes = {}
 
         # Read current values
-        sid = self.ir["WeekendInfo"]["SessionID"]
-        snum = self.ir["SessionNum"]
-        sstate = self.ir["SessionState"]
+        sid = self.session_id
+        snum = self.telemetry["SessionNum"]
+        sstate = self.telemetry["SessionState"]
         # self.ctx.logger.debug(f"DSC: sid:{sid}; snum:{snum}; sstate:{sstate}")
 
         # Initialise tracking store on first call OR if reset/None
@@ -97,39 +178,6 @@ class IRSDKService:
 
         return changes
 
-    def is_throttled(self, key: str) -> bool:
-        """
-        Determine whether the specified throttle key is still under its cooldown period.
-
-        This method checks the last recorded update timestamp for the given key and
-        compares it against the configured cooldown window. If the cooldown has not
-        elapsed, it returns True (meaning the caller should skip its update). If the
-        cooldown has expired, the method updates the timestamp and returns False.
-
-        Args:
-            key (str): Identifier for the subsystem being throttled
-                       (e.g., "weather", "session", "track").
-
-        Returns:
-            bool: True if the key is still within its cooldown period,
-                  False if an update should proceed.
-        """
-        now = time()  # Current timestamp
-        entry = self.throttle.get(key)  # Fetch throttle record
-
-        # Create default throttle entry if missing
-        if entry is None:
-            self.throttle[key] = {"last": 0, "cooldown": 1.0}  # Default 1s cooldown
-            entry = self.throttle[key]
-
-        # If cooldown window has not expired, skip update
-        if now - entry["last"] < entry["cooldown"]:
-            return True
-
-        # Cooldown expired → update timestamp and allow update
-        entry["last"] = now
-        return False
-
     def get_update(self):
         """
         This is the entry point into the wrapper.
@@ -144,6 +192,9 @@ class IRSDKService:
             "session": False,
             "weekend": False,
             "pitstop": False,
+            "drivers": False,
+            "fuel": False,
+            "strategy": False,
         }
 
         self.check_sim_connection()
@@ -151,112 +202,282 @@ class IRSDKService:
             # self.ctx.logger.debug('IRSDK Not Connected')
             return available_updates
 
+        profiler = self.profiler
+
         # This is so we get consistent data from inside that tick
         # and the data isn't updated by apis inbetween calls.
+        span = profiler.start()
         self.ir.freeze_var_buffer_latest()
-
-        # This method has no throttling attached to it
-        available_updates["timing"] = self.get_timing_data_fast()
-
+        profiler.stop("sdk.freeze", span)
+
+        # A replay jumped to another point of the capture: start the pit cycle afresh and refresh the dashboard
+        seeks = getattr(self.ir, "seek_count", 0)
+        if seeks != self.replay_seeks:
+            self.replay_seeks = seeks
+            self.pitcrew.reset_pit_cycle()
+            self.fuel.reset()
+            self.reset_strategy(available_updates)
+            if self.field_pits is not None:
+                self.field_pits.reset()
+                self.lap_history.reset()
+            self.subscriptions.force("session", "weather")
+
+        # Decode only what the due (visible) subscriptions need, in a single pass
+        span = profiler.start()
+        due = self.subscriptions.poll()
+        self.telemetry = self.snapshot.read(self.subscriptions.variables_for(due))
+        profiler.stop("sdk.decode", span)
+
+        # SessionID only changes with a new session info revision (parsing the YAML when it does)
+        span = profiler.start()
+        self.refresh_session_info("session_id", self.update_session_id)
+        profiler.stop("sdk.session_info", span)
+
+        # Append this tick to the session capture when recording is enabled
+        span = profiler.start()
+        if self.ctx.get("record_sessions", False):
+            self.record_tick()
+        elif self.recorder.active:
+            self.recorder.stop()
+        profiler.stop("sdk.record", span)
+
+        # Timing runs every tick while the Timing tab is visible
+        if "timing" in due:
+            span = profiler.start()
+            available_updates["timing"] = self.get_timing_data_fast()
+            profiler.stop("sdk.timing", span)
+
+        # The pit crew always runs so no stop is missed
+        span = profiler.start()
+        pit_state = self.pitcrew.state
         available_updates['pitstop'] = self.get_pit_stop_data_fast()
+        profiler.stop("sdk.pitcrew", span)
+
+        # Fuel per lap estimate, published only when it drifts
+        span = profiler.start()
+        if self.fuel.update(self.telemetry):
+            self.fuel_data = self.fuel.snapshot()
+            available_updates["fuel"] = True
+        profiler.stop("sdk.fuel", span)
+
+        # Queue a rest-of-race re-plan at each lap crossing; pick up the plan once solved
+        span = profiler.start()
+        if self.replanner.lap_crossed(self.telemetry):
+            self.replan()
+        plan = self.replanner.take_plan()
+        if plan is not None:
+            self.strategy_data = plan
+            available_updates["strategy"] = True
+        profiler.stop("sdk.replanner", span)
+
+        # Every car's pit entries / exits and completed laps, also always run
+        if self.field_pits is not None:
+            span = profiler.start()
+            self.field_pits.update(self.telemetry)
+            profiler.stop("sdk.field_pits", span)
+
+            span = profiler.start()
+            self.lap_history.update(self.telemetry)
+            profiler.stop("sdk.lap_history", span)
+
+        # Index lap crossings and pit crew transitions in the capture
+        if self.recorder.active:
+            self.record_markers(pit_state)
 
         # Detect changes across SessionID, SessionNum, SessionState
+        # Any server, P→Q→R or state change refreshes session metadata and weather on the next tick.
         session_changes = self.detect_session_changes()
-
-        # Server changed → reload EVERYTHING
-        if "server_changed" in session_changes:
+        if session_changes:
+            self.subscriptions.force("session", "weather")
+            # A new session (P→Q→R or another server) starts every car's stop count afresh
+            new_session = "session_phase_changed" in session_changes or "server_changed" in session_changes
+            if new_session:
+                self.fuel.reset()
+                self.reset_strategy(available_updates)
+            if new_session and self.field_pits is not None:
+                self.field_pits.reset()
+                self.lap_history.reset()
+
+        # Rate-limited updates; each group is only due while its consumer is visible
+        if "session" in due:
             available_updates["session"] = self.update_session_status()
-            available_updates["weather"] = self.update_weather_data()
-            # self.update_track_info()
-            # self.update_driver_roster()
 
-        # SessionNum changed (P→Q→R) → reload session metadata
-        elif "session_phase_changed" in session_changes:
-            available_updates["session"] = self.update_session_status()
-            available_updates["weather"] = self.update_weather_data()
-            # self.update_driver_roster()
+        # Session info (YAML) groups refresh only when iRacing publishes a new revision
+        if "drivers" in due:
+            span = profiler.start()
+            available_updates["drivers"] = self.refresh_session_info("drivers", self.update_driver_data)
+            profiler.stop("sdk.drivers", span)
 
-        # SessionState changed (Warmup→Racing→Checkered) → update only what depends on state
-        elif "state_changed" in session_changes:
-            available_updates["session"] = self.update_session_status()
+        if "weather" in due:
             available_updates["weather"] = self.update_weather_data()
 
-        # These are throttled updates and if called via tracked changes the last call is updated.
-        # So these updates get skipped internally to avoid duplication
-        available_updates["session"] = self.update_session_status()
-        available_updates["drivers"] = self.update_driver_data()
-        available_updates["weather"] = self.update_weather_data()
-        available_updates["weekend"] = self.update_weekend_data()
+        if "weekend" in due:
+            available_updates["weekend"] = self.refresh_session_info("weekend", self.update_weekend_data)
 
         return available_updates
 
+    def reset_strategy(self, available_updates):
+        """Drop the rest-of-race plan (replay seek, new session) and publish the now empty strategy."""
+        self.replanner.reset()
+        self.strategy_data = {}
+        available_updates["strategy"] = True
+
+    def replan(self):
+        """Hand the replanner the live fuel per lap (recent laps) and the player's rolling lap time."""
+        estimate = self.fuel.estimate()
+        fuel_per_lap = estimate["fuel_ewma"] if estimate else None
+
+        lap_time = None
+        player = self.telemetry.get("PlayerCarIdx")
+        if self.lap_history is not None and player is not None and 0 <= player < self.lap_history.max_cars:
+            lap_time = self.lap_history.rolling_average(player)
+
+        self.replanner.replan(self.telemetry, fuel_per_lap=fuel_per_lap, lap_time=lap_time)
+
+    def refresh_session_info(self, group, updater):
+        """
+        Run updater() once per session info revision for the given group.
+        iRacing increments SessionInfoUpdate whenever it publishes new YAML (driver joins/leaves,
+        session changes, ...), so the YAML is only re-read when something actually changed.
+        A failed update is retried on the next tick.
+        Returns True if the group was refreshed this tick.
+        """
+        revision = self.ir.session_info_update
+        if self.session_info_seen.get(group) == revision:
+            return False
+
+        updated = updater()
+        if updated:
+            self.session_info_seen[group] = revision
+        return updated
+
+    def record_tick(self):
+        """
+        Feed the recorder with the frozen buffer for each new SessionTick (plus new session info revisions).
+        SessionTime and SessionTick restart with every SessionNum (P→Q→R), so each session gets its own
+        capture and the capture index stays sorted for seeking.
+        """
+        recorder = self.recorder
+        session_num = self.telemetry["SessionNum"]
+        if recorder.active and session_num != recorder.session_num:
+            recorder.stop()
+
+        # A writer failure (e.g. disk full) ends the capture; retry with the next session
+        if recorder.failed and session_num == recorder.session_num:
+            recorder.stop()
+            return
+
+        if not recorder.active:
+            variables = self.subscriptions.variables_for(frozenset(self.subscriptions.subscriptions))
+            variables = variables | frozenset(self.TYRE_VARS) | frozenset(self.RECORD_EXTRA_VARS)
+            folder = self.ctx.get("replay_folder") or self.ctx.replay_folder
+            if not recorder.start(self.ir, variables, folder, self.session_id, session_num):
+                return
+
+        tick = self.telemetry["SessionTick"]
+        if tick == recorder.last_tick:
+            return
+
+        session_time = self.telemetry["SessionTime"]
+        revision = self.ir.session_info_update
+        if revision != recorder.session_info_revision:
+            sections = {name: self.ir[name] for name in self.RECORD_SESSION_INFO}
+            recorder.record_session_info(revision, session_time, sections)
+
+        recorder.record_tick(self.ir, tick, session_time)
+
+    def record_markers(self, pit_state):
+        """Mark the player's lap crossings and every PitCrew state transition in the capture."""
+        telemetry = self.telemetry
+        lap = telemetry["CarIdxLap"][telemetry["PlayerCarIdx"]]
+        tick = telemetry["SessionTick"]
+        session_time = telemetry["SessionTime"]
+
+        if lap != self.recorder.last_lap:
+            self.recorder.last_lap = lap
+            self.recorder.record_marker(MARKER_LAP, lap, tick, session_time, f"Lap {lap}")
+
+        if self.pitcrew.state != pit_state:
+            self.recorder.record_marker(MARKER_PIT, lap, tick, session_time, f"Lap {lap} {self.pitcrew.state.name}")
+
+    def update_session_id(self):
+        weekend_info = self.ir["WeekendInfo"]
+        if not weekend_info:
+            return False
+        self.session_id = weekend_info["SessionID"]
+        return True
+
     def update_weekend_data(self):
-        if self.is_throttled("weekend"):
+
+        wi = self.ir["WeekendInfo"]
+        if not wi:
             return False
+        options = wi["WeekendOptions"]
 
         self.weekend_data = {
             'info': {
-                "TrackName": self.ir["WeekendInfo"]["TrackName"],
-                "TrackID": self.ir["WeekendInfo"]["TrackID"],
-                "TrackLengthKM": self.ir["WeekendInfo"]["TrackLength"],
-                "TrackDisplayName": self.ir["WeekendInfo"]["TrackDisplayName"],
-                "TrackDisplayShortName": self.ir["WeekendInfo"]["TrackDisplayShortName"],
-                "TrackConfigName": self.ir["WeekendInfo"]["TrackConfigName"],
-                "TrackCity": self.ir["WeekendInfo"]["TrackCity"],
-                "TrackCountry": self.ir["WeekendInfo"]["TrackCountry"],
-                "TrackAltitudeM": self.ir["WeekendInfo"]["TrackAltitude"],
-                "TrackLatitude": self.ir["WeekendInfo"]["TrackLatitude"],
-                "TrackLongitude": self.ir["WeekendInfo"]["TrackLongitude"],
-                "TrackNorthOffsetRad": self.ir["WeekendInfo"]["TrackNorthOffset"],
-                "TrackNumTurns": self.ir["WeekendInfo"]["TrackNumTurns"],
-                "TrackPitSpeedLimitKPH": self.ir["WeekendInfo"]["TrackPitSpeedLimit"],
-                "TrackType": self.ir["WeekendInfo"]["TrackType"],
-                "TrackWeatherType": self.ir["WeekendInfo"]["TrackWeatherType"],
-                "TrackSkies": self.ir["WeekendInfo"]["TrackSkies"],
-                "TrackSurfaceTempC": self.ir["WeekendInfo"]["TrackSurfaceTemp"],
-                "TrackAirTempC": self.ir["WeekendInfo"]["TrackAirTemp"],
-                "TrackAirPressureHg": self.ir["WeekendInfo"]["TrackAirPressure"],
-                "TrackWindVelMS": self.ir["WeekendInfo"]["TrackWindVel"],
-                "TrackWindDirRad": self.ir["WeekendInfo"]["TrackWindDir"],
-                "TrackRelativeHumidityPct": self.ir["WeekendInfo"]["TrackRelativeHumidity"],
-                "TrackFogLevelPct": self.ir["WeekendInfo"]["TrackFogLevel"],
-                "TrackCleanup": self.ir["WeekendInfo"]["TrackCleanup"],
-                "TrackDynamicTrack": self.ir["WeekendInfo"]["TrackDynamicTrack"],
+                "TrackName": wi["TrackName"],
+                "TrackID": wi["TrackID"],
+                "TrackLengthKM": wi["TrackLength"],
+                "TrackDisplayName": wi["TrackDisplayName"],
+                "TrackDisplayShortName": wi["TrackDisplayShortName"],
+                "TrackConfigName": wi["TrackConfigName"],
+                "TrackCity": wi["TrackCity"],
+                "TrackCountry": wi["TrackCountry"],
+                "TrackAltitudeM": wi["TrackAltitude"],
+                "TrackLatitude": wi["TrackLatitude"],
+                "TrackLongitude": wi["TrackLongitude"],
+                "TrackNorthOffsetRad": wi["TrackNorthOffset"],
+                "TrackNumTurns": wi["TrackNumTurns"],
+                "TrackPitSpeedLimitKPH": wi["TrackPitSpeedLimit"],
+                "TrackType": wi["TrackType"],
+                "TrackWeatherType": wi["TrackWeatherType"],
+                "TrackSkies": wi["TrackSkies"],
+                "TrackSurfaceTempC": wi["TrackSurfaceTemp"],
+                "TrackAirTempC": wi["TrackAirTemp"],
+                "TrackAirPressureHg": wi["TrackAirPressure"],
+                "TrackWindVelMS": wi["TrackWindVel"],
+                "TrackWindDirRad": wi["TrackWindDir"],
+                "TrackRelativeHumidityPct": wi["TrackRelativeHumidity"],
+                "TrackFogLevelPct": wi["TrackFogLevel"],
+                "TrackCleanup": wi["TrackCleanup"],
+                "TrackDynamicTrack": wi["TrackDynamicTrack"],
             },
             'options': {
-                "NumStarters": self.ir["WeekendInfo"]["WeekendOptions"]["NumStarters"],
-                "StartingGrid": self.ir["WeekendInfo"]["WeekendOptions"]["StartingGrid"],
-                "QualifyScoring": self.ir["WeekendInfo"]["WeekendOptions"]["QualifyScoring"],
-                "CourseCautions": self.ir["WeekendInfo"]["WeekendOptions"]["CourseCautions"],
-                "StandingStart": self.ir["WeekendInfo"]["WeekendOptions"]["StandingStart"],
-                "Restarts": self.ir["WeekendInfo"]["WeekendOptions"]["Restarts"],
-                "WeatherType": self.ir["WeekendInfo"]["WeekendOptions"]["WeatherType"],
-                "Skies": self.ir["WeekendInfo"]["WeekendOptions"]["Skies"],
-                "WindDirection": self.ir["WeekendInfo"]["WeekendOptions"]["WindDirection"],
-                "WindSpeed": self.ir["WeekendInfo"]["WeekendOptions"]["WindSpeed"],
-                "WeatherTemp": self.ir["WeekendInfo"]["WeekendOptions"]["WeatherTemp"],
-                "RelativeHumidity": self.ir["WeekendInfo"]["WeekendOptions"]["RelativeHumidity"],
-                "FogLevel": self.ir["WeekendInfo"]["WeekendOptions"]["FogLevel"],
-                "Unofficial": self.ir["WeekendInfo"]["WeekendOptions"]["Unofficial"],
-                "CommercialMode": self.ir["WeekendInfo"]["WeekendOptions"]["CommercialMode"],
-                "NightMode": self.ir["WeekendInfo"]["WeekendOptions"]["NightMode"],
-                "IsFixedSetup": self.ir["WeekendInfo"]["WeekendOptions"]["IsFixedSetup"],
-                "StrictLapsChecking": self.ir["WeekendInfo"]["WeekendOptions"]["StrictLapsChecking"],
-                "HasOpenRegistration": self.ir["WeekendInfo"]["WeekendOptions"]["HasOpenRegistration"],
+                "NumStarters": options["NumStarters"],
+                "StartingGrid": options["StartingGrid"],
+                "QualifyScoring": options["QualifyScoring"],
+                "CourseCautions": options["CourseCautions"],
+                "StandingStart": options["StandingStart"],
+                "Restarts": options["Restarts"],
+                "WeatherType": options["WeatherType"],
+                "Skies": options["Skies"],
+                "WindDirection": options["WindDirection"],
+                "WindSpeed": options["WindSpeed"],
+                "WeatherTemp": options["WeatherTemp"],
+                "RelativeHumidity": options["RelativeHumidity"],
+                "FogLevel": options["FogLevel"],
+                "Unofficial": options["Unofficial"],
+                "CommercialMode": options["CommercialMode"],
+                "NightMode": options["NightMode"],
+                "IsFixedSetup": options["IsFixedSetup"],
+                "StrictLapsChecking": options["StrictLapsChecking"],
+                "HasOpenRegistration": options["HasOpenRegistration"],
             }
         }
 
         return True
 
     def get_player_car_idx(self):
-        return self.session_data['PlayerCarIdx'] or self.ir['PlayerCarIdx'] or None
+        return self.telemetry.get('PlayerCarIdx')
 
     def get_timing_data_fast(self):
         """
         Only update timing if SessionTick has advanced.
         Returns True if timing data was updated this tick.
         """
-        tick = self.ir["SessionTick"]
+        telemetry = self.telemetry
+        tick = telemetry["SessionTick"]
 
         # If tick is None (loading, switching sessions), skip
         if tick is None:
@@ -276,14 +497,17 @@ class IRSDKService:
 
         # Pull timing data fresh for this frame
         self.timing_data = {
-            'CarIdxPosition': self.ir['CarIdxPosition'],  # Cars position in race by car index,
-            'CarIdxClassPosition': self.ir['CarIdxClassPosition'],  # Cars class position in race by car index,
-            'CarIdxLap': self.ir['CarIdxLap'],  # Laps completed count
-            'CarIdxLastLapTime': self.ir['CarIdxLastLapTime'],
-            'CarIdxF2Time': self.ir['CarIdxF2Time'],
-            'CarIdxTrackSurface': self.ir['CarIdxTrackSurface'],
-            'CarIdxOnPitRoad': self.ir['CarIdxOnPitRoad'],
+            'CarIdxPosition': telemetry['CarIdxPosition'],  # Cars position in race by car index,
+            'CarIdxClassPosition': telemetry['CarIdxClassPosition'],  # Cars class position in race by car index,
+            'CarIdxLap': telemetry['CarIdxLap'],  # Laps completed count
+            'CarIdxLastLapTime': telemetry['CarIdxLastLapTime'],
+            'CarIdxF2Time': telemetry['CarIdxF2Time'],
+            'CarIdxTrackSurface': telemetry['CarIdxTrackSurface'],
+            'CarIdxOnPitRoad': telemetry['CarIdxOnPitRoad'],
         }
+        # Stops made, last stop lap and stop loss per car
+        if self.field_pits is not None:
+            self.timing_data.update(self.field_pits.columns())
         return True
 
     def update_session_status(self):
@@ -291,30 +515,27 @@ class IRSDKService:
         Get Session Data gets data specific to the session but src the Player Car Index for accessing IDX.
         :return:
         """
-        if self.is_throttled("session"):
-            return False
 
+        telemetry = self.telemetry
         self.session_data = {
-            'SessionID': self.ir['WeekendInfo']['SessionID'],
-            'SessionNum': self.ir['SessionNum'],  # Session number
-            'SessionState': self.ir['SessionState'],  # Session state, irsdk_SessionState
-            'SessionTick': self.ir['SessionTick'],  # Current update number
-            'SessionTimeOfDay': self.ir['SessionTimeOfDay'],  # Time of day in seconds
-            'SessionTime': self.ir['SessionTime'],  # Seconds since session start
-            'SessionTimeRemain': self.ir['SessionTimeRemain'],  # Seconds left till session ends
-            'SessionLapsTotal': self.ir['SessionLapsTotal'],  # Total number of laps in.
-            'SessionLapsRemainEx': self.ir['SessionLapsRemainEx'],  # New improved laps left till session ends
-            'PlayerCarIdx': self.ir['PlayerCarIdx'],  # PlayerCarIdx
+            'SessionID': self.session_id,
+            'SessionNum': telemetry['SessionNum'],  # Session number
+            'SessionState': telemetry['SessionState'],  # Session state, irsdk_SessionState
+            'SessionTick': telemetry['SessionTick'],  # Current update number
+            'SessionTimeOfDay': telemetry['SessionTimeOfDay'],  # Time of day in seconds
+            'SessionTime': telemetry['SessionTime'],  # Seconds since session start
+            'SessionTimeRemain': telemetry['SessionTimeRemain'],  # Seconds left till session ends
+            'SessionLapsTotal': telemetry['SessionLapsTotal'],  # Total number of laps in.
+            'SessionLapsRemainEx': telemetry['SessionLapsRemainEx'],  # New improved laps left till session ends
+            'PlayerCarIdx': telemetry['PlayerCarIdx'],  # PlayerCarIdx
         }
         return True
 
     def update_driver_data(self):
         """
         Pulls DriverInfo from the iRacing SDK and builds a drivers dictionary
-        indexed by CarIdx. Safe to call repeatedly; throttling prevents overload.
+        indexed by CarIdx. Called once per session info revision.
         """
-        if self.is_throttled("drivers"):
-            return False
 
         try:
             di = self.ir['DriverInfo']
@@ -370,68 +591,59 @@ class IRSDKService:
             return False
 
     def update_weather_data(self):
-        if self.is_throttled("weather"):
-            return False
 
+        telemetry = self.telemetry
         self.weather_data = {
             'CustID': 12345,  # self.app_context.config.user.IRACE_CUSTID,
-            'SessionID': self.ir['WeekendInfo']['SessionID'],
-            'AirTemp': self.ir['AirTemp'],  # Temperature of air at start/finish line (C)
-            'RelativeHumidity': self.ir['RelativeHumidity'],  # Relative Humidity (%age)
-            'TrackTempCrew': self.ir['TrackTempCrew'],  # Temperature of track measured by crew around track (C)
-            'AirDensity': self.ir['AirDensity'],  # Density of air at start/finish line (kg/m^3)
-            'AirPressure': self.ir['AirPressure'],  # Pressure of air at start/finish line (Pa)
-            'FogLevel': self.ir['FogLevel'],  # Fog Level at Start Finish Line (%age)
-            'Skies': self.ir['Skies'],  # Skies (0=clear/1=p cloudy/2=m cloudy/3=overcast)
-            'Precipitation': self.ir['Precipitation'],  # Precipitation at start/finish line (%age)
-            'WindDir': self.ir['WindDir'],  # Wind direction at start/finish line (rad)
-            'WindVel': self.ir['WindVel'],  # Wind velocity at start/finish line (m/s)
-            'TrackWetness': self.ir['TrackWetness'],  # How wet is the average track surface, irsdk_TrackWetness
-            'WeatherDeclaredWet': self.ir['WeatherDeclaredWet']  # The steward says rain tires can be used
+            'SessionID': self.session_id,
+            'AirTemp': telemetry['AirTemp'],  # Temperature of air at start/finish line (C)
+            'RelativeHumidity': telemetry['RelativeHumidity'],  # Relative Humidity (%age)
+            'TrackTempCrew': telemetry['TrackTempCrew'],  # Temperature of track measured by crew around track (C)
+            'AirDensity': telemetry['AirDensity'],  # Density of air at start/finish line (kg/m^3)
+            'AirPressure': telemetry['AirPressure'],  # Pressure of air at start/finish line (Pa)
+            'FogLevel': telemetry['FogLevel'],  # Fog Level at Start Finish Line (%age)
+            'Skies': telemetry['Skies'],  # Skies (0=clear/1=p cloudy/2=m cloudy/3=overcast)
+            'Precipitation': telemetry['Precipitation'],  # Precipitation at start/finish line (%age)
+            'WindDir': telemetry['WindDir'],  # Wind direction at start/finish line (rad)
+            'WindVel': telemetry['WindVel'],  # Wind velocity at start/finish line (m/s)
+            'TrackWetness': telemetry['TrackWetness'],  # How wet is the average track surface, irsdk_TrackWetness
+            'WeatherDeclaredWet': telemetry['WeatherDeclaredWet']  # The steward says rain tires can be used
             # Sun Set Time.
         }
         return True
 
     def get_pit_stop_data_fast(self):
-        player_car_idx = self.ir['PlayerCarIdx']
+        telemetry = self.telemetry
+        player_car_idx = telemetry['PlayerCarIdx']
 
         # Enable test mode for replays in debug mode.
-        self.pitcrew.set_test_mode(self.ir['IsReplayPlaying'] and self.ctx.settings.get('debug', False))
+        self.pitcrew.set_test_mode(telemetry['IsReplayPlaying'] and self.ctx.settings.get('debug', False))
 
         updated = self.pitcrew.update(
-            surface=self.ir['CarIdxTrackSurface'][player_car_idx],
-            on_pit_road=self.ir['OnPitRoad'],
-            car_idx_on_pit_road=self.ir['CarIdxOnPitRoad'][player_car_idx],
-            pitstop_active=self.ir['PitstopActive'],
-            sv_status=self.ir['PlayerCarPitSvStatus'],
-            session_time = self.ir['SessionTime'],
-            car_idx_lap = self.ir['CarIdxLap'][player_car_idx],
-            sv_flags = self.ir['PitSvFlags'],
-            fuel_level = self.ir['FuelLevel'],
-            tow_time = self.ir['PlayerCarTowTime'],
-            repairs = self.ir['PitRepairLeft'],
-            opt_repairs = self.ir['PitOptRepairLeft'],
-            velocity_z = self.ir['VelocityZ']
+            surface=telemetry['CarIdxTrackSurface'][player_car_idx],
+            on_pit_road=telemetry['OnPitRoad'],
+            car_idx_on_pit_road=telemetry['CarIdxOnPitRoad'][player_car_idx],
+            pitstop_active=telemetry['PitstopActive'],
+            sv_status=telemetry['PlayerCarPitSvStatus'],
+            session_time = telemetry['SessionTime'],
+            car_idx_lap = telemetry['CarIdxLap'][player_car_idx],
+            sv_flags = telemetry['PitSvFlags'],
+            fuel_level = telemetry['FuelLevel'],
+            tow_time = telemetry['PlayerCarTowTime'],
+            repairs = telemetry['PitRepairLeft'],
+            opt_repairs = telemetry['PitOptRepairLeft'],
+            velocity_z = telemetry['VelocityZ']
         )
 
         if updated:
-            self.pit_data = self.pitcrew.get_completed_pit_report()
-            self.pit_data['tyre_usage'] = self.get_tyre_report()
+            # The shared read-only record plus this stop's tyre readings, without copying the record
+            self.pit_data = ChainMap({'tyre_usage': self.get_tyre_report()}, self.pitcrew.get_completed_pit_report())
 
         return updated
 
     def get_tyre_report(self):
-        # Add the tyre wear & temps from the Pit Stop
-        return {
-            'LFtempCL': self.ir['LFtempCL'], 'LFtempCM': self.ir['LFtempCM'], 'LFtempCR': self.ir['LFtempCR'],
-            'LFwearL': self.ir['LFwearL'], 'LFwearM': self.ir['LFwearM'], 'LFwearR': self.ir['LFwearR'],
-            'RFtempCL': self.ir['RFtempCL'], 'RFtempCM': self.ir['RFtempCM'], 'RFtempCR': self.ir['RFtempCR'],
-            'RFwearL': self.ir['RFwearL'], 'RFwearM': self.ir['RFwearM'], 'RFwearR': self.ir['RFwearR'],
-            'LRtempCL': self.ir['LRtempCL'], 'LRtempCM': self.ir['LRtempCM'], 'LRtempCR': self.ir['LRtempCR'],
-            'LRwearL': self.ir['LRwearL'], 'LRwearM': self.ir['LRwearM'], 'LRwearR': self.ir['LRwearR'],
-            'RRtempCL': self.ir['RRtempCL'], 'RRtempCM': self.ir['RRtempCM'], 'RRtempCR': self.ir['RRtempCR'],
-            'RRwearL': self.ir['RRwearL'], 'RRwearM': self.ir['RRwearM'], 'RRwearR': self.ir['RRwearR'],
-        }
+        # Add the tyre wear & temps from the Pit Stop (not subscribed per tick, so decode them now)
+        return self.snapshot.read(self.TYRE_VARS)
 
 
 
@@ -0,0 +1,117 @@
+import struct
+
+# iRacing irsdk_VarType → struct codes and byte sizes (matches irsdk.VAR_TYPE_MAP)
+VAR_TYPE_CODES = ['c', '?', 'i', 'I', 'f', 'd']
+VAR_TYPE_SIZES = [1, 1, 4, 4, 4, 8]
+
+
+class SnapshotLayout:
+    """
+    Compiled read plan for one set of variable names.
+
+    The variables are sorted by their offset in the var buffer and merged into a
+    single little-endian struct format (gaps become pad bytes), so one
+    unpack_from() call decodes every requested variable in a single pass.
+    """
+    __slots__ = ("unpacker", "base_offset", "slices", "missing")
+
+    def __init__(self, unpacker, base_offset, slices, missing):
+        self.unpacker = unpacker        # struct.Struct covering all present variables
+        self.base_offset = base_offset  # offset of the first variable inside the var buffer
+        self.slices = slices            # [(name, start_index, count)] into the unpacked tuple
+        self.missing = missing          # names not published by this sim/car
+
+
+class TelemetrySnapshot:
+    """
+    Batched reader for the frozen iRacing var buffer.
+
+    irsdk's __getitem__ looks up the var header and unpacks the buffer again for
+    every single variable. This reader resolves the offsets for a set of names
+    once per connection (or var header change) and then decodes the whole set
+    from the frozen buffer with one struct.unpack_from() call per tick.
+
+    Values follow irsdk conventions: scalars for count == 1, lists for arrays and
+    None for variables the sim does not publish.
+    """
+
+    def __init__(self, ir):
+        self.ir = ir
+        self._layouts = {}
+        self._header_key = None
+
+    def invalidate(self):
+        """Drop all compiled layouts, e.g. after a disconnect."""
+        self._layouts.clear()
+        self._header_key = None
+
+    def read(self, names) -> dict:
+        """
+        Decode the requested variables from the currently frozen var buffer.
+        Call irsdk.freeze_var_buffer_latest() first so all values come from the same tick.
+        """
+        names = names if isinstance(names, frozenset) else frozenset(names)
+
+        self._check_header()
+
+        layout = self._layouts.get(names)
+        if layout is None:
+            layout = self._layouts[names] = self._compile(names)
+
+        result = dict.fromkeys(layout.missing)
+        if not layout.slices:
+            return result
+
+        var_buf = self.ir._var_buffer_latest
+        values = layout.unpacker.unpack_from(var_buf.get_memory(), var_buf.buf_offset + layout.base_offset)
+
+        for name, start, count in layout.slices:
+            result[name] = values[start] if count == 1 else list(values[start:start + count])
+
+        return result
+
+    # -------------------------------------------------------
+    # Layout compilation
+    # -------------------------------------------------------
+    def _check_header(self):
+        """Invalidate compiled layouts when the var header table changes (reconnect, car change)."""
+        header = self.ir._header
+        key = (id(header), header.num_vars, header.var_header_offset, header.buf_len)
+        if key != self._header_key:
+            self._layouts.clear()
+            self._header_key = key
+
+    def _compile(self, names: frozenset) -> SnapshotLayout:
+        headers = self.ir._var_headers_dict
+
+        present = []
+        missing = []
+        for name in names:
+            var_header = headers.get(name)
+            if var_header is None:
+                missing.append(name)
+                continue
+            present.append((var_header.offset, name, var_header.type, var_header.count))
+
+        if not present:
+            return SnapshotLayout(None, 0, [], missing)
+
+        present.sort()
+        base_offset = present[0][0]
+        cursor = base_offset
+        fmt = ["<"]
+        slices = []
+        index = 0
+
+        for offset, name, var_type, count in present:
+            # Pad over any variables we are not interested in
+            if offset > cursor:
+                fmt.append(f"{offset - cursor}x")
+
+            fmt.append(f"{count}{VAR_TYPE_CODES[var_type]}")
+            slices.append((name, index, count))
+
+            index += count
+            cursor = offset + VAR_TYPE_SIZES[var_type] * count
+
+        return SnapshotLayout(struct.Struct("".join(fmt)), base_offset, slices, missing)
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from time import time
+from typing import Callable
+
+
+@dataclass
+class Subscription:
+    """
+    A consumer's declaration of the telemetry it needs.
+
+    name       : update group the consumer is interested in (e.g. "timing", "weather").
+    variables  : telemetry variables decoded from the var buffer when the group is due.
+    rate_hz    : maximum refresh rate; None means every tick.
+    is_active  : callable returning False while the consumer is hidden; None = always active.
+    """
+    name: str
+    variables: frozenset
+    rate_hz: float | None = None
+    is_active: Callable[[], bool] | None = None
+
+    last_update: float = 0.0
+    was_active: bool = False
+    forced: bool = False
+
+
+class SubscriptionRegistry:
+    """
+    Registry of telemetry subscriptions declared by panels and helpers.
+
+    Each tick IRSDKService polls the registry for the subscriptions that are due
+    (active and outside their rate window) and decodes only the union of their
+    variables. Hidden panels therefore cost nothing until they become visible
+    again, at which point they are refreshed immediately.
+    """
+
+    def __init__(self):
+        self.subscriptions = {}
+        self._variables_cache = {}
+
+    def register(self, name: str, variables=(), rate_hz: float | None = None,
+                 is_active: Callable[[], bool] | None = None):
+        """Add (or replace) the subscription for an update group."""
+        self.subscriptions[name] = Subscription(
+            name=name,
+            variables=frozenset(variables),
+            rate_hz=rate_hz,
+            is_active=is_active,
+        )
+        self._variables_cache.clear()
+
+    def unregister(self, name: str):
+        self.subscriptions.pop(name, None)
+        self._variables_cache.clear()
+
+    def force(self, *names: str):
+        """Make the named subscriptions due on the next poll (if they are active)."""
+        for name in names:
+            subscription = self.subscriptions.get(name)
+            if subscription is not None:
+                subscription.forced = True
+
+    def poll(self, now: float | None = None) -> frozenset:
+        """
+        Return the names of the subscriptions that should be serviced this tick.
+        A subscription is due when it is active and either:
+            - has no rate limit,
+            - has just become active (e.g. its tab was shown),
+            - was forced, or
+            - its rate window has elapsed.
+        """
+        now = time() if now is None else now
+        due = []
+
+        for subscription in self.subscriptions.values():
+            if subscription.is_active is not None and not subscription.is_active():
+                subscription.was_active = False
+                continue
+
+            if (subscription.rate_hz is None
+                    or not subscription.was_active
+                    or subscription.forced
+                    or now - subscription.last_update >= 1.0 / subscription.rate_hz):
+                subscription.last_update = now
+                subscription.forced = False
+                due.append(subscription.name)
+
+            subscription.was_active = True
+
+        return frozenset(due)
+
+    def variables_for(self, names: frozenset) -> frozenset:
+        """Union of the variables declared by the given subscriptions (cached per name set)."""
+        variables = self._variables_cache.get(names)
+        if variables is None:
+            variables = frozenset().union(
+                *(self.subscriptions[name].variables for name in names if name in self.subscriptions)
+            )
+            self._variables_cache[names] = variables
+        return variables
@@ -38,6 +38,25 @@ class BasePanel:
         """Override in subclasses to update UI widgets."""
         pass
 
+    # --------------------------------------------
+    # TELEMETRY SUBSCRIPTIONS
+    # --------------------------------------------
+    # Update groups this panel consumes: {name: {"variables": (...), "rate_hz": float | None}}
+    TELEMETRY = {}
+
+    def register_telemetry(self, registry):
+        """
+        Declare this panel's telemetry with the SDK subscription registry.
+        The groups are only decoded while the panel is visible (requires_update).
+        """
+        for name, spec in self.TELEMETRY.items():
+            registry.register(
+                name,
+                variables=spec.get("variables", ()),
+                rate_hz=spec.get("rate_hz"),
+                is_active=lambda: self.requires_update,
+            )
+
     # -----------------------------------------------------
     # DEFAULT BUILD METHOD (calls grid + extra UI)
     # -----------------------------------------------------
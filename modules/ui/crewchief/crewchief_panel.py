@@ -3,7 +3,10 @@ import json
 import dearpygui.dearpygui as dpg
 
 from modules.helpers.pit_strategist import PitStrategist
+from modules.helpers.race_simulator import RaceModel, RaceSimulator
+from modules.helpers.strategy_worker import StrategyWorker
 from modules.ui.base_panel import BasePanel
+from modules.ui.crewchief.stint_plan_grid import StintPlanGrid
 
 class CrewChiefPanel(BasePanel):
     LABEL = "Crew Chief"
@@ -18,6 +21,31 @@ class CrewChiefPanel(BasePanel):
         self.root_tag = "crewchief_root"
         self.tags = []
 
+        # Strategy maths and Monte Carlo sweeps run off the render thread; results come back through publish()
+        self.worker = StrategyWorker(ctx)
+        self.simulator = RaceSimulator(ctx, workers=ctx.get("simulation_workers"))
+        self.publish = None
+        # Live rest-of-race re-planner (IRSDKService.replanner), configured by every recalculation
+        self.replanner = None
+
+        # Plans from the last Recalculate, keyed by display name (the simulation candidates)
+        self.candidate_plans = {}
+
+        # One pooled grid per strategy group, and what each currently shows (only changed plans are redrawn)
+        self.grids = {}
+        self.rendered_groups = {}
+
+    def set_publisher(self, publish):
+        """publish(payload) hands a payload to this panel's update() on the render thread (UIMailbox)."""
+        self.publish = publish
+
+    def set_replanner(self, replanner):
+        self.replanner = replanner
+
+    def shutdown(self):
+        self.worker.shutdown()
+        self.simulator.close()
+
     # -------------------------------------------------------
     # BUILD UI
     # -------------------------------------------------------
@@ -29,6 +57,8 @@ class CrewChiefPanel(BasePanel):
                 self.build_pit_deltas()
                 self.build_basic_stint()
                 self.build_advanced_stint()
+                self.build_strategy_results()
+                self.build_simulation()
 
         # Create hidden popups once during UI build
         with dpg.window(label="Saved", modal=True, show=False, tag="save_success_popup"):
@@ -54,6 +84,9 @@ class CrewChiefPanel(BasePanel):
             dpg.add_button(label="Initialise", callback=self.initialise_action)
             dpg.add_button(label="Recalculate", callback=self.calculate_strategies_action)
             dpg.add_button(label="Save Config", width=150, callback=self.on_save_config_action)
+            dpg.add_checkbox(label="Live Fuel", tag="live_fuel", default_value=True)
+            dpg.add_text("Live fuel: waiting for clean laps", tag="live_fuel_status")
+            dpg.add_text("", tag="strategy_status")
 
     def build_race_controls(self):
 
@@ -215,6 +248,56 @@ class CrewChiefPanel(BasePanel):
                     self.get_vertical_table_checkbox_cell(tag="use_adjusted_laps", label="Use Adjusted Laps",
                                                           default=False, readonly=False)
 
+                # Stint plan optimiser inputs
+                with dpg.table_row():
+
+                    self.get_vertical_table_float_cell(tag="tyre_degradation", label="Tyre Deg (s/lap)", default=0.00,
+                                                       width=self.CELL_WIDTH, readonly=False)
+                    self.get_vertical_table_checkbox_cell(tag="change_tyres", label="Change Tyres Every Stop",
+                                                          default=True, readonly=False)
+                    self.get_vertical_table_int_cell(tag="stop_counts", label="Stop Counts to Rank", default=5,
+                                                     width=self.CELL_WIDTH, readonly=False)
+
+    def build_strategy_results(self):
+        # Filled by apply_strategy(); the grids are built once and updated in place
+        with dpg.group(horizontal=True, tag="strategy_results_group"):
+            for group in ("full_race_distance_equal_stint_strategy", "full_race_distance_final_stint_strategy",
+                          "optimised_stint_strategy"):
+                with dpg.group(tag=group):
+                    self.grids[group] = StintPlanGrid(self.ctx, prefix=group)
+                    self.grids[group].build()
+
+    def build_simulation(self):
+        with dpg.group(horizontal=False, tag="simulation_group"):
+            self.get_section_header(label="RACE SIMULATION", tag="simulation_header")
+
+            with dpg.table(header_row=False, resizable=False, policy=dpg.mvTable_SizingStretchProp,
+                           borders_innerH=False, borders_innerV=False, borders_outerH=False, borders_outerV=False):
+
+                # 6 columns
+                for i in range(6):
+                    dpg.add_table_column()
+
+                with dpg.table_row():
+                    self.get_vertical_table_int_cell(tag="sim_runs", label="Runs per Plan", default=10000,
+                                                     width=self.CELL_WIDTH, readonly=False)
+                    self.get_vertical_table_float_cell(tag="sim_fuel_sd", label="Fuel SD (l/lap)", default=0.05,
+                                                       width=self.CELL_WIDTH, readonly=False)
+                    self.get_vertical_table_float_cell(tag="sim_lap_time_sd", label="Lap Time SD (s)", default=0.80,
+                                                       width=self.CELL_WIDTH, readonly=False)
+                    self.get_vertical_table_float_cell(tag="sim_service_sd", label="Service SD (s)", default=1.50,
+                                                       width=self.CELL_WIDTH, readonly=False)
+                    self.get_vertical_table_float_cell(tag="sim_caution_pct", label="Caution (%/lap)", default=1.00,
+                                                       width=self.CELL_WIDTH, readonly=False)
+                    self.get_vertical_table_float_cell(tag="sim_fuel_margin", label="Fuel Margin (l)", default=1.00,
+                                                       width=self.CELL_WIDTH, readonly=False)
+
+            with dpg.group(horizontal=True):
+                dpg.add_button(label="Simulate", tag="simulate_button", callback=self.on_simulate_action)
+                dpg.add_text("Recalculate, then simulate the candidate plans.", tag="simulation_status")
+
+            dpg.add_group(tag="simulation_results")
+
     # -----------------------
     # Table Cell Builders
     # -----------------------
@@ -231,7 +314,8 @@ class CrewChiefPanel(BasePanel):
 
         with dpg.group(horizontal=False):
             dpg.add_text(f"{label}", tag=label_tag)
-            dpg.add_input_text(tag=tag, default_value=default, readonly=readonly, width=width)
+            dpg.add_input_text(tag=tag, default_value=default, readonly=readonly, width=width,
+                               callback=None if readonly else self.on_input_changed)
 
         dpg.bind_item_font(label_tag, self.ctx.font_manager.input_label)
         dpg.bind_item_theme(label_tag, "input_label_theme")
@@ -247,7 +331,8 @@ class CrewChiefPanel(BasePanel):
 
         with dpg.group(horizontal=False):
             dpg.add_text(f"{label}", tag=label_tag)
-            dpg.add_input_int(tag=tag, default_value=default, readonly=readonly, width=width)
+            dpg.add_input_int(tag=tag, default_value=default, readonly=readonly, width=width,
+                              callback=None if readonly else self.on_input_changed)
 
         dpg.bind_item_theme(label_tag, "input_label_theme")
         dpg.bind_item_theme(tag, "theme_user_input")
@@ -259,7 +344,8 @@ class CrewChiefPanel(BasePanel):
 
         with dpg.group(horizontal=False):
             dpg.add_text(f"{label}", tag=label_tag)
-            dpg.add_input_float(tag=tag, default_value=default, readonly=readonly, width=width)
+            dpg.add_input_float(tag=tag, default_value=default, readonly=readonly, width=width,
+                                callback=None if readonly else self.on_input_changed)
 
         dpg.bind_item_theme(label_tag, "input_label_theme")
         dpg.bind_item_theme(tag, "theme_user_input")
@@ -275,7 +361,7 @@ class CrewChiefPanel(BasePanel):
 
         with dpg.group(horizontal=False):
             dpg.add_text(f"{label}", tag=label_tag)
-            dpg.add_combo(tag=tag, items=items, width=width)
+            dpg.add_combo(tag=tag, items=items, width=width, callback=self.on_input_changed)
 
         dpg.bind_item_theme(label_tag, "input_label_theme")
         dpg.bind_item_theme(tag, "theme_user_input")
@@ -292,6 +378,7 @@ class CrewChiefPanel(BasePanel):
                 tag=tag,
                 default_value=default,
                 enabled=not readonly,
+                callback=None if readonly else self.on_input_changed,
             )
 
         # Apply themes
@@ -300,191 +387,35 @@ class CrewChiefPanel(BasePanel):
         dpg.bind_item_font(label_tag, self.ctx.font_manager.input_label)
 
     # --------------------------------------------
-    # BUILDING STINT TABLES
+    # LIVE UPDATES (render thread)
     # --------------------------------------------
-    def build_stint_plan_grid(self, name: str, prefix: str, plan: dict):
+    def update(self, data):
         """
-        Given a stint plan dict such as:
-        {
-            'stints': 6,
-            'stops': 5,
-            'laps_for_free_tyres': 15,
-            'stint_laps': [...],
-            'fuel_requirements': [...]
-        }
-        return a grid definition list suitable for build_input_grid().
+        Apply worker results (strategy, simulation) and the live fuel estimate
+        (IRSDKService.fuel_data). The estimate is only published when it drifted, so
+        with Live Fuel ticked every fuel update re-runs the strategy.
         """
-        self.ctx.logger.info(f"Building stint plan grid: {plan}")
-        grid = []
-
-        # --- Section: Summary ---
-        grid.append([
-            {"section": f"{name}"},
-            {f"section": f"{sum(plan['stint_laps'])} Total Laps"}
-        ])
+        if "strategy" in data:
+            self.apply_strategy(*data["strategy"])
 
-        grid.append([
-            {"label": "Total Stints", "tag": f"{prefix}_total_stints", "default": str(plan['stints']), "readonly": True},
-            {"label": "Total Stops", "tag": f"{prefix}_total_stops", "default": str(plan['stops']), "readonly": True},
-            {"label": "Free Tyre Laps", "tag": f"{prefix}_free_tyre_laps", "default": str(plan['laps_for_free_tyres']), "readonly": True},
-        ])
+        if "simulation" in data:
+            self.render_simulation_results(*data["simulation"])
 
-        # --- Section: Per-Stint Breakdown ---
-        grid.append([{"section": "Per-Stint Breakdown"}, {"section": "Laps"}, {"section": "Fuel (l)"}])
+        fuel_data = data.get("fuel_data")
+        if not fuel_data:
+            return
 
-        stint_count = plan.get("stints", 0)
+        dpg.set_value("live_fuel_status",
+                      f"Live fuel: {fuel_data['fuel_avg']:.3f} l/lap avg, {fuel_data['fuel_ewma']:.3f} recent "
+                      f"({fuel_data['laps']} clean laps, {fuel_data['excluded_laps']} excluded)")
 
-        for i in range(stint_count):
-            lap_val = str(plan["stint_laps"][i])
-            fuel_val = str(plan["fuel_requirements"][i])
+        if not dpg.get_value("live_fuel"):
+            return
 
-            grid.append([
-                {"section": f"Stint {i + 1}"},
-                {"tag": f"{prefix}_stint_{i + 1}_laps", "default": lap_val, "readonly": True},
-                {"tag": f"{prefix}_stint_{i + 1}_fuel", "default": fuel_val, "readonly": True},
-            ])
+        for tag in ("fuel_min", "fuel_avg", "fuel_max"):
+            dpg.set_value(tag, round(fuel_data[tag], 3))
 
-        return grid
-
-    def render_fuel_limited(self, data: dict, parent: str):
-        """
-        Renders the fuel-limited warning UI (hybrid layout):
-        - Simple labels for general info
-        - A real DPG table for illegal stints
-        """
-        style = self.ctx.styles  # convenience alias
-
-        # -----------------------------------------
-        # Section Header
-        # -----------------------------------------
-        dpg.add_text("Fuel-Limited Stint Plan", parent=parent, color=style.WARNING_LABEL)
-        dpg.add_separator(parent=parent)
-
-        # -----------------------------------------
-        # Message (label)
-        # -----------------------------------------
-        if msg := data.get("message"):
-            message = f"Message: {msg}"
-            dpg.add_text(message, parent=parent)  # Wrap for readability
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Max legal laps
-        # -----------------------------------------
-        if "max_legal_laps" in data:
-            dpg.add_text(f"Maximum Allowed per Stint: {data['max_legal_laps']} laps", parent=parent)
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Illegal stints table
-        # -----------------------------------------
-        illegal = data.get("illegal_stints", [])
-        if illegal:
-            dpg.add_text("Illegal Stints:", parent=parent)
-            with dpg.table(
-                    parent=parent,
-                    borders_innerH=True,
-                    borders_innerV=True,
-                    borders_outerH=True,
-                    borders_outerV=True,
-                    header_row=True
-            ):
-
-                # Columns
-                dpg.add_table_column(label="Stint")
-                dpg.add_table_column(label="Planned Laps")
-                dpg.add_table_column(label="Fuel Save Needed")
-
-                # Rows
-                for entry in illegal:
-                    with dpg.table_row():
-                        dpg.add_text(f"Stint {entry['stint']}")
-                        dpg.add_text(str(entry["laps"]))
-                        dpg.add_text(f"-{entry['fuel_saving_required']} laps")
-
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Suggestion
-        # -----------------------------------------
-        if suggestion := data.get("suggestion"):
-            suggestion = f"Suggestion: {suggestion}"
-            dpg.add_text(suggestion, parent=parent, wrap=600, color=style.SECTION_LABEL)
-            dpg.add_spacer(height=4, parent=parent)
-
-    def render_tyre_limited(self, data: dict, parent: str):
-        """
-        Renders the tyre-limited warning UI (hybrid layout):
-        - Simple labels for general info
-        - No table is required for this result type
-        """
-        style = self.ctx.styles  # convenience alias
-
-        # -----------------------------------------
-        # Section Header
-        # -----------------------------------------
-        dpg.add_text("Tyre-Limited Stint Plan", parent=parent, color=style.WARNING_LABEL)
-        dpg.add_separator(parent=parent)
-
-        # -----------------------------------------
-        # Message
-        # -----------------------------------------
-        if msg := data.get("message"):
-            dpg.add_text(f"Message: {msg}", parent=parent, wrap=600)
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Max legal laps (max allowed tyre stint length)
-        # -----------------------------------------
-        if "max_stint_laps" in data:
-            dpg.add_text(
-                f"Maximum Stint Length on Tyres: {data['max_stint_laps']} laps",
-                parent=parent
-            )
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Required laps
-        # -----------------------------------------
-        if "laps_required" in data:
-            dpg.add_text(
-                f"Laps Required for Free Stop Window: {data['laps_required']} laps",
-                parent=parent
-            )
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Penultimate + Final Stint Lengths
-        # -----------------------------------------
-        if "penultimate" in data or "final" in data:
-            dpg.add_text("Critical Stint Lengths:", parent=parent)
-            with dpg.group(parent=parent, indent=8):
-                if "penultimate" in data:
-                    dpg.add_text(f"Penultimate Stint: {data['penultimate']} laps")
-                if "final" in data:
-                    dpg.add_text(f"Final Stint: {data['final']} laps")
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Total laps + remainder
-        # -----------------------------------------
-        if "total_laps" in data:
-            dpg.add_text(f"Total Laps: {data['total_laps']}", parent=parent)
-        if "remainder" in data:
-            dpg.add_text(f"Remainder After Splitting: {data['remainder']}", parent=parent)
-            dpg.add_spacer(height=4, parent=parent)
-
-        # -----------------------------------------
-        # Suggestion
-        # -----------------------------------------
-        if suggestion := data.get("suggestion"):
-            dpg.add_text(
-                f"Suggestion: {suggestion}",
-                parent=parent,
-                wrap=600,
-                color=style.SECTION_LABEL
-            )
-            dpg.add_spacer(height=4, parent=parent)
+        self.submit_strategy(initialise=True, recalculate=True)
 
     # --------------------------------------------
     # TAB ACTIONS
@@ -494,35 +425,16 @@ class CrewChiefPanel(BasePanel):
         This action initialises the UI elements based on user inputs.
         :return:
         """
-
         self.ctx.logger.info(f"Crew Chief Reporting for Duty!")
-
-        self.get_race_distance_in_laps()
-
-        self.do_pit_stop_analysis()
-
-        self.calculate_basic_stint_lengths()
-
-        self.calculate_full_race_distance_basic_strategy()
-
-        dpg.set_value("target_fuel", dpg.get_value("fuel_avg"))
-        dpg.set_value("target_pace", dpg.get_value("target_lap"))
+        self.submit_strategy(initialise=True)
 
     def calculate_strategies_action(self):
-        # Calculate the adjusted total laps based on leaders pace
-        total_laps = dpg.get_value("total_laps")
-        leader_pace = dpg.get_value("leader_pace")
-        target_pace = dpg.get_value("target_pace")
-        self.ctx.logger.info(f"Total laps: {total_laps}; leader_pace: {leader_pace}; target_pace: {target_pace}")
-        adj_total_laps = self.ps.calculate_adjusted_total_laps(total_laps, target_pace, leader_pace)
-        dpg.set_value("adjusted_total_laps", adj_total_laps)
+        self.submit_strategy(recalculate=True)
 
-        # Clear existing dynamic content from the group.
-        dpg.delete_item("full_race_distance_equal_stint_strategy", children_only=True)
-        dpg.delete_item("full_race_distance_final_stint_strategy", children_only=True)
-
-        self.calculate_full_race_distance_equal_stint_strategy()
-        self.calculate_full_race_distance_final_stint_strategy()
+    def on_input_changed(self, sender=None, app_data=None):
+        """A user edit makes any strategy still being calculated stale: drop it."""
+        if self.worker.cancel("strategy"):
+            dpg.set_value("strategy_status", "Inputs changed: calculation cancelled.")
 
     def on_save_config_action(self):
         """
@@ -557,54 +469,135 @@ class CrewChiefPanel(BasePanel):
             dpg.add_file_extension(".json", color=(255, 0, 255, 255), custom_text="[json]")
 
     # --------------------------------------------
-    # STRATEGY CALLS
+    # STRATEGY JOBS
+    # The maths runs on the StrategyWorker against a snapshot of the inputs (a "sheet"
+    # of tag → value); only apply_strategy() touches dpg, on the render thread.
+    # --------------------------------------------
+    def collect_inputs(self) -> dict:
+        """Snapshot every cell of the tab (render / callback thread)."""
+        return {tag: dpg.get_value(tag) for tag in self.tags}
+
+    def submit_strategy(self, initialise: bool = False, recalculate: bool = False):
+        """Calculate on the worker; a newer submission (or an input edit) cancels this one."""
+        sheet = self.collect_inputs()
+
+        def job(cancelled):
+            return self.compute_strategy(sheet, initialise, recalculate, cancelled)
+
+        def on_result(result, generation):
+            if self.publish is not None:
+                self.publish({"strategy": (result, generation)})
+
+        self.worker.submit("strategy", job, on_result)
+        dpg.set_value("strategy_status", "Calculating...")
+
+    def compute_strategy(self, sheet: dict, initialise: bool, recalculate: bool, cancelled):
+        """
+        Run the requested steps against the sheet (worker thread, no dpg calls).
+        Returns {"values": {tag: new value}, "groups": {group tag: renderable}, "plans": candidates,
+        "setup": LiveReplanner setup (when recalculated)}
+        or None once cancelled.
+        """
+        inputs = dict(sheet)
+        groups = {}
+        plans = {}
+        setup = None
+
+        if initialise:
+            self.get_race_distance_in_laps(sheet)
+            self.do_pit_stop_analysis(sheet)
+            self.calculate_basic_stint_lengths(sheet)
+            self.calculate_full_race_distance_basic_strategy(sheet)
+
+            sheet["target_fuel"] = sheet["fuel_avg"]
+            sheet["target_pace"] = sheet["target_lap"]
+
+        if recalculate:
+            # Calculate the adjusted total laps based on leaders pace
+            total_laps = float(sheet["total_laps"])
+            self.ctx.logger.info(f"Total laps: {total_laps}; leader_pace: {sheet['leader_pace']}; "
+                                 f"target_pace: {sheet['target_pace']}")
+            sheet["adjusted_total_laps"] = self.ps.calculate_adjusted_total_laps(
+                total_laps, sheet["target_pace"], sheet["leader_pace"])
+
+            for group, calculate in (
+                    ("full_race_distance_equal_stint_strategy", self.calculate_full_race_distance_equal_stint_strategy),
+                    ("full_race_distance_final_stint_strategy", self.calculate_full_race_distance_final_stint_strategy),
+                    ("optimised_stint_strategy", self.calculate_optimised_stint_strategy)):
+                if cancelled():
+                    return None
+                groups[group] = calculate(sheet, plans)
+
+            setup = self.build_race_setup(sheet)
+        if cancelled():
+            return None
+
+        values = {tag: value for tag, value in sheet.items() if inputs.get(tag) != value}
+        return {"values": values, "groups": groups, "plans": plans, "setup": setup}
+
+    def apply_strategy(self, result: dict, generation: int):
+        """Write a finished calculation into the tab (render thread); stale results are dropped."""
+        if not self.worker.is_current("strategy", generation):
+            return
+
+        for tag, value in result["values"].items():
+            dpg.set_value(tag, value)
+
+        for group, renderable in result["groups"].items():
+            if group in self.rendered_groups and self.rendered_groups[group] == renderable:
+                continue
+            self.rendered_groups[group] = renderable
+            self.grids[group].update(renderable)
+
+        if result["groups"]:
+            self.candidate_plans = result["plans"]
+        if result["setup"] and self.replanner is not None:
+            self.replanner.configure(result["setup"])
+        dpg.set_value("strategy_status", "")
+
+    # --------------------------------------------
+    # STRATEGY CALLS (worker thread: read and write the sheet, never dpg)
     # --------------------------------------------
     @staticmethod
-    def get_total_laps():
-        if dpg.get_value("use_adjusted_laps"):
-            total_laps = dpg.get_value("adjusted_total_laps")
+    def get_total_laps(sheet: dict):
+        if sheet["use_adjusted_laps"]:
+            total_laps = sheet["adjusted_total_laps"]
         else:
-            total_laps = dpg.get_value("total_laps")
-        if dpg.get_value("include_lap_margin"):
-            total_laps += dpg.get_value("lap_margin")
+            total_laps = float(sheet["total_laps"])
+        if sheet["include_lap_margin"]:
+            total_laps += sheet["lap_margin"]
         return total_laps
 
-    def get_race_distance_in_laps(self):
-        race_mode = dpg.get_value("race_mode").lower()
+    def get_race_distance_in_laps(self, sheet: dict):
+        race_mode = sheet["race_mode"].lower()
 
         if race_mode == "time":
-            race_length_mins = dpg.get_value("race_length_mins")
-            target_lap = dpg.get_value("target_lap")
-            no_of_laps = self.ps.calculate_total_laps_on_time(race_length_mins, target_lap)
+            no_of_laps = self.ps.calculate_total_laps_on_time(sheet["race_length_mins"], sheet["target_lap"])
 
         # Set the no of laps we expect to complete based on race distance
         elif race_mode == "distance":
-            race_distance = dpg.get_value("race_distance")
-            lap_length = dpg.get_value("lap_length")
-            no_of_laps = self.ps.calculate_total_laps_on_distance(race_distance, lap_length)
+            no_of_laps = self.ps.calculate_total_laps_on_distance(sheet["race_distance"], sheet["lap_length"])
 
         else:
-            no_of_laps = dpg.get_value("race_length_laps")
+            no_of_laps = sheet["race_length_laps"]
 
-        dpg.set_value("total_laps", no_of_laps)
+        sheet["total_laps"] = str(no_of_laps)
         self.ctx.logger.info(f"Total Race Laps = {no_of_laps} based on Race Mode = {race_mode}")
 
-    def do_pit_stop_analysis(self):
+    def do_pit_stop_analysis(self, sheet: dict):
         # Get the Pit Lane report based on manual observations
-        tpt = dpg.get_value("total_pit_time")
-        st = dpg.get_value("service_time")
-        tc = dpg.get_value("tank_capacity")
-        tct = dpg.get_value("tyre_change_time")
-        af = dpg.get_value("fuel_avg")
-        pll, rr, tcli, tcla = self.ps.get_pit_stop_report(tpt, st, tc, tct, af)
-        dpg.set_value("pit_lane_loss", pll)
-        dpg.set_value("refuelling_rate", f"{rr:.3f}")
-        dpg.set_value("tyre_change_litres", f"{tcli:.3f}")
-        dpg.set_value("tyre_change_laps", f"{tcla:.3f}")
-
-    def calculate_basic_stint_lengths(self):
+        pll, rr, tcli, tcla = self.ps.get_pit_stop_report(
+            sheet["total_pit_time"], sheet["service_time"], sheet["tank_capacity"],
+            sheet["tyre_change_time"], sheet["fuel_avg"])
+        sheet["pit_lane_loss"] = pll
+        # Float cells: values, not preformatted strings
+        sheet["refuelling_rate"] = round(rr, 3)
+        sheet["tyre_change_litres"] = round(tcli, 3)
+        sheet["tyre_change_laps"] = round(tcla, 3)
+
+    def calculate_basic_stint_lengths(self, sheet: dict):
         # Calculate the no of laps per stint based on expected fuel usage
-        total_fuel = dpg.get_value("tank_capacity")
+        total_fuel = sheet["tank_capacity"]
         fuel_to_stila = {
             "fuel_min": "basic_lps_min",
             "fuel_avg": "basic_lps_avg",
@@ -612,19 +605,18 @@ class CrewChiefPanel(BasePanel):
         }
 
         for fuel_tag, stila_tag in fuel_to_stila.items():
-            fuel_lap = dpg.get_value(fuel_tag)
-            laps = self.ps.calculate_laps_in_tank(total_fuel, fuel_lap)
-            dpg.set_value(stila_tag, f"{laps:.3f}")
+            laps = self.ps.calculate_laps_in_tank(total_fuel, sheet[fuel_tag])
+            sheet[stila_tag] = round(laps, 3)
 
-    def calculate_full_race_distance_basic_strategy(self):
+    def calculate_full_race_distance_basic_strategy(self, sheet: dict):
         """ Basic Strategy assumes that the team completes all 173 laps regardless of their finishing position.
             It maximises stint length based on fuel usage.
 
         :return:
         """
-        total_laps = round(dpg.get_value("total_laps"),1) + round(dpg.get_value("lap_margin"),1)
+        total_laps = round(float(sheet["total_laps"]),1) + round(sheet["lap_margin"],1)
 
-        tank_capacity = round(dpg.get_value("tank_capacity"),3)
+        tank_capacity = round(sheet["tank_capacity"],3)
 
         fuel_usage_modes = [("min", "fuel_min"), ("avg", "fuel_avg"), ("max", "fuel_max"), ]
 
@@ -632,7 +624,7 @@ class CrewChiefPanel(BasePanel):
 
         # For each of the fuel/lap usage levels
         for label, fuel_tag in fuel_usage_modes:
-            fuel_lap = round(dpg.get_value(fuel_tag),3)
+            fuel_lap = round(sheet[fuel_tag],3)
 
             # Get the number of laps completed when fuel use is as specified
             stint_laps = self.ps.max_stint_laps(tank_capacity, fuel_lap)
@@ -642,72 +634,167 @@ class CrewChiefPanel(BasePanel):
             self.ctx.logger.info(f"Stint Plan: {stint_plan}")
 
             # Populate UI fields
-            dpg.set_value(f"basic_stops_{label}", stint_plan["stops"])
-            dpg.set_value(f"basic_last_stint_{label}", stint_plan["last_stint_laps"])
+            sheet[f"basic_stops_{label}"] = stint_plan["stops"]
+            sheet[f"basic_last_stint_{label}"] = stint_plan["last_stint_laps"]
 
-    def calculate_full_race_distance_equal_stint_strategy(self):
+    def calculate_full_race_distance_equal_stint_strategy(self, sheet: dict, plans: dict):
         """ Basic Equal Stint Strategy assumes that the team completes all 173 laps regardless of their finishing position.
             This strategy equalises the stints to avoid any 'splash and dash' at the end.
-        :return:
+        :return: what to render in the group
         """
-
-        total_laps = self.get_total_laps()
-        tank_capacity = dpg.get_value("tank_capacity")
-        tyre_change_litres = dpg.get_value("tyre_change_litres")
-        target_fuel = dpg.get_value("target_fuel")
-
         stint_array = self.ps.calculate_equal_stint_plan(
-            total_laps=int(total_laps),
-            tank_capacity=float(tank_capacity),
-            fuel_per_lap=float(target_fuel),
-            tyre_change_litres=float(tyre_change_litres)
+            total_laps=int(self.get_total_laps(sheet)),
+            tank_capacity=float(sheet["tank_capacity"]),
+            fuel_per_lap=float(sheet["target_fuel"]),
+            tyre_change_litres=float(sheet["tyre_change_litres"])
         )
 
         if stint_array.get("status") == "passed":
-            # Build the stint grid plan and then build into the group.
-            stint_grid_plan = self.build_stint_plan_grid("Uniform Stint Plan", "frdess", stint_array)
-            with dpg.group(parent="full_race_distance_equal_stint_strategy"):
-                self.build_input_grid(stint_grid_plan, columns=3)
-
-        elif stint_array.get("status") == "fuel_limited":
-            with dpg.group(parent="full_race_distance_equal_stint_strategy"):
-                self.render_fuel_limited(stint_array, parent=dpg.last_item())
-        else:
-            self.ctx.logger.warning(f"Unknown stint calculation error: {stint_array.get('status')}")
+            plans["Uniform"] = stint_array
+            return "plan", "Uniform Stint Plan", stint_array
+
+        if stint_array.get("status") == "fuel_limited":
+            return "fuel_limited", stint_array
+
+        self.ctx.logger.warning(f"Unknown stint calculation error: {stint_array.get('status')}")
+        return None
 
-    def calculate_full_race_distance_final_stint_strategy(self):
+    def calculate_full_race_distance_final_stint_strategy(self, sheet: dict, plans: dict):
         """ Basic Final Stint strategy assumes that the team completes all 173 laps regardless of their finishing position.
             But equalises the final two stints to reduce the risk of a 'splash and dash' at the end.
             However, it maximises stint lengths during the bulk of the race."""
 
-        total_laps = self.get_total_laps()
-        tank_capacity = dpg.get_value("tank_capacity")
-        tyre_change_litres = dpg.get_value("tyre_change_litres")
-        target_fuel = dpg.get_value("target_fuel")
-
         # Build a stint array based on maximum stints except last two which are equalised
         stint_array = self.ps.calculate_final_stint_plan(
-            total_laps=int(total_laps),
-            tank_capacity=float(tank_capacity),
-            fuel_per_lap=float(target_fuel),
-            tyre_change_litres=float(tyre_change_litres)
+            total_laps=int(self.get_total_laps(sheet)),
+            tank_capacity=float(sheet["tank_capacity"]),
+            fuel_per_lap=float(sheet["target_fuel"]),
+            tyre_change_litres=float(sheet["tyre_change_litres"])
         )
 
         if stint_array.get("status") == "passed":
-            # Build the stint grid plan and then build into the group.
-            stint_grid_plan = self.build_stint_plan_grid("Equal Final Plan", "frdfss", stint_array)
-            with dpg.group(parent="full_race_distance_final_stint_strategy"):
-                self.build_input_grid(stint_grid_plan, columns=3)
-
-        elif stint_array.get("status") == "fuel_limited":
-            with dpg.group(parent="full_race_distance_final_stint_strategy"):
-                self.render_fuel_limited(stint_array, parent=dpg.last_item())
-
-        elif stint_array.get("status") == "tyre_limited":
-            with dpg.group(parent="full_race_distance_final_stint_strategy"):
-                self.render_tyre_limited(stint_array, parent=dpg.last_item())
-        else:
-            self.ctx.logger.warning(f"Unknown stint calculation error: {stint_array.get('status')}")
+            plans["Equal Final"] = stint_array
+            return "plan", "Equal Final Plan", stint_array
+
+        if stint_array.get("status") in ("fuel_limited", "tyre_limited"):
+            return stint_array["status"], stint_array
+
+        self.ctx.logger.warning(f"Unknown stint calculation error: {stint_array.get('status')}")
+        return None
+
+    def calculate_optimised_stint_strategy(self, sheet: dict, plans: dict):
+        """ Optimal Stint strategy searches every legal split of the race (PitStrategist.optimise_stint_plans)
+            and shows the fastest plan plus the best plan of the other stop counts, ranked by race time.
+            "Stop Counts to Rank" is the number of stop counts compared (one plan each), not of plans."""
+
+        # Search enough stop counts to rank as many as requested
+        stop_counts = max(1, sheet["stop_counts"])
+        ranked = self.ps.optimise_stint_plans(
+            total_laps=int(self.get_total_laps(sheet)),
+            tank_capacity=float(sheet["tank_capacity"]),
+            fuel_per_lap=float(sheet["target_fuel"]),
+            lap_time=float(sheet["target_pace"]),
+            pit_lane_loss=float(sheet["pit_lane_loss"]),
+            refuelling_rate=float(sheet["refuelling_rate"]),
+            tyre_change_litres=float(sheet["tyre_change_litres"]),
+            degradation=float(sheet["tyre_degradation"]),
+            stop_counts=stop_counts,
+            max_extra_stops=max(4, stop_counts - 1),
+            change_tyres=sheet["change_tyres"],
+        )
+        if not ranked:
+            self.ctx.logger.warning("No optimised stint plan (check fuel per lap and tank capacity).")
+            return None
+
+        for plan in ranked:
+            plans[f"Optimal {plan['stops']} stops"] = plan
+        return "ranked", ranked
+
+    # --------------------------------------------
+    # MONTE CARLO SIMULATION
+    # --------------------------------------------
+    def build_race_setup(self, sheet: dict) -> dict:
+        """The sheet's pit and car numbers, for LiveReplanner.configure()."""
+        return {
+            "tank_capacity": float(sheet["tank_capacity"]),
+            "fuel_per_lap": float(sheet["target_fuel"]),
+            "lap_time": float(sheet["target_pace"]),
+            "pit_lane_loss": float(sheet["pit_lane_loss"]),
+            "refuelling_rate": float(sheet["refuelling_rate"]),
+            "tyre_change_litres": float(sheet["tyre_change_litres"]),
+            "degradation": float(sheet["tyre_degradation"]),
+            "change_tyres": sheet["change_tyres"],
+        }
+
+    def build_race_model(self, sheet: dict) -> RaceModel:
+        return RaceModel(
+            total_laps=int(self.get_total_laps(sheet)),
+            tank_capacity=float(sheet["tank_capacity"]),
+            fuel_per_lap=float(sheet["target_fuel"]),
+            lap_time=float(sheet["target_pace"]),
+            pit_lane_loss=float(sheet["pit_lane_loss"]),
+            refuelling_rate=float(sheet["refuelling_rate"]),
+            tyre_change_litres=float(sheet["tyre_change_litres"]),
+            degradation=float(sheet["tyre_degradation"]),
+            change_tyres=sheet["change_tyres"],
+            fuel_sd=float(sheet["sim_fuel_sd"]),
+            lap_time_sd=float(sheet["sim_lap_time_sd"]),
+            service_sd=float(sheet["sim_service_sd"]),
+            caution_probability=float(sheet["sim_caution_pct"]) / 100,
+            fuel_margin=float(sheet["sim_fuel_margin"]),
+        )
+
+    def on_simulate_action(self):
+        """Race every candidate plan of the last Recalculate on the strategy worker."""
+        if not self.candidate_plans:
+            dpg.set_value("simulation_status", "No plans yet: press Recalculate first.")
+            return
+
+        names = list(self.candidate_plans)
+        plans = [self.candidate_plans[name] for name in names]
+        runs = max(1, dpg.get_value("sim_runs"))
+        model = self.build_race_model(self.collect_inputs())
+
+        def job(cancelled):
+            summaries = self.simulator.run(model, plans, runs, cancelled=cancelled)
+            if summaries is None:
+                return None
+            for name, summary in zip(names, summaries):
+                summary["name"] = name
+            return summaries
+
+        def on_result(summaries, generation):
+            if self.publish is not None:
+                self.publish({"simulation": (summaries, generation)})
+
+        self.worker.submit("simulation", job, on_result)
+        dpg.set_value("simulation_status", f"Simulating {len(plans)} plans x {runs} runs...")
+
+    def render_simulation_results(self, summaries: list, generation: int):
+        """Finishing time distribution and fuel-out risk of each simulated plan, fastest median first."""
+        if not self.worker.is_current("simulation", generation):
+            return
+
+        dpg.delete_item("simulation_results", children_only=True)
+        dpg.set_value("simulation_status", f"Simulated {len(summaries)} plans.")
+        if not summaries:
+            return
+
+        summaries = sorted(summaries, key=lambda summary: summary["p50"])
+        best = summaries[0]["p50"]
+        with dpg.table(parent="simulation_results", header_row=True, borders_innerH=True, borders_innerV=True,
+                       borders_outerH=True, borders_outerV=True):
+            for label in ("Plan", "Stops", "Median (s)", "Delta (s)", "P10 (s)", "P90 (s)", "Fuel-Out Risk"):
+                dpg.add_table_column(label=label)
+            for summary in summaries:
+                with dpg.table_row():
+                    dpg.add_text(summary.get("name", ""))
+                    dpg.add_text(str(summary["stops"]))
+                    dpg.add_text(f"{summary['p50']:.1f}")
+                    dpg.add_text(f"+{summary['p50'] - best:.1f}")
+                    dpg.add_text(f"{summary['p10']:.1f}")
+                    dpg.add_text(f"{summary['p90']:.1f}")
+                    dpg.add_text(f"{summary['fuel_out_risk']:.1%}")
 
     # --------------------------------------------
     # SAVE/LOAD ACTIONS
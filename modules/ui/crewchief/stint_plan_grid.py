@@ -0,0 +1,260 @@
+import dearpygui.dearpygui as dpg
+
+from modules.ui.base_widget import BaseWidget
+
+
+class StintPlanGrid(BaseWidget):
+    """
+    One Crew Chief strategy result, drawn into items built once.
+
+    Every view a strategy group can show (a stint plan, the ranked optimiser plans,
+    the fuel-limited and the tyre-limited warnings) is preallocated at build time
+    with MAX_STINTS stint rows and MAX_RANKED ranking rows, hidden until needed.
+    update() then only sets values and shows / hides rows and views, so a
+    recalculation never deletes or creates DearPyGui items (no allocation churn,
+    no flicker). A plan with more stints than the pool grows it once.
+    """
+
+    TAG = "stint_plan_grid"
+
+    MAX_STINTS = 40         # a 24h race with 30+ stops still fits the preallocated rows
+    MAX_RANKED = 10
+    CELL_WIDTH = 180
+    WRAP = 600
+
+    def __init__(self, ctx, prefix=None, show_header=False):
+        super().__init__(ctx, prefix, show_header)
+
+        self.views = {kind: f"{self.section_tag}_{kind}" for kind in ("plan", "ranked", "fuel_limited", "tyre_limited")}
+        self.stint_table = f"{self.section_tag}_stints"
+        self.ranked_table = f"{self.section_tag}_ranked_table"
+        self.illegal_table = f"{self.section_tag}_illegal_table"
+
+        # Pool sizes (rows built so far)
+        self.stint_rows = 0
+        self.ranked_rows = 0
+        self.illegal_rows = 0
+
+        self.shown = None
+
+    # -----------------------
+    # Build (once)
+    # -----------------------
+    def inner_build(self):
+        with dpg.group(tag=self.section_tag):
+            with dpg.group(tag=self.views["plan"], show=False):
+                self.build_plan_view()
+            with dpg.group(tag=self.views["ranked"], show=False):
+                self.build_ranked_view()
+            with dpg.group(tag=self.views["fuel_limited"], show=False):
+                self.build_fuel_limited_view()
+            with dpg.group(tag=self.views["tyre_limited"], show=False):
+                self.build_tyre_limited_view()
+
+    def build_plan_view(self):
+        with dpg.table(tag=self.stint_table, header_row=False, borders_innerH=True, borders_innerV=True,
+                       borders_outerH=True, borders_outerV=True, policy=dpg.mvTable_SizingStretchProp):
+            for _ in range(3):
+                dpg.add_table_column(width_fixed=True)
+
+            with dpg.table_row():
+                dpg.add_text("", tag=self.tag("name"))
+                dpg.add_text("", tag=self.tag("total_laps"))
+                dpg.add_text("")
+
+            with dpg.table_row():
+                for key, label in (("total_stints", "Total Stints"), ("total_stops", "Total Stops"),
+                                   ("free_tyre_laps", "Free Tyre Laps")):
+                    with dpg.group():
+                        dpg.add_text(label)
+                        dpg.add_input_text(tag=self.tag(key), readonly=True, width=self.CELL_WIDTH)
+
+            with dpg.table_row():
+                for text in ("Per-Stint Breakdown", "Laps", "Fuel (l)"):
+                    dpg.add_text(text)
+
+        self.add_stint_rows(self.MAX_STINTS)
+
+    def build_ranked_view(self):
+        dpg.add_text("Best Plan per Stop Count", color=self.ctx.styles.SECTION_LABEL)
+        with dpg.table(tag=self.ranked_table, header_row=True, borders_innerH=True, borders_innerV=True,
+                       borders_outerH=True, borders_outerV=True):
+            for label in ("Stops", "Race Time (s)", "Delta (s)", "Pit Time (s)"):
+                dpg.add_table_column(label=label)
+        self.add_pooled_rows(self.ranked_table, "ranked", self.ranked_rows, self.MAX_RANKED, 4)
+        self.ranked_rows = self.MAX_RANKED
+
+    def build_fuel_limited_view(self):
+        style = self.ctx.styles
+        dpg.add_text("Fuel-Limited Stint Plan", color=style.WARNING_LABEL)
+        dpg.add_separator()
+        dpg.add_text("", tag=self.tag("fuel_message"))
+        dpg.add_text("", tag=self.tag("fuel_max_laps"))
+        dpg.add_text("Illegal Stints:", tag=self.tag("illegal_label"))
+        with dpg.table(tag=self.illegal_table, header_row=True, borders_innerH=True, borders_innerV=True,
+                       borders_outerH=True, borders_outerV=True):
+            for label in ("Stint", "Planned Laps", "Fuel Save Needed"):
+                dpg.add_table_column(label=label)
+        self.add_pooled_rows(self.illegal_table, "illegal", self.illegal_rows, self.MAX_STINTS, 3)
+        self.illegal_rows = self.MAX_STINTS
+        dpg.add_text("", tag=self.tag("fuel_suggestion"), wrap=self.WRAP, color=style.SECTION_LABEL)
+
+    def build_tyre_limited_view(self):
+        style = self.ctx.styles
+        dpg.add_text("Tyre-Limited Stint Plan", color=style.WARNING_LABEL)
+        dpg.add_separator()
+        dpg.add_text("", tag=self.tag("tyre_message"), wrap=self.WRAP)
+        dpg.add_text("", tag=self.tag("tyre_max_laps"))
+        dpg.add_text("", tag=self.tag("laps_required"))
+        dpg.add_text("Critical Stint Lengths:", tag=self.tag("critical_label"))
+        with dpg.group(indent=8):
+            dpg.add_text("", tag=self.tag("penultimate"))
+            dpg.add_text("", tag=self.tag("final"))
+        dpg.add_text("", tag=self.tag("tyre_total_laps"))
+        dpg.add_text("", tag=self.tag("remainder"))
+        dpg.add_text("", tag=self.tag("tyre_suggestion"), wrap=self.WRAP, color=style.SECTION_LABEL)
+
+    def add_stint_rows(self, count: int):
+        for row in range(self.stint_rows, count):
+            with dpg.table_row(parent=self.stint_table, tag=self.row_tag("stint", row), show=False):
+                dpg.add_text(f"Stint {row + 1}")
+                dpg.add_input_text(tag=self.cell_tag("stint", row, 1), readonly=True, width=self.CELL_WIDTH)
+                dpg.add_input_text(tag=self.cell_tag("stint", row, 2), readonly=True, width=self.CELL_WIDTH)
+        self.stint_rows = max(self.stint_rows, count)
+
+    def add_pooled_rows(self, table: str, name: str, start: int, count: int, columns: int):
+        for row in range(start, count):
+            with dpg.table_row(parent=table, tag=self.row_tag(name, row), show=False):
+                for col in range(columns):
+                    dpg.add_text("", tag=self.cell_tag(name, row, col))
+
+    # -----------------------
+    # Tags
+    # -----------------------
+    def tag(self, key: str) -> str:
+        return f"{self.section_tag}_{key}"
+
+    def row_tag(self, name: str, row: int) -> str:
+        return f"{self.section_tag}_{name}_row_{row}"
+
+    def cell_tag(self, name: str, row: int, col: int) -> str:
+        return f"{self.section_tag}_{name}_{row}_{col}"
+
+    # -----------------------
+    # Update (render thread)
+    # -----------------------
+    def update(self, renderable: tuple | None):
+        """
+        Show a strategy result: ("plan", name, plan), ("ranked", plans),
+        ("fuel_limited", data), ("tyre_limited", data) or None to show nothing.
+        """
+        kind = renderable[0] if renderable else None
+
+        if kind == "plan":
+            self.set_plan(*renderable[1:])
+        elif kind == "ranked":
+            plans = renderable[1]
+            self.set_plan("Optimal Plan", plans[0])
+            self.set_ranked(plans)
+        elif kind == "fuel_limited":
+            self.set_fuel_limited(renderable[1])
+        elif kind == "tyre_limited":
+            self.set_tyre_limited(renderable[1])
+        elif kind is not None:
+            self.ctx.logger.warning(f"[StintPlanGrid] Unknown strategy result: {kind}")
+
+        # The ranked view sits under the plan view
+        visible = {"plan", "ranked"} if kind == "ranked" else {kind}
+        for view, tag in self.views.items():
+            dpg.configure_item(tag, show=view in visible)
+        self.shown = kind
+
+    def set_plan(self, name: str, plan: dict):
+        dpg.set_value(self.tag("name"), name)
+        dpg.set_value(self.tag("total_laps"), f"{sum(plan['stint_laps'])} Total Laps")
+        dpg.set_value(self.tag("total_stints"), str(plan["stints"]))
+        dpg.set_value(self.tag("total_stops"), str(plan["stops"]))
+        dpg.set_value(self.tag("free_tyre_laps"), str(plan["laps_for_free_tyres"]))
+
+        stints = plan.get("stints", 0)
+        if stints > self.stint_rows:
+            self.add_stint_rows(stints)
+
+        for row in range(self.stint_rows):
+            shown = row < stints
+            if shown:
+                dpg.set_value(self.cell_tag("stint", row, 1), str(plan["stint_laps"][row]))
+                dpg.set_value(self.cell_tag("stint", row, 2), str(plan["fuel_requirements"][row]))
+            dpg.configure_item(self.row_tag("stint", row), show=shown)
+
+    def set_ranked(self, plans: list):
+        if len(plans) > self.ranked_rows:
+            self.add_pooled_rows(self.ranked_table, "ranked", self.ranked_rows, len(plans), 4)
+            self.ranked_rows = len(plans)
+
+        self.set_rows("ranked", self.ranked_rows, [
+            (str(plan["stops"]), f"{plan['total_time']:.1f}", f"+{plan['delta']:.1f}", f"{plan['pit_time']:.1f}")
+            for plan in plans
+        ])
+
+    def set_fuel_limited(self, data: dict):
+        message = data.get("message")
+        self.set_text("fuel_message", f"Message: {message}" if message else None)
+
+        max_laps = data.get("max_legal_laps", data.get("max_stint_laps"))
+        self.set_text("fuel_max_laps", f"Maximum Allowed per Stint: {max_laps} laps" if max_laps is not None else None)
+
+        illegal = data.get("illegal_stints", [])
+        if len(illegal) > self.illegal_rows:
+            self.add_pooled_rows(self.illegal_table, "illegal", self.illegal_rows, len(illegal), 3)
+            self.illegal_rows = len(illegal)
+
+        dpg.configure_item(self.tag("illegal_label"), show=bool(illegal))
+        dpg.configure_item(self.illegal_table, show=bool(illegal))
+        self.set_rows("illegal", self.illegal_rows, [
+            (f"Stint {entry['stint']}", str(entry["laps"]), f"-{entry['fuel_saving_required']} laps")
+            for entry in illegal
+        ])
+
+        suggestion = data.get("suggestion")
+        self.set_text("fuel_suggestion", f"Suggestion: {suggestion}" if suggestion else None)
+
+    def set_tyre_limited(self, data: dict):
+        message = data.get("message")
+        self.set_text("tyre_message", f"Message: {message}" if message else None)
+        self.set_text("tyre_max_laps", f"Maximum Stint Length on Tyres: {data['max_stint_laps']} laps"
+                      if "max_stint_laps" in data else None)
+        self.set_text("laps_required", f"Laps Required for Free Stop Window: {data['laps_required']} laps"
+                      if "laps_required" in data else None)
+
+        dpg.configure_item(self.tag("critical_label"), show="penultimate" in data or "final" in data)
+        self.set_text("penultimate", f"Penultimate Stint: {data['penultimate']} laps" if "penultimate" in data else None)
+        self.set_text("final", f"Final Stint: {data['final']} laps" if "final" in data else None)
+
+        self.set_text("tyre_total_laps", f"Total Laps: {data['total_laps']}" if "total_laps" in data else None)
+        self.set_text("remainder", f"Remainder After Splitting: {data['remainder']}" if "remainder" in data else None)
+
+        suggestion = data.get("suggestion")
+        self.set_text("tyre_suggestion", f"Suggestion: {suggestion}" if suggestion else None)
+
+    def set_text(self, key: str, text: str | None):
+        """Set a text item, hiding it when there is nothing to say."""
+        tag = self.tag(key)
+        if text is None:
+            dpg.configure_item(tag, show=False)
+        else:
+            dpg.set_value(tag, text)
+            dpg.configure_item(tag, show=True)
+
+    def set_rows(self, name: str, pool: int, rows: list):
+        """Fill the first len(rows) pooled rows and hide the rest."""
+        for row in range(pool):
+            shown = row < len(rows)
+            if shown:
+                for col, text in enumerate(rows[row]):
+                    dpg.set_value(self.cell_tag(name, row, col), text)
+            dpg.configure_item(self.row_tag(name, row), show=shown)
+
+    def apply_themes(self):
+        """Cells keep the default look of the input grids this replaced (no section theme)."""
+        pass
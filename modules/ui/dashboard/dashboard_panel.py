@@ -5,11 +5,30 @@ from modules.ui.base_panel import BasePanel
 from modules.ui.dashboard.session_widget import SessionWidget
 from modules.ui.dashboard.weather_widget import WeatherWidget
 from modules.ui.dashboard.pitstop_widget import PitStopWidget
+from modules.ui.dashboard.replay_widget import ReplayWidget
+from modules.ui.dashboard.strategy_widget import StrategyWidget
 from modules.ui.dashboard.tyre_widget import TyreWidget
 
 class DashPanel(BasePanel):
     LABEL = "Dashboard"
 
+    # Session and weather refresh at most every 30s while the dashboard is visible
+    TELEMETRY = {
+        "session": {
+            "variables": ("SessionTimeOfDay", "SessionTime", "SessionTimeRemain",
+                          "SessionLapsTotal", "SessionLapsRemainEx"),
+            "rate_hz": 1 / 30,
+        },
+        "weather": {
+            "variables": ("AirTemp", "RelativeHumidity", "TrackTempCrew", "AirDensity", "AirPressure",
+                          "FogLevel", "Skies", "Precipitation", "WindDir", "WindVel",
+                          "TrackWetness", "WeatherDeclaredWet"),
+            "rate_hz": 1 / 30,
+        },
+    }
+
+    # Jump controls, only shown when playing back a capture
+    replay_widget = None
 
     def __init__(self, ctx):
         super().__init__(ctx)
@@ -20,14 +39,22 @@ class DashPanel(BasePanel):
         self.session_widget = SessionWidget(ctx)
         self.weather_widget = WeatherWidget(ctx)
         self.pit_widget = PitStopWidget(ctx)
+        self.strategy_widget = StrategyWidget(ctx)
         self.tyre_widget = TyreWidget(ctx)
 
+    def set_replay(self, replay):
+        """Show the replay jump controls for a ReplayIRSDK (call before build)."""
+        self.replay_widget = ReplayWidget(self.ctx, replay)
+
     # -------------------------------------------------------
     # BUILD UI
     # -------------------------------------------------------
     def build(self):
         with dpg.tab(label=self.LABEL, tag=self.root_tag):
 
+            if self.replay_widget:
+                self.replay_widget.build()
+
             with dpg.group(tag="dashboard_top_section"):
                 with dpg.table(header_row=False, policy=dpg.mvTable_SizingStretchSame  ):
                     dpg.add_table_column()  # left column
@@ -41,6 +68,7 @@ class DashPanel(BasePanel):
                             # dpg.add_text("Weather")
                             self.weather_widget.build()
             # Bottom section
+            self.strategy_widget.build()
             self.pit_widget.build()
             self.tyre_widget.build()
 
@@ -52,18 +80,22 @@ class DashPanel(BasePanel):
         :param update_data:
         :return:
         """
+        profiler = self.ctx.profiler
         try:
             # self.ctx.logger.info(f"Dashboard Panel Updates: {update_data}")
 
+            # Format every part first (ui.dashboard.format), then push to the widgets (the dpg calls)
+            span = profiler.start()
+            formatted = []
+
             if update_data.get("session_data") is not None:
-                formatted_session_data = self.format_session_data(update_data["session_data"])
-                # self.ctx.logger.debug(formatted_session_data)
-                self.session_widget.update(formatted_session_data)
+                formatted.append((self.session_widget, self.format_session_data(update_data["session_data"])))
 
             if update_data.get("weather_data") is not None:
-                formatted_weather_data = self.format_weather_data(update_data['weather_data'])
-                # self.ctx.logger.debug(update_data['weather_data'])
-                self.weather_widget.update(formatted_weather_data)
+                formatted.append((self.weather_widget, self.format_weather_data(update_data['weather_data'])))
+
+            if update_data.get("strategy_data") is not None:
+                formatted.append((self.strategy_widget, self.format_strategy_data(update_data["strategy_data"])))
 
             if update_data.get("pit_data") is not None:
 
@@ -72,8 +104,7 @@ class DashPanel(BasePanel):
                 # self.ctx.logger.debug(pit_data)
 
                 # --- PIT STOP MAIN DATA ---
-                formatted_pit_data = self.format_pit_stop_data(pit_data)
-                self.pit_widget.update(formatted_pit_data)
+                formatted.append((self.pit_widget, self.format_pit_stop_data(pit_data)))
 
                 # --- TYRE DATA (if available) ---
                 tyre_usage = pit_data.get("tyre_usage")
@@ -84,8 +115,12 @@ class DashPanel(BasePanel):
                         tyre_usage or {},  # safe: always a dict
                         tyre_events or {}
                     )
+                    formatted.append((self.tyre_widget, formatted_tyre_data))
+
+            profiler.stop("ui.dashboard.format", span)
 
-                    self.tyre_widget.update(formatted_tyre_data)
+            for widget, widget_data in formatted:
+                widget.update(widget_data)
 
         except Exception as error:
             self.ctx.logger.error(f"[DashboardPanel] Update Error: {error}")
@@ -122,6 +157,32 @@ class DashPanel(BasePanel):
         }
         return formatted
 
+    def format_strategy_data(self, strategy_data):
+        # No plan: a replay seek or a new session cleared the last one
+        if not strategy_data:
+            formatted = {key: "---" for key in self.strategy_widget.tags}
+            formatted['next_stop'] = None
+            return formatted
+
+        f = self.format
+        next_stop_lap = strategy_data.get("next_stop_lap")
+
+        formatted = {
+            'next_stop_lap': f.make_int_string(next_stop_lap) if next_stop_lap is not None else "---",
+            'fuel_to_add': f.make_float_string(strategy_data.get('fuel_to_add', 0.0), "l"),
+            'stops': f.make_int_string(strategy_data.get('stops', 0)),
+            'planned_on_lap': f.make_int_string(strategy_data.get('lap', 0)),
+
+            'laps_remaining': f.make_int_string(strategy_data.get('laps_remaining', 0)),
+            'fuel_level': f.make_float_string(strategy_data.get('fuel_level', 0.0), "l"),
+            'fuel_per_lap': f.make_float_string(strategy_data.get('fuel_per_lap', 0.0), "l"),
+            'stint_laps': "-".join(str(laps) for laps in strategy_data.get('stint_laps', [])),
+
+            # Header
+            'next_stop': f"box end of lap {next_stop_lap}" if next_stop_lap is not None else "no stop needed",
+        }
+        return formatted
+
     def format_pit_stop_data(self, pit_data):
         f = self.format
 
@@ -0,0 +1,85 @@
+import dearpygui.dearpygui as dpg
+
+from modules.irace_sdk.irsdk_capture import CaptureReader
+from modules.irace_sdk.irsdk_formatter import Formatter
+from modules.ui.base_widget import BaseWidget
+
+class ReplayWidget(BaseWidget):
+    LABEL = "Replay"
+    TAG = "replay_group"
+
+    def __init__(self, ctx, replay, prefix=None, show_header=True):
+        super().__init__(ctx, prefix, show_header)
+        """
+        Jump controls for a ReplayIRSDK capture: open any lap / pit event marker
+        or SessionTime. Seeks are handed to the replay and applied by the polling thread.
+        """
+        self.replay = replay
+        self.format = Formatter(ctx)
+
+        # Marker combo label → SessionTick
+        self.marker_ticks = {}
+
+        self.tags = {
+            "Capture": f"{self.section_tag}_capture",
+            "Marker": f"{self.section_tag}_marker",
+            "SessionTime": f"{self.section_tag}_session_time",
+        }
+
+    # BUILD UI
+    def inner_build(self):
+        self.load_markers()
+
+        with dpg.group(tag=self.section_tag):
+            with dpg.table(
+                tag=self.table_tag,
+                header_row=False,
+                resizable=False,
+                policy=dpg.mvTable_SizingFixedFit,
+                borders_innerH=False,
+                borders_innerV=False,
+                borders_outerH=True,
+                borders_outerV=True
+            ):
+                dpg.add_table_column(width_fixed=True)
+                dpg.add_table_column(width_fixed=True)
+                dpg.add_table_column(width_stretch=True)
+
+                with dpg.table_row():
+                    with dpg.group():
+                        dpg.add_text("Lap / Pit Event", tag=self.label_for(self.tags["Marker"]))
+                        with dpg.group(horizontal=True):
+                            dpg.add_combo(tag=self.tags["Marker"], items=list(self.marker_ticks), width=260)
+                            dpg.add_button(label="Open", callback=self.on_open_marker)
+
+                    with dpg.group():
+                        dpg.add_text("Session Time (s)", tag=self.label_for(self.tags["SessionTime"]))
+                        with dpg.group(horizontal=True):
+                            dpg.add_input_float(tag=self.tags["SessionTime"], default_value=0.0, step=0, width=120)
+                            dpg.add_button(label="Open", callback=self.on_open_time)
+
+                    self.get_vertical_table_cell(label="Capture", key="Capture")
+
+        dpg.set_value(self.tags["Capture"], str(self.replay.path))
+
+    def load_markers(self):
+        """Read the capture's markers from its index (no telemetry is decoded)."""
+        try:
+            reader = CaptureReader(self.replay.path)
+        except (OSError, ValueError) as error:
+            self.ctx.logger.error(f"[ReplayWidget] Unable to read {self.replay.path}: {error}")
+            return
+
+        for marker in reader.markers:
+            label = f"{self.format.make_time_string(marker.session_time)}  {marker.label}"
+            self.marker_ticks[label] = marker.tick
+        reader.close()
+
+    # CALLBACKS
+    def on_open_marker(self, sender=None, app_data=None):
+        tick = self.marker_ticks.get(dpg.get_value(self.tags["Marker"]))
+        if tick is not None:
+            self.replay.request_seek(tick=tick)
+
+    def on_open_time(self, sender=None, app_data=None):
+        self.replay.request_seek(session_time=dpg.get_value(self.tags["SessionTime"]))
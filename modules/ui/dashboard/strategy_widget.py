@@ -0,0 +1,68 @@
+import dearpygui.dearpygui as dpg
+
+from modules.ui.base_widget import BaseWidget
+
+class StrategyWidget(BaseWidget):
+    LABEL = "Strategy"
+    TAG = "strategy_group"
+    CELL_WIDTH = 120
+
+    def __init__(self, ctx, prefix=None, show_header=True):
+        super().__init__(ctx, prefix, show_header)
+        """
+        Live rest-of-race plan from IRSDKService.replanner, refreshed at every lap
+        of the player car once the Crew Chief has calculated a strategy.
+
+        The header shows the next stop ("box end of lap N") or "no stop needed".
+        """
+
+        self.header_value_key = "next_stop"
+
+        # Derived tags
+        self.tags = {
+            "next_stop_lap": f"{self.section_tag}_next_stop_lap",
+            "fuel_to_add": f"{self.section_tag}_fuel_to_add",
+            "stops": f"{self.section_tag}_stops",
+
+            "laps_remaining": f"{self.section_tag}_laps_remaining",
+            "fuel_level": f"{self.section_tag}_fuel_level",
+            "fuel_per_lap": f"{self.section_tag}_fuel_per_lap",
+
+            "stint_laps": f"{self.section_tag}_stint_laps",
+            "planned_on_lap": f"{self.section_tag}_planned_on_lap",
+        }
+
+    # BUILD UI
+    def inner_build(self):
+
+        with dpg.group(tag=self.section_tag):
+            with dpg.table(
+                tag=self.table_tag,
+                header_row=False,
+                resizable=False,
+                policy=dpg.mvTable_SizingFixedFit,
+                borders_innerH=False,
+                borders_innerV=False,
+                borders_outerH=True,
+                borders_outerV=True
+            ):
+                dpg.add_table_column(width_fixed=True)
+                dpg.add_table_column(width_fixed=True)
+                dpg.add_table_column(width_fixed=True)
+                dpg.add_table_column(width_stretch=True)
+
+                # Row 1: The next stop
+                with dpg.table_row():
+                    self.get_vertical_table_cell(label="Stop Lap", key="next_stop_lap", width=self.CELL_WIDTH)
+                    self.get_vertical_table_cell(label="Fuel Add", key="fuel_to_add", width=self.CELL_WIDTH)
+                    self.get_vertical_table_cell(label="Stops Left", key="stops", width=self.CELL_WIDTH)
+                    self.get_vertical_table_cell(label="Planned", key="planned_on_lap", width=self.CELL_WIDTH)
+
+                # Row 2: What the plan is based on
+                with dpg.table_row():
+                    self.get_vertical_table_cell(label="Laps Left", key="laps_remaining")
+                    self.get_vertical_table_cell(label="Fuel Lvl", key="fuel_level")
+                    self.get_vertical_table_cell(label="Fuel/Lap", key="fuel_per_lap")
+                    self.get_vertical_table_cell(label="Stints", key="stint_laps")
+
+        dpg.bind_item_theme(self.table_tag, self.theme_tag)
@@ -0,0 +1,120 @@
+import dearpygui.dearpygui as dpg
+
+from modules.ui.base_panel import BasePanel
+
+
+class DebugPanel(BasePanel):
+    """
+    Live profiler overlay: rolling p50/p99 of every instrumented stage of the
+    polling and render loops (see modules.core.profiler), the achieved poll rate
+    and the format / stint plan cache hit rates. "Dump to File" writes the raw spans to the
+    log folder for bug reports.
+    """
+    LABEL = "Debug"
+    TAG = "debug_panel"
+
+    # Stage table rows are preallocated (like the timing table) and filled in stage name order
+    MAX_STAGES = 24
+    COLUMNS = ("Stage", "Samples", "Rate (Hz)", "Mean (ms)", "p50 (ms)", "p99 (ms)", "Max (ms)")
+    STAGE_FIELDS = ("samples", "rate_hz", "mean_ms", "p50_ms", "p99_ms", "max_ms")
+
+    # Seconds between refreshes while visible
+    REFRESH_INTERVAL = 0.5
+
+    # Last stats shown, added to dumps
+    last_data = None
+
+    def __init__(self, ctx):
+        super().__init__(ctx)
+        self.ctx = ctx
+        self.profiler = ctx.profiler
+
+        self.enable_tag = f"{self.TAG}_enable"
+        self.status_tag = f"{self.TAG}_status"
+        self.poll_rate_tag = f"{self.TAG}_poll_rate"
+        self.cache_tag = f"{self.TAG}_caches"
+        self.table_tag = f"{self.TAG}_table"
+
+    # -------------------------------------------------------
+    # BUILD UI
+    # -------------------------------------------------------
+    def build(self):
+        with dpg.group(horizontal=True):
+            dpg.add_checkbox(label="Enable Profiling", tag=self.enable_tag,
+                             default_value=self.profiler.enabled, callback=self.on_toggle_profiling)
+            dpg.add_button(label="Reset", callback=self.on_reset)
+            dpg.add_button(label="Dump to File", callback=self.on_dump)
+            dpg.add_text("", tag=self.status_tag)
+
+        dpg.add_separator()
+        dpg.add_text("Poll rate: ---", tag=self.poll_rate_tag)
+        dpg.add_text("Caches: ---", tag=self.cache_tag)
+
+        with dpg.table(tag=self.table_tag, header_row=True, borders_outerV=True, borders_outerH=True,
+                       borders_innerV=True, borders_innerH=True):
+            for label in self.COLUMNS:
+                dpg.add_table_column(label=label)
+
+            for row in range(self.MAX_STAGES):
+                with dpg.table_row():
+                    for col in range(len(self.COLUMNS)):
+                        dpg.add_text("", tag=self.cell_tag(row, col))
+
+    def cell_tag(self, row, col):
+        return f"{self.TAG}_cell_{row}_{col}"
+
+    # -------------------------------------------------------
+    # UPDATE (render thread)
+    # -------------------------------------------------------
+    def update(self, data: dict):
+        """
+        data = {"stages": Profiler.summary(), "scheduler": FixedRateScheduler.stats(),
+                "caches": {**Formatter.cache_stats(), "plans": PitStrategist.plan_cache.stats()}}
+        """
+        self.last_data = data
+
+        scheduler = data.get("scheduler") or {}
+        if scheduler:
+            dpg.set_value(self.poll_rate_tag,
+                          f"Poll rate: {scheduler['achieved_hz']:.1f} / {scheduler['target_hz']:.0f} Hz   "
+                          f"late: {scheduler['late']}   dropped: {scheduler['dropped']}   "
+                          f"max overrun: {scheduler['max_overrun_ms']:.1f} ms")
+
+        caches = data.get("caches") or {}
+        if caches:
+            dpg.set_value(self.cache_tag, "Caches: " + "   ".join(
+                f"{name} {cache['hit_rate']:.1%} ({cache['size']}/{cache['maxsize']})"
+                for name, cache in caches.items()))
+
+        stages = sorted((data.get("stages") or {}).items())[:self.MAX_STAGES]
+        for row in range(self.MAX_STAGES):
+            if row < len(stages):
+                stage, stats = stages[row]
+                values = [stage, str(stats["samples"])] + [f"{stats[field]:.3f}" for field in self.STAGE_FIELDS[1:]]
+            else:
+                values = [""] * len(self.COLUMNS)
+            for col, value in enumerate(values):
+                dpg.set_value(self.cell_tag(row, col), value)
+
+    # -------------------------------------------------------
+    # ACTIONS
+    # -------------------------------------------------------
+    def on_toggle_profiling(self, sender=None, app_data=None):
+        enabled = bool(dpg.get_value(self.enable_tag))
+        self.profiler.enable(enabled)
+        self.ctx.set("profiling", enabled)
+        dpg.set_value(self.status_tag, "Profiling on." if enabled else "Profiling off.")
+
+    def on_reset(self, sender=None, app_data=None):
+        self.profiler.reset()
+        dpg.set_value(self.status_tag, "Reset.")
+
+    def on_dump(self, sender=None, app_data=None):
+        try:
+            extra = {key: value for key, value in (self.last_data or {}).items() if key != "stages"}
+            path = self.profiler.dump(self.ctx.log_folder, extra=extra)
+            dpg.set_value(self.status_tag, f"Written {path}")
+            self.ctx.logger.info(f"Profiler dump written to {path}")
+        except OSError as error:
+            dpg.set_value(self.status_tag, f"Dump failed: {error}")
+            self.ctx.logger.error(f"Profiler dump failed: {error}")
@@ -11,6 +11,11 @@ from modules.ui.info.weekend_widget import WeekendWidget
 class InfoPanel(BasePanel):
     LABEL = "Information"
 
+    # WeekendInfo comes from the session YAML only; refreshed on each new session info revision
+    TELEMETRY = {
+        "weekend": {},
+    }
+
 
     def __init__(self, ctx):
         super().__init__(ctx)
@@ -27,6 +27,10 @@ class SettingsPanel(BasePanel):
             {"label": "Polling Rate (Hz)", "tag": "polling_rate", "default": 60},
             {"label": "Cache Size", "tag": "cache_size", "default": 5000},
         ],
+        [
+            {"label": "Sync to Sim", "tag": "sync_to_sim", "default": False},
+            {"label": "Record Sessions", "tag": "record_sessions", "default": False},
+        ],
 
         [{"section": "Data Paths"}],
         [
@@ -1,7 +1,14 @@
 # ui/timing_panel.py
 import dearpygui.dearpygui as dpg
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: the table falls back to build_display_columns
+    np = None
+
+from modules.irace_sdk.irsdk_formatter import Formatter
 from modules.ui.base_panel import BasePanel
+from modules.ui.timing.timing_snapshot import TimingSnapshotBuilder
 
 
 class TimingPanel(BasePanel):
@@ -20,18 +27,40 @@ class TimingPanel(BasePanel):
         "CarIdxF2Time": {"label": "F2 Time", "tag": "car_idx_f2_time", "datatype": "time", "default": ""},
         "CarIdxTrackSurface": {"label": "TS", "tag": "car_idx_track_surface", "datatype": "int", "default": ""},
         "CarIdxOnPitRoad": {"label": "Pits", "tag": "car_idx_in_pits", "datatype": "int", "default": ""},
+        "CarIdxPitStops": {"label": "Stops", "tag": "car_idx_pit_stops", "datatype": "int", "default": ""},
+        "CarIdxLastStopLap": {"label": "Last Stop", "tag": "car_idx_last_stop_lap", "datatype": "int", "default": ""},
+        "CarIdxPitLoss": {"label": "Stop Loss", "tag": "car_idx_pit_loss", "datatype": "float", "default": ""},
         "CurDriverIncidentCount": {"label": "Inc", "tag": "driver_incidents", "datatype": "int", "default": ""},
     }
 
+    # Timing arrays every tick while visible; DriverInfo (YAML) on each new session info revision
+    TELEMETRY = {
+        "timing": {
+            "variables": ("CarIdxPosition", "CarIdxClassPosition", "CarIdxLap", "CarIdxLastLapTime",
+                          "CarIdxF2Time", "CarIdxTrackSurface", "CarIdxOnPitRoad"),
+        },
+        "drivers": {},
+    }
+
     # Tags in the Timing Table for quick updating of timing data
     table_tag = None
     timing_table_tags = None
 
+    # Shadow of what the table currently shows, so only changed cells are pushed to dpg
+    rendered_values = None      # dict[(schema_key, row)] = displayed string
+    highlighted_row = None      # row currently bound to the highlight theme
+
+    # NumPy timing pipeline (None when NumPy is not installed)
+    snapshot_builder = None
+
     def __init__(self, ctx):
         super().__init__(ctx)
         self.header_tag = f"{self.TAG}_header"
         self.header_theme_tag = f"{self.header_tag}_theme"
 
+        # Vectorised timing pipeline when NumPy is available; otherwise the per-value path below
+        self.snapshot_builder = TimingSnapshotBuilder(self.TIMING_TABLE_SCHEMA, self.MAX_CARS) if np else None
+
         self.header_theme = self.build_title_header_theme()
         self.table_header_theme = self.build_table_header_theme()
         self.build_table_row_themes()
@@ -77,6 +106,7 @@ class TimingPanel(BasePanel):
 
             # Dictionary to store cell tags for fast updates
             cell_tags = {}
+            self.rendered_values = {}
 
             # Preallocate rows (max cars)
             for row in range(self.MAX_CARS):
@@ -84,7 +114,9 @@ class TimingPanel(BasePanel):
                     for key, col in schema.items():
                         cell_tag = f"{col['tag']}_{row}"
                         dpg.add_text(col["default"], tag=cell_tag)
+                        dpg.bind_item_theme(cell_tag, self.theme_row_normal)
                         cell_tags[(key, row)] = cell_tag
+                        self.rendered_values[(key, row)] = col["default"]
 
         return cell_tags
 
@@ -93,30 +125,72 @@ class TimingPanel(BasePanel):
         if update_data['timing_data'] is None:
             return
 
+        # Car order plus the display strings of every column, in race order (timed apart from the dpg calls)
+        profiler = self.ctx.profiler
+        span = profiler.start()
+        if self.snapshot_builder is not None:
+            sorted_car_indices, columns = self.snapshot_builder.display_columns(
+                update_data['timing_data'], update_data['driver_data'])
+        else:
+            sorted_car_indices, columns = self.build_display_columns(
+                update_data['timing_data'], update_data['driver_data'])
+        profiler.stop("ui.timing.format", span)
+
+        player_idx = update_data["PlayerCarIdx"]
+        rendered = self.rendered_values
+
+        for key, column in columns.items():
+            for row, formatted in enumerate(column):
+                # Only push cells whose text actually changed
+                if rendered[(key, row)] != formatted:
+                    dpg.set_value(self.timing_table_tags[(key, row)], formatted)
+                    rendered[(key, row)] = formatted
+
+        # Blank any rows left over from cars that are no longer classified
+        for row in range(len(sorted_car_indices), self.MAX_CARS):
+            for key, col in self.TIMING_TABLE_SCHEMA.items():
+                if rendered[(key, row)] != col["default"]:
+                    dpg.set_value(self.timing_table_tags[(key, row)], col["default"])
+                    rendered[(key, row)] = col["default"]
+
+        # Highlight rule: re-bind themes only when the player's row moves
+        player_row = sorted_car_indices.index(player_idx) if player_idx in sorted_car_indices else None
+        if player_row != self.highlighted_row:
+            self.bind_row_theme(self.highlighted_row, self.theme_row_normal)
+            self.bind_row_theme(player_row, self.theme_row_highlight)
+            self.highlighted_row = player_row
+
+    def bind_row_theme(self, row, theme):
+        """Bind a theme to every cell of a table row (no-op for row None)."""
+        if row is None:
+            return
+        for key in self.TIMING_TABLE_SCHEMA:
+            dpg.bind_item_theme(self.timing_table_tags[(key, row)], theme)
+
+    def build_display_columns(self, timing_data, driver_data):
+        """
+        Pure Python fallback for TimingSnapshotBuilder.display_columns (used without NumPy).
+        Returns (sorted_car_indices, {schema_key: [display string per row]}).
+        """
         # Create a copy and enrich it with driver info
-        timing_snapshot = update_data['timing_data'].copy()
-        timing_snapshot = self.enrich_timing_with_driver_data(timing_snapshot, update_data['driver_data'])
+        timing_snapshot = timing_data.copy()
+        timing_snapshot = self.enrich_timing_with_driver_data(timing_snapshot, driver_data)
 
         # Determine car order first
         sorted_car_indices = self.sort_car_indices_by_position(timing_snapshot)
-        player_idx = update_data["PlayerCarIdx"]
 
-        for row, car_idx in enumerate(sorted_car_indices):
-            for key, col in self.TIMING_TABLE_SCHEMA.items():
-                values = timing_snapshot.get(key, [])
-                datatype = col.get("datatype")
+        columns = {}
+        for key, col in self.TIMING_TABLE_SCHEMA.items():
+            values = timing_snapshot.get(key, [])
+            datatype = col.get("datatype")
 
+            column = []
+            for car_idx in sorted_car_indices:
                 raw = values[car_idx] if car_idx < len(values) else col["default"]
-                formatted = self.format_timing_value(raw, datatype)
-
-                cell = self.timing_table_tags[(key, row)]
-                dpg.set_value(cell, formatted)
+                column.append(self.format_timing_value(raw, datatype))
+            columns[key] = column
 
-                # Highlight rule
-                if car_idx == player_idx:
-                    dpg.bind_item_theme(cell, self.theme_row_highlight)
-                else:
-                    dpg.bind_item_theme(cell, self.theme_row_normal)
+        return sorted_car_indices, columns
 
     def enrich_timing_with_driver_data(self, timing_data, driver_data):
         """
@@ -189,12 +263,9 @@ class TimingPanel(BasePanel):
             return f"{value:.3f}"
 
         if datatype == "time":
-            # Convert raw seconds → mm:ss.xxx
+            # Convert raw seconds → mm:ss.xxx (memoised on whole milliseconds)
             # Example: 73.123 → "1:13.123"
-            seconds = float(value)
-            minutes = int(seconds // 60)
-            remainder = seconds % 60
-            return f"{minutes}:{remainder:06.3f}"
+            return Formatter.make_lap_time_string(float(value))
 
         # Fallback – return raw
         return str(value)
@@ -0,0 +1,138 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: TimingPanel falls back to its per-value Python path
+    np = None
+
+from modules.irace_sdk.irsdk_formatter import Formatter
+
+
+class TimingSnapshotBuilder:
+    """
+    Vectorised timing table pipeline (requires NumPy).
+
+    Each tick the CarIdx arrays are packed into one structured array (one record per
+    CarIdx), the field is ordered with a single stable argsort on position and every
+    column is formatted for the whole field at once: sentinel (negative) values are
+    masked and lap times are quantised to milliseconds in bulk. Driver columns come
+    from the session YAML, so they are formatted once per driver_data revision.
+
+    display_columns() returns the same strings as TimingPanel.format_timing_value.
+    """
+
+    # Telemetry columns → record dtype (times as f8 so the arithmetic matches the Python path)
+    TELEMETRY_DTYPES = {
+        "CarIdxPosition": "i4",
+        "CarIdxClassPosition": "i4",
+        "CarIdxLap": "i4",
+        "CarIdxLastLapTime": "f8",
+        "CarIdxF2Time": "f8",
+        "CarIdxTrackSurface": "i4",
+        "CarIdxOnPitRoad": "i4",
+        # FieldPitTracker results merged into timing_data
+        "CarIdxPitStops": "i4",
+        "CarIdxLastStopLap": "i4",
+        "CarIdxPitLoss": "f8",
+    }
+
+    # Table columns sourced from DriverInfo → driver dict key
+    DRIVER_FIELDS = {
+        "DriverName": "UserName",
+        "CarNumber": "CarNumber",
+        "License": "LicString",
+        "CurDriverIncidentCount": "CurDriverIncidentCount",
+    }
+
+    def __init__(self, schema: dict, max_cars: int):
+        self.schema = schema
+        self.max_cars = max_cars
+        self.dtype = np.dtype([(key, dtype) for key, dtype in self.TELEMETRY_DTYPES.items()])
+        self.records = np.zeros(max_cars, dtype=self.dtype)
+
+        # Driver columns are cached per driver_data object (replaced, never mutated, on each revision)
+        self._driver_source = None
+        self._driver_columns = {}
+
+    def build(self, timing_data: dict):
+        """Pack the CarIdx arrays into the structured array (missing values become -1)."""
+        records = self.records
+        for key in self.TELEMETRY_DTYPES:
+            values = timing_data.get(key)
+            if values is None:
+                records[key] = -1
+                continue
+            count = min(len(values), self.max_cars)
+            records[key][:count] = values[:count]
+            records[key][count:] = -1
+        return records
+
+    def display_columns(self, timing_data: dict, driver_data: dict):
+        """
+        Return (sorted_car_indices, {schema_key: [display string per row]}) for the
+        classified cars (position > 0) in race order.
+        """
+        records = self.build(timing_data)
+
+        # Stable argsort on position; unclassified cars (0 / invalid) are dropped
+        positions = records["CarIdxPosition"]
+        order = np.argsort(positions, kind="stable")
+        order = order[positions[order] > 0]
+
+        driver_columns = self._get_driver_columns(driver_data)
+
+        columns = {}
+        for key, col in self.schema.items():
+            if key in self.TELEMETRY_DTYPES:
+                columns[key] = self.format_column(records[key][order], col.get("datatype"))
+            elif key in driver_columns:
+                columns[key] = driver_columns[key][order].tolist()
+            else:
+                columns[key] = [col["default"]] * len(order)
+
+        return order.tolist(), columns
+
+    @staticmethod
+    def format_column(values, datatype: str) -> list:
+        """Format a whole column at once; negative (sentinel) values render as ""."""
+        valid = values >= 0
+
+        if datatype == "time":
+            # Quantise the whole column to ms at once; strings come from the shared lap time cache
+            millis = np.rint(values * 1000).astype(np.int64).tolist()
+            lap_time = Formatter.lap_time_string_from_ms
+            return [lap_time(ms) if ok else "" for ok, ms in zip(valid.tolist(), millis)]
+
+        if datatype == "float":
+            return [f"{v:.3f}" if ok else "" for ok, v in zip(valid.tolist(), values.tolist())]
+
+        if datatype == "int":
+            values = values.astype(np.int64)
+
+        return [str(v) if ok else "" for ok, v in zip(valid.tolist(), values.tolist())]
+
+    def _get_driver_columns(self, driver_data: dict) -> dict:
+        if driver_data is self._driver_source:
+            return self._driver_columns
+
+        columns = {}
+        if driver_data:
+            for key, field in self.DRIVER_FIELDS.items():
+                datatype = self.schema.get(key, {}).get("datatype")
+                column = np.full(self.max_cars, "", dtype=object)
+                for car_idx, driver in driver_data.items():
+                    if 0 <= car_idx < self.max_cars:
+                        column[car_idx] = self._format_driver_value(driver.get(field, ""), datatype)
+                columns[key] = column
+
+        self._driver_source = driver_data
+        self._driver_columns = columns
+        return columns
+
+    @staticmethod
+    def _format_driver_value(value, datatype: str) -> str:
+        if value is None or value == "":
+            return ""
+        if isinstance(value, (int, float)) and value < 0:
+            return ""
+        if datatype == "int":
+            return str(int(value))
+        return str(value)
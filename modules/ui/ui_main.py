@@ -1,6 +1,7 @@
 # ui/ui_main.py
 import dearpygui.dearpygui as dpg
 
+from modules.ui.debug.debug_panel import DebugPanel
 from modules.ui.help.help_panel import HelpPanel
 from modules.ui.info.info_panel import InfoPanel
 from modules.ui.settings.settings_panel import SettingsPanel
@@ -36,11 +37,21 @@ class UIMain:
             "timing": TimingPanel(ctx),
             "settings": SettingsPanel(ctx),
             "help": HelpPanel(ctx),
+            "debug": DebugPanel(ctx),
         }
 
         self.dashboard = DashPanel(ctx)
         self.info_panel = InfoPanel(ctx)
 
+        # Every panel hosted in the tab bar keyed by its tab tag, in tab order,
+        # so visibility (and therefore telemetry subscriptions) follows the selected tab.
+        self.tab_panels = {
+            self.crewchief_panel.root_tag: self.crewchief_panel,
+            self.dashboard.root_tag: self.dashboard,
+            self.info_panel.root_tag: self.info_panel,
+            **self.panels,
+        }
+
         # Track which tab is active so update loops know where to route UI updates.
         self.active_tab = None
 
@@ -68,11 +79,16 @@ class UIMain:
                     with dpg.tab(label=panel.LABEL, tag=tag):
                         panel.build()
 
-            # The first panel is activated by default after build.
-            if len(self.panels) > 1:
-                first_tag = next(iter(self.panels.keys()))
+            # The first tab is activated by default after build.
+            if self.tab_panels:
+                first_tag = next(iter(self.tab_panels.keys()))
                 self.active_tab = first_tag
-                self.panels[first_tag].on_show()
+                self.tab_panels[first_tag].on_show()
+
+    def register_telemetry(self, registry):
+        """Let every panel declare the telemetry it consumes with the SDK subscription registry."""
+        for panel in self.tab_panels.values():
+            panel.register_telemetry(registry)
 
     def on_tab_changed(self, sender, app_data):
         """
@@ -90,7 +106,7 @@ class UIMain:
         self.active_tab = tab_alias
 
         # Notify each panel whether it is now visible or hidden.
-        for tag, panel in self.panels.items():
+        for tag, panel in self.tab_panels.items():
             if tag == tab_alias:
                 # self.ctx.logger.debug(f"Tag: {tag}; Panel: {panel.LABEL} - SHOW")
                 panel.on_show()   # Panel becomes eligible for live updates
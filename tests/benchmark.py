@@ -0,0 +1,447 @@
+"""
+Headless benchmark of the SDK polling → render pipeline.
+
+Telemetry (a synthetic race generated per field size, or a recorded .ircap capture)
+is played back as fast as possible through a ReplayIRSDK and every tick is pushed
+through the same stages the app runs:
+
+    get_update   IRSDKService.get_update (freeze, decode, session info, pit crew, ...)
+    pitcrew      the service's own PitCrew, inside get_update (its sdk.pitcrew span)
+    field_pits   the service's own FieldPitTracker, inside get_update (its sdk.field_pits span)
+    timing       TimingPanel.update
+    dashboard    DashPanel.update (session and weather every tick, pit data once a stop completed)
+
+dearpygui is replaced by a call-counting stub, so no window or GPU is needed and
+the UI stages measure our Python work only. Reports per stage latency percentiles,
+allocated bytes per tick (tracemalloc, in a separate pass so it doesn't skew the
+timings) and the achieved tick rate, as JSON:
+
+    python tests/benchmark.py                          # 20, 40 and 64 car fields
+    python tests/benchmark.py --cars 40 --ticks 3600
+    python tests/benchmark.py --capture race.ircap --output bench.json
+"""
+import argparse
+from collections import Counter
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# -------------------------------------------------------
+# dearpygui stub
+# -------------------------------------------------------
+class StubItem:
+    """Whatever a dpg call returns: usable as a tag, a value and a context manager."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class DpgStub(types.ModuleType):
+    """Stand-in for dearpygui.dearpygui that counts calls per function."""
+
+    RETURNS = {"does_item_exist": True, "is_dearpygui_running": False}
+
+    def __init__(self):
+        super().__init__("dearpygui.dearpygui")
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        result = self.RETURNS.get(name, StubItem())
+        calls = self.calls
+
+        def call(*args, **kwargs):
+            calls[name] += 1
+            return result
+
+        setattr(self, name, call)
+        return call
+
+
+dpg_stub = DpgStub()
+sys.modules["dearpygui"] = types.ModuleType("dearpygui")
+sys.modules["dearpygui"].dearpygui = dpg_stub
+sys.modules["dearpygui.dearpygui"] = dpg_stub
+
+from modules.core.app_context import AppContext                             # noqa: E402
+from modules.irace_sdk.irsdk_capture import CaptureWriter                   # noqa: E402
+from modules.irace_sdk.irsdk_replay import ReplayIRSDK                      # noqa: E402
+from modules.irace_sdk.irsdk_service import IRSDKService                    # noqa: E402
+from modules.irace_sdk.irsdk_snapshot import VAR_TYPE_CODES, VAR_TYPE_SIZES  # noqa: E402
+from modules.ui.dashboard.dashboard_panel import DashPanel                  # noqa: E402
+from modules.ui.timing.timing_panel import TimingPanel                      # noqa: E402
+
+
+# -------------------------------------------------------
+# Synthetic race
+# -------------------------------------------------------
+# irsdk var types
+CHAR, BOOL, INT, BITFIELD, FLOAT, DOUBLE = range(6)
+
+MAX_CARS = 64
+TICK_RATE = 60
+LAP_TIME = 90.0
+PLAYER_CAR_IDX = 0
+
+# SessionTime into each lap → (surface, OnPitRoad, PlayerCarPitSvStatus) for the player's pit stop
+PIT_PHASES = (
+    (60.0, 2, False, 0),    # pit entry line
+    (62.0, 2, True, 0),     # pit lane
+    (65.0, 1, True, 1),     # in the box, service in progress
+    (72.0, 1, True, 2),     # service complete
+    (75.0, 2, True, 2),     # leaving the box
+    (78.0, 2, False, 0),    # pit exit
+    (80.0, 3, False, 0),    # back on track
+)
+
+# PitSvFlags tyre bit (LF, RF, LR, RR) → SessionTime into the lap that tyre is done, so the stop is complete
+TYRE_CHANGES = ((0x01, 68.0), (0x02, 69.0), (0x04, 70.0), (0x08, 71.0))
+
+SYNTHETIC_VARS = [
+    ("SessionTick", INT, 1), ("SessionNum", INT, 1), ("SessionState", INT, 1), ("SessionTime", DOUBLE, 1),
+    ("SessionTimeOfDay", FLOAT, 1), ("SessionTimeRemain", DOUBLE, 1), ("SessionLapsTotal", INT, 1),
+    ("SessionLapsRemainEx", INT, 1), ("PlayerCarIdx", INT, 1), ("SessionFlags", BITFIELD, 1),
+    ("CarIdxPosition", INT, MAX_CARS), ("CarIdxClassPosition", INT, MAX_CARS), ("CarIdxLap", INT, MAX_CARS),
+    ("CarIdxLastLapTime", FLOAT, MAX_CARS), ("CarIdxF2Time", FLOAT, MAX_CARS),
+    ("CarIdxTrackSurface", INT, MAX_CARS), ("CarIdxOnPitRoad", BOOL, MAX_CARS),
+    ("CarIdxLapDistPct", FLOAT, MAX_CARS),
+    ("OnPitRoad", BOOL, 1), ("PitstopActive", BOOL, 1), ("PlayerCarPitSvStatus", INT, 1),
+    ("PitSvFlags", BITFIELD, 1), ("FuelLevel", FLOAT, 1), ("PlayerCarTowTime", FLOAT, 1),
+    ("PitRepairLeft", FLOAT, 1), ("PitOptRepairLeft", FLOAT, 1), ("VelocityZ", FLOAT, 1),
+    ("IsReplayPlaying", BOOL, 1),
+    ("AirTemp", FLOAT, 1), ("RelativeHumidity", FLOAT, 1), ("TrackTempCrew", FLOAT, 1), ("AirDensity", FLOAT, 1),
+    ("AirPressure", FLOAT, 1), ("FogLevel", FLOAT, 1), ("Skies", INT, 1), ("Precipitation", FLOAT, 1),
+    ("WindDir", FLOAT, 1), ("WindVel", FLOAT, 1), ("TrackWetness", INT, 1), ("WeatherDeclaredWet", BOOL, 1),
+] + [(f"{tyre}{reading}", FLOAT, 1)
+     for tyre in ("LF", "RF", "LR", "RR")
+     for reading in ("tempCL", "tempCM", "tempCR", "wearL", "wearM", "wearR")]
+
+
+def synthetic_session_info(cars: int) -> dict:
+    drivers = [{
+        "CarIdx": idx, "UserName": f"Driver {idx}", "AbbrevName": f"D{idx}", "Initials": f"D{idx}",
+        "UserID": 1000 + idx, "CarNumber": str(idx + 1), "CarNumberRaw": idx + 1, "CarPath": "car",
+        "CarScreenNameShort": "Car", "CarClassID": 1, "CarID": 1, "IRating": 1500 + idx,
+        "LicString": "A 4.99", "LicColor": "0x0153db", "CurDriverIncidentCount": idx % 5,
+        "TeamName": f"Team {idx}", "TeamID": idx, "CarIsAI": 0, "IsSpectator": 0,
+    } for idx in range(cars)]
+
+    return {
+        "WeekendInfo": {"SessionID": 1, "TrackName": "benchmark", "TrackDisplayName": "Benchmark",
+                        "WeekendOptions": {"NumStarters": cars}},
+        "SessionInfo": {"Sessions": [{"SessionNum": 0, "SessionType": "Race"}]},
+        "DriverInfo": {"DriverCarIdx": PLAYER_CAR_IDX, "Drivers": drivers},
+    }
+
+
+def synthetic_row(tick: int, cars: int) -> dict:
+    """Telemetry of one tick: the field circulates in order, the player (and every 4th car) pits every lap."""
+    session_time = tick / TICK_RATE
+    lap, lap_time = divmod(session_time, LAP_TIME)
+
+    surface, on_pit_road, sv_status = 3, False, 0
+    for start, *phase in PIT_PHASES:
+        if lap_time >= start:
+            surface, on_pit_road, sv_status = phase
+
+    positions = list(range(1, cars + 1)) + [0] * (MAX_CARS - cars)
+    # Shuffle a couple of places every few seconds so the table order changes
+    if int(session_time) % 5 == 0 and cars > 2:
+        swap = int(session_time) % (cars - 1)
+        positions[swap], positions[swap + 1] = positions[swap + 1], positions[swap]
+
+    surfaces = [3] * cars + [-1] * (MAX_CARS - cars)
+    in_pits = [False] * MAX_CARS
+    for idx in [PLAYER_CAR_IDX] + list(range(1, cars, 4)):
+        surfaces[idx] = surface
+        in_pits[idx] = on_pit_road
+
+    row = {
+        "SessionTick": tick, "SessionNum": 0, "SessionState": 4, "SessionTime": session_time,
+        "SessionTimeOfDay": 50000.0 + session_time, "SessionTimeRemain": 7200.0 - session_time,
+        "SessionLapsTotal": 32767, "SessionLapsRemainEx": 32767, "PlayerCarIdx": PLAYER_CAR_IDX,
+        "SessionFlags": 0,
+        "CarIdxPosition": positions,
+        "CarIdxClassPosition": positions,
+        "CarIdxLap": [int(lap)] * cars + [-1] * (MAX_CARS - cars),
+        "CarIdxLastLapTime": [LAP_TIME + idx * 0.1 if lap else -1.0 for idx in range(cars)] + [-1.0] * (MAX_CARS - cars),
+        "CarIdxF2Time": [idx * 1.7 + lap_time * 0.001 for idx in range(cars)] + [-1.0] * (MAX_CARS - cars),
+        "CarIdxTrackSurface": surfaces,
+        "CarIdxOnPitRoad": in_pits,
+        "CarIdxLapDistPct": [lap_time / LAP_TIME] * cars + [-1.0] * (MAX_CARS - cars),
+        "OnPitRoad": on_pit_road, "PitstopActive": sv_status == 1, "PlayerCarPitSvStatus": sv_status,
+        "PitSvFlags": 0x10 | sum(bit for bit, done in TYRE_CHANGES if lap_time < done) if sv_status == 1 else 0,
+        "FuelLevel": 100.0 - (lap_time * 0.5 if sv_status != 1 else 0.0), "PlayerCarTowTime": 0.0,
+        "PitRepairLeft": 0.0, "PitOptRepairLeft": 0.0,
+        "VelocityZ": 0.05 if 66.0 <= lap_time < 71.0 else 0.0, "IsReplayPlaying": False,
+        "AirTemp": 20.0, "RelativeHumidity": 0.5, "TrackTempCrew": 30.0, "AirDensity": 1.2,
+        "AirPressure": 101325.0, "FogLevel": 0.0, "Skies": 0, "Precipitation": 0.0,
+        "WindDir": 1.0, "WindVel": 2.0, "TrackWetness": 1, "WeatherDeclaredWet": False,
+    }
+    for name in IRSDKService.TYRE_VARS:
+        row[name] = 80.0 if "temp" in name else 0.95
+    return row
+
+
+def write_synthetic_capture(path, cars: int, ticks: int, chunk_rows: int = 600):
+    """Generate a synthetic race into an .ircap capture with CaptureWriter."""
+    structs, offset, writer_vars = [], 0, []
+    for name, var_type, count in SYNTHETIC_VARS:
+        writer_vars.append((name, var_type, count, offset))
+        structs.append((name, f"<{count}{VAR_TYPE_CODES[var_type]}", count, offset))
+        offset += VAR_TYPE_SIZES[var_type] * count
+    row_length = offset
+
+    packers = [(name, struct.Struct(fmt), count, offset) for name, fmt, count, offset in structs]
+
+    writer = CaptureWriter(path, writer_vars, chunk_rows, meta={"tick_rate": TICK_RATE, "synthetic": True})
+    writer.write_session_info(1, 0.0, synthetic_session_info(cars))
+
+    rows, first = [], None
+    for tick in range(1, ticks + 1):
+        values = synthetic_row(tick, cars)
+        buffer = bytearray(row_length)
+        for name, packer, count, var_offset in packers:
+            value = values[name]
+            if count == 1:
+                packer.pack_into(buffer, var_offset, value)
+            else:
+                packer.pack_into(buffer, var_offset, *value)
+        rows.append(bytes(buffer))
+        first = first or (tick, values["SessionTime"])
+
+        if len(rows) == chunk_rows or tick == ticks:
+            writer.write_chunk(rows, (first[0], tick), (first[1], values["SessionTime"]))
+            rows, first = [], None
+
+    writer.close()
+
+
+# -------------------------------------------------------
+# Pipeline
+# -------------------------------------------------------
+STAGES = ("get_update", "pitcrew", "field_pits", "timing", "dashboard")
+
+# Stages measured through the service's profiler spans rather than around a call
+SERVICE_SPANS = {"pitcrew": "sdk.pitcrew", "field_pits": "sdk.field_pits"}
+
+
+class TimeMeter:
+    """
+    Wall time of a stage (seconds). Also stands in for the service's profiler, so the
+    sdk.* spans inside get_update are measured on the service's own instances.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.spans = {}
+
+    def start(self):
+        return time.perf_counter()
+
+    def end(self, start) -> float:
+        return time.perf_counter() - start
+
+    def stop(self, stage: str, start):
+        self.spans[stage] = self.spans.get(stage, 0) + self.end(start)
+
+
+class AllocationMeter(TimeMeter):
+    """
+    Bytes allocated by a stage: the tracemalloc peak during it, minus the memory in use
+    when it started. Spans nest (sdk.* inside get_update), so each inner reset of the
+    peak is folded into the spans still open first.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.open = []      # [memory in use at start, peak seen so far] per open span
+
+    def fold_peak(self):
+        current, peak = tracemalloc.get_traced_memory()
+        for span in self.open:
+            span[1] = max(span[1], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def start(self):
+        current = self.fold_peak()
+        self.open.append([current, current])
+        return len(self.open)
+
+    def end(self, start) -> int:
+        self.fold_peak()
+        current, peak = self.open.pop()
+        return peak - current
+
+
+class Pipeline:
+    """One IRSDKService plus the panels, driven from a capture as fast as possible."""
+
+    def __init__(self, ctx, capture):
+        self.ctx = ctx
+        self.service = IRSDKService(ctx, ir=ReplayIRSDK(str(capture), speed=ReplayIRSDK.AS_FAST_AS_POSSIBLE))
+
+        self.timing_panel = TimingPanel(ctx)
+        self.timing_panel.build()
+        self.dash_panel = DashPanel(ctx)
+        self.dash_panel.build()
+
+        # Both panels visible, as when the user flips between them
+        for panel in (self.timing_panel, self.dash_panel):
+            panel.register_telemetry(self.service.subscriptions)
+            panel.on_show()
+
+    def tick(self, meter):
+        """Run every stage once; returns the per stage measurement from the meter."""
+        service = self.service
+        service.profiler = meter
+        meter.spans.clear()
+        results = {}
+
+        start = meter.start()
+        service.get_update()
+        results["get_update"] = meter.end(start)
+
+        for stage, span in SERVICE_SPANS.items():
+            if span in meter.spans:
+                results[stage] = meter.spans[span]
+
+        if service.timing_data is not None:
+            payload = {
+                "timing_data": service.timing_data,
+                "driver_data": service.driver_data,
+                "PlayerCarIdx": service.get_player_car_idx(),
+            }
+            start = meter.start()
+            self.timing_panel.update(payload)
+            results["timing"] = meter.end(start)
+
+        if service.session_data is not None and service.weather_data is not None:
+            payload = {
+                "session_data": service.session_data,
+                "weather_data": service.weather_data,
+            }
+            # Only a completed stop has a pit report to show
+            if service.pit_data is not None:
+                payload["pit_data"] = service.pit_data
+            start = meter.start()
+            self.dash_panel.update(payload)
+            results["dashboard"] = meter.end(start)
+
+        return results
+
+    def run(self, meter, ticks=None):
+        """Play the capture (or the first `ticks` ticks) and collect per stage samples."""
+        samples = {stage: [] for stage in STAGES}
+        count = 0
+        while ticks is None or count < ticks:
+            for stage, value in self.tick(meter).items():
+                samples[stage].append(value)
+            count += 1
+            if not self.service.ir.is_connected:
+                break
+        return samples, count
+
+
+def percentiles(values, scale=1.0) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * scale
+
+    return {
+        "samples": len(ordered),
+        "mean": statistics.fmean(ordered) * scale,
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": ordered[-1] * scale,
+    }
+
+
+def benchmark(ctx, capture, ticks=None, label=None) -> dict:
+    # Timing pass
+    dpg_stub.calls.clear()
+    pipeline = Pipeline(ctx, capture)
+    wall = time.perf_counter()
+    latencies, played = pipeline.run(TimeMeter(), ticks)
+    wall = time.perf_counter() - wall
+    dpg_calls = dict(dpg_stub.calls)
+
+    # Allocation pass (tracemalloc slows everything down, so it runs on its own)
+    pipeline = Pipeline(ctx, capture)
+    tracemalloc.start()
+    allocations, _ = pipeline.run(AllocationMeter(), played)
+    tracemalloc.stop()
+
+    return {
+        "label": label or str(capture),
+        "ticks": played,
+        "wall_seconds": wall,
+        "achieved_hz": played / wall if wall else 0.0,
+        "latency_ms": {stage: percentiles(values, 1000.0) for stage, values in latencies.items() if values},
+        "allocated_bytes_per_tick": {stage: percentiles(values) for stage, values in allocations.items() if values},
+        "dpg_calls_per_tick": {name: count / played for name, count in sorted(dpg_calls.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cars", type=int, nargs="+", default=[20, 40, 64], help="synthetic field sizes")
+    parser.add_argument("--ticks", type=int, default=TICK_RATE * 120, help="ticks per run (default 2 minutes)")
+    parser.add_argument("--capture", help="benchmark a recorded .ircap capture instead of synthetic fields")
+    parser.add_argument("--output", help="write the JSON report here as well as to stdout")
+    args = parser.parse_args()
+
+    ctx = AppContext.instance(str(ROOT))
+    ctx.logger.setLevel(logging.WARNING)
+    ctx.settings["record_sessions"] = False
+    ctx.font_manager.load()
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": [],
+    }
+
+    if args.capture:
+        report["runs"].append(benchmark(ctx, args.capture, label=Path(args.capture).name))
+    else:
+        with tempfile.TemporaryDirectory() as folder:
+            for cars in args.cars:
+                capture = os.path.join(folder, f"synthetic_{cars}.ircap")
+                write_synthetic_capture(capture, cars, args.ticks)
+                run = benchmark(ctx, capture, label=f"synthetic {cars} cars")
+                run["cars"] = cars
+                report["runs"].append(run)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
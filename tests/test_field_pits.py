@@ -0,0 +1,58 @@
+"""
+FieldPitTracker tests.
+
+    python -m pytest tests
+"""
+from pathlib import Path
+import sys
+
+import pytest
+
+pytest.importorskip("numpy", reason="FieldPitTracker requires NumPy")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules.irace_sdk.irsdk_field_pits import FieldPitTracker   # noqa: E402
+
+ON_TRACK, IN_PIT_BOX, ON_PIT_LANE, NOT_IN_WORLD = 3, 1, 2, -1
+
+
+def run(surfaces):
+    """Drive car 0 through the given CarIdxTrackSurface values, one tick each."""
+    tracker = FieldPitTracker(max_cars=1)
+    for tick, surface in enumerate(surfaces):
+        tracker.update({
+            "SessionTime": tick * 1.0,
+            "CarIdxOnPitRoad": [surface in (IN_PIT_BOX, ON_PIT_LANE)],
+            "CarIdxTrackSurface": [surface],
+            "CarIdxLap": [3],
+            "CarIdxLapDistPct": [0.1 * tick % 1.0],
+            "CarIdxLastLapTime": [90.0],
+        })
+    return tracker
+
+
+def test_pit_stop_counts():
+    tracker = run([ON_TRACK, ON_PIT_LANE, IN_PIT_BOX, IN_PIT_BOX, ON_PIT_LANE, ON_TRACK])
+    assert tracker.stops[0] == 1
+    assert tracker.drive_throughs[0] == 0
+    assert tracker.stop_loss[0] >= 0
+
+
+def test_drive_through_is_not_a_stop():
+    tracker = run([ON_TRACK, ON_PIT_LANE, ON_PIT_LANE, ON_TRACK])
+    assert tracker.stops[0] == 0
+    assert tracker.drive_throughs[0] == 1
+
+
+@pytest.mark.parametrize("surfaces", [
+    [ON_TRACK, NOT_IN_WORLD, IN_PIT_BOX, ON_PIT_LANE, ON_TRACK],    # reset to the pits
+    [NOT_IN_WORLD, IN_PIT_BOX, IN_PIT_BOX, ON_PIT_LANE, ON_TRACK],  # spawned in the box
+    [IN_PIT_BOX, ON_PIT_LANE, ON_TRACK],                            # in the box when tracking started
+])
+def test_spawning_in_the_pit_box_is_not_a_stop(surfaces):
+    tracker = run(surfaces)
+    assert tracker.stops[0] == 0
+    assert tracker.drive_throughs[0] == 0
+    assert tracker.last_stop_lap[0] == -1
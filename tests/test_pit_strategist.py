@@ -0,0 +1,100 @@
+"""
+PitStrategist regression tests.
+
+    python -m pytest tests
+"""
+from pathlib import Path
+import random
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules.core.app_context import AppContext            # noqa: E402
+from modules.helpers.pit_strategist import PitStrategist    # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def strategist():
+    return PitStrategist(AppContext.instance(str(ROOT)))
+
+
+# -------------------------------------------------------
+# Equal stint plan
+# -------------------------------------------------------
+@pytest.mark.parametrize("total_laps, stint_laps", [
+    (20, [10, 10]),             # 2 stints: nothing to take laps from
+    (30, [6, 12, 12]),          # 3 stints: both final stints hide the tyre change
+    (40, [6, 10, 12, 12]),      # 4 stints
+])
+def test_equal_stint_plan_final_stints_hide_tyre_change(strategist, total_laps, stint_laps):
+    plan = strategist._calculate_equal_stint_plan(total_laps, tank_capacity=40.0, fuel_per_lap=3.5,
+                                                  tyre_change_litres=42.0)
+    assert plan["stint_laps"] == stint_laps
+    assert sum(plan["stint_laps"]) == total_laps
+
+
+# -------------------------------------------------------
+# Optimiser
+# -------------------------------------------------------
+def brute_force_plans(total_laps, max_laps, first_laps, shortest, lap_time, fuel_per_lap, pit_lane_loss,
+                      refuelling_rate, tyre_change_litres, degradation, change_tyres):
+    """{stops: fastest race time} over every split of the race into legal stints."""
+    def stint_time(n):
+        return n * lap_time + degradation * n * (n - 1) / 2
+
+    def stop_time(n):
+        fuelled = max(n * fuel_per_lap, tyre_change_litres if change_tyres else 0.0)
+        return pit_lane_loss + fuelled / refuelling_rate
+
+    best = {}
+
+    def split(remaining, stops, elapsed):
+        if remaining == 0:
+            best[stops] = min(best.get(stops, float("inf")), elapsed)
+            return
+        for n in range(1, min(max_laps, remaining) + 1):
+            split(remaining - n, stops + 1, elapsed + stop_time(n) + stint_time(n))
+
+    for first in range(shortest, min(first_laps, total_laps) + 1):
+        split(total_laps - first, 0, stint_time(first))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_optimiser_matches_brute_force(strategist, seed):
+    rng = random.Random(seed)
+    race = dict(
+        total_laps=rng.randint(1, 14),
+        tank_capacity=rng.choice([20.0, 30.0, 45.0]),
+        fuel_per_lap=rng.choice([2.5, 3.5, 4.2]),
+        lap_time=rng.uniform(60.0, 120.0),
+        pit_lane_loss=rng.uniform(10.0, 60.0),
+        refuelling_rate=rng.uniform(1.0, 4.0),
+        tyre_change_litres=rng.uniform(0.0, 40.0),
+        degradation=rng.choice([0.0, rng.uniform(0.0, 0.5)]),
+        change_tyres=rng.random() < 0.5,
+    )
+    first_stint_fuel = rng.choice([None, rng.uniform(0.0, race["tank_capacity"])])
+
+    plans = strategist._optimise_stint_plans(**race, stop_counts=race["total_laps"] + 1,
+                                             max_extra_stops=race["total_laps"], first_stint_fuel=first_stint_fuel)
+
+    max_laps = min(strategist.max_stint_laps(race["tank_capacity"], race["fuel_per_lap"]), race["total_laps"])
+    if first_stint_fuel is None:
+        first_laps, shortest = max_laps, 1
+    else:
+        first_laps, shortest = min(int(first_stint_fuel // race["fuel_per_lap"]), max_laps), 0
+    expected = brute_force_plans(
+        race["total_laps"], max_laps, first_laps, shortest, race["lap_time"], race["fuel_per_lap"],
+        race["pit_lane_loss"], race["refuelling_rate"], race["tyre_change_litres"], race["degradation"],
+        race["change_tyres"])
+
+    assert {plan["stops"]: plan["total_time"] for plan in plans} == pytest.approx(
+        {stops: round(time, 3) for stops, time in expected.items()}, abs=1e-3)
+    for plan in plans:
+        assert sum(plan["stint_laps"]) == race["total_laps"]
+        assert all(laps <= max_laps for laps in plan["stint_laps"])
+    assert [plan["total_time"] for plan in plans] == sorted(plan["total_time"] for plan in plans)
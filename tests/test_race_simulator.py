@@ -0,0 +1,33 @@
+"""
+RaceSimulator tests.
+
+    python -m pytest tests
+"""
+from pathlib import Path
+import sys
+
+import pytest
+
+pytest.importorskip("numpy", reason="RaceSimulator requires NumPy")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules.helpers.race_simulator import RaceModel, simulate_plan   # noqa: E402
+
+# No randomness: every lap uses exactly fuel_per_lap and no caution ever starts
+MODEL = RaceModel(total_laps=40, tank_capacity=80.0, fuel_per_lap=3.5, lap_time=90.0, pit_lane_loss=30.0,
+                  refuelling_rate=2.5, tyre_change_litres=40.0, fuel_sd=0.0, lap_time_sd=0.0, service_sd=0.0,
+                  caution_probability=0.0)
+
+
+@pytest.mark.parametrize("stint_laps", [[20, 20], [20, 20, 0], [20, 0, 20], [0, 20, 20]])
+def test_zero_lap_stints_use_no_fuel(stint_laps):
+    finish, fuel_out = simulate_plan(MODEL, stint_laps, runs=8, seed=1)
+    assert not fuel_out.any()
+    assert finish.shape == (8,)
+
+
+def test_stint_over_its_fuel_is_a_fuel_out():
+    finish, fuel_out = simulate_plan(MODEL, [23, 17], runs=8, seed=1)    # 23 laps need 80.5 l
+    assert fuel_out.all()
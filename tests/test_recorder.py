@@ -0,0 +1,66 @@
+"""
+SessionRecorder tests.
+
+    python -m pytest tests
+"""
+from pathlib import Path
+import struct
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules.core.app_context import AppContext             # noqa: E402
+from modules.irace_sdk.irsdk_capture import CaptureWriter   # noqa: E402
+from modules.irace_sdk.irsdk_recorder import SessionRecorder  # noqa: E402
+from modules.irace_sdk.irsdk_replay import ReplayIRSDK      # noqa: E402
+
+INT, DOUBLE = 2, 5
+TICKS = 50
+
+
+@pytest.fixture
+def replay(tmp_path):
+    """A ReplayIRSDK over a 50 tick capture of SessionTick and SessionTime."""
+    path = tmp_path / "source.ircap"
+    writer = CaptureWriter(path, [("SessionTick", INT, 1, 0), ("SessionTime", DOUBLE, 1, 4)], TICKS,
+                           meta={"tick_rate": 60})
+    rows = [struct.pack("<id", tick, tick / 60) for tick in range(1, TICKS + 1)]
+    writer.write_chunk(rows, (1, TICKS), (1 / 60, TICKS / 60))
+    writer.close()
+
+    ir = ReplayIRSDK(str(path), speed=ReplayIRSDK.AS_FAST_AS_POSSIBLE)
+    assert ir.startup()
+    return ir
+
+
+def test_failed_writer_ends_the_capture(replay, tmp_path, monkeypatch):
+    def broken_write_chunk(self, rows, ticks, times):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(CaptureWriter, "write_chunk", broken_write_chunk)
+
+    recorder = SessionRecorder(AppContext.instance(str(ROOT)))
+    monkeypatch.setattr(recorder, "CHUNK_ROWS", 5)
+    assert recorder.start(replay, {"SessionTick", "SessionTime"}, tmp_path / "captures", session_num=0)
+    thread = recorder._threads[-1]
+
+    def tick():
+        replay.freeze_var_buffer_latest()
+        recorder.record_tick(replay, replay["SessionTick"], replay["SessionTime"])
+
+    # The first full chunk kills the writer
+    for _ in range(recorder.CHUNK_ROWS):
+        tick()
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
+
+    # The next tick notices and ends the capture instead of queueing for a dead writer
+    tick()
+    assert recorder.failed
+    assert not recorder.active
+    queued = recorder._queue.qsize()
+    recorder.record_marker(1, 1, 0, 0.0, "Lap 1")
+    assert recorder._queue.qsize() == queued
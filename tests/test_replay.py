@@ -0,0 +1,73 @@
+"""
+ReplayIRSDK playback tests.
+
+    python -m pytest tests
+"""
+from pathlib import Path
+import struct
+import sys
+import time
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules.irace_sdk.irsdk_capture import CaptureWriter   # noqa: E402
+from modules.irace_sdk.irsdk_replay import ReplayIRSDK      # noqa: E402
+
+INT, DOUBLE = 2, 5
+TICK_RATE = 60
+TICKS = 20
+
+
+@pytest.fixture
+def capture(tmp_path):
+    """A 20 tick capture of SessionTick and SessionTime, in two chunks."""
+    path = tmp_path / "short.ircap"
+    writer = CaptureWriter(path, [("SessionTick", INT, 1, 0), ("SessionTime", DOUBLE, 1, 4)], 12,
+                           meta={"tick_rate": TICK_RATE})
+    rows = [struct.pack("<id", tick, tick / TICK_RATE) for tick in range(1, TICKS + 1)]
+    for first in range(0, TICKS, 12):
+        chunk = rows[first:first + 12]
+        last = first + len(chunk)
+        writer.write_chunk(chunk, (first + 1, last), ((first + 1) / TICK_RATE, last / TICK_RATE))
+    writer.close()
+    return path
+
+
+def play(replay, until, timeout=2.0):
+    """Freeze ticks until until(ticks seen) is true; returns the SessionTicks served."""
+    ticks = []
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        replay.freeze_var_buffer_latest()
+        ticks.append(replay["SessionTick"])
+        if until(ticks):
+            break
+        time.sleep(0.001)
+    return ticks
+
+
+@pytest.mark.parametrize("speed", [ReplayIRSDK.AS_FAST_AS_POSSIBLE, 10.0])
+def test_replay_disconnects_at_end_of_capture(capture, speed):
+    replay = ReplayIRSDK(str(capture), speed=speed)
+    assert replay.startup()
+
+    ticks = play(replay, lambda ticks: not replay.is_connected)
+
+    assert replay.finished
+    assert not replay.is_connected
+    assert ticks[-1] == TICKS
+
+
+@pytest.mark.parametrize("speed", [ReplayIRSDK.AS_FAST_AS_POSSIBLE, 10.0])
+def test_replay_loop_wraps_at_end_of_capture(capture, speed):
+    replay = ReplayIRSDK(str(capture), speed=speed, loop=True)
+    assert replay.startup()
+
+    ticks = play(replay, lambda ticks: TICKS in ticks and ticks[-1] < TICKS)
+
+    assert TICKS in ticks
+    assert ticks[-1] == 1
+    assert replay.is_connected